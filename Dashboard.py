@@ -1,58 +1,766 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from datetime import datetime
-import plotly.graph_objects as go
+from sbintelligence.perf import RunTrace
 
+# Medição das etapas desta execução (painel "Performance" e logs JSON), a partir dos imports
+run_trace = RunTrace()
 
-# Configuração do Streamlit
+# Configuração do Streamlit: o título é desenhado antes dos imports pesados (pandas e os módulos
+# do dashboard), que só custam na primeira execução de cada processo
 st.set_page_config(page_title='Dashboard de Apostas', layout='wide')
 st.title('🎲 SBIntelligence - Dashboard Profit')
 
-# Função para converter strings numéricas para float
-def convert_to_float(value):
-    if pd.isna(value):
-        return None
-    if isinstance(value, str):
-        value = value.replace('R$', '').replace(' ', '').replace(',', '.')
-    try:
-        return float(value)
-    except (ValueError, TypeError):
+import pandas as pd  # noqa: E402
+from datetime import datetime  # noqa: E402
+from functools import partial  # noqa: E402
+from sbintelligence import config  # noqa: E402
+from sbintelligence.calibration import CONFIDENCE, calibration_table  # noqa: E402
+from sbintelligence.cache import TTLCache  # noqa: E402
+from sbintelligence.compact import compact_ledger, frame_bytes, memory_report  # noqa: E402
+from sbintelligence.cube import build_cube  # noqa: E402
+from sbintelligence.details import (  # noqa: E402
+    PAGE_SIZES, RESULT_STYLES, filter_details, format_details, page_count, paginate, sort_details,
+    style_details
+)
+from sbintelligence.export import available_formats, export_bytes, export_file  # noqa: E402
+from sbintelligence.figures import (  # noqa: E402
+    balance_figure, breakdown_figure, calibration_figure, calibration_profit_figure, daily_frames,
+    drawdown_figure, ledger_market_figure, long_range_figure, long_range_frames, market_figure,
+    projection_figure, risk_frames, rolling_figure
+)
+from sbintelligence.ingest import read_ledger_csv  # noqa: E402
+from sbintelligence.ledger import (  # noqa: E402
+    concat_tabs, content_hash, day_slice, ledger_version, period_profit, prepare_tab, sort_by_day,
+    source_columns, stamp_version
+)
+from sbintelligence.live import LivePoller  # noqa: E402
+from sbintelligence.periods import (  # noqa: E402
+    RANGE_PRESETS, preset_range, range_anchor, tabs_in_range
+)
+from sbintelligence.registry import (  # noqa: E402
+    LedgerSpec, load_ledger_tabs, load_registry, tag_ledger
+)
+from sbintelligence.risk import ROLLING_WINDOWS, risk_summary  # noqa: E402
+from sbintelligence.simulation import (  # noqa: E402
+    SIMULATION_METHODS, bet_distribution, default_bankroll, distribution_key, monte_carlo, process_pool
+)
+from sbintelligence.perf import PerfHistory, configure_logging, optional_span  # noqa: E402
+from sbintelligence.sheets import build_csv_url, load_tabs, sheet_id_from_url  # noqa: E402
+from sbintelligence.snapshot import SnapshotStore, is_closed_month, month_close  # noqa: E402
+from sbintelligence.sync import DeltaSync  # noqa: E402
+from sbintelligence.taxonomy import breakdown_dimensions, grouped_breakdown  # noqa: E402
+from sbintelligence.transport import SheetTransport  # noqa: E402
+from sbintelligence.warmup import Warmup  # noqa: E402
+
+# Copy-on-Write: recortes e seleções do ledger compartilhado não copiam os dados
+# (comportamento padrão a partir do pandas 3). Opção global do processo, de propósito: as sessões
+# e as threads de fundo usam o mesmo ledger, e um option_context (não é por thread) trocaria o
+# modo das outras sessões no meio da execução
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+run_trace.lap('imports')
+
+# Snapshots em disco das abas (compartilhados entre sessões e reinícios)
+@st.cache_resource
+def get_snapshot_store():
+    if not config.SNAPSHOT_DIR or not SnapshotStore.available():
         return None
+    return SnapshotStore(config.SNAPSHOT_DIR, memory_map=config.SNAPSHOT_MMAP)
+
+# Ledger canônico compartilhado entre as sessões: tipos compactos (categorias e float32),
+# ordenado pelo dia (recortes de datas por busca binária) e com versão para as chaves de cache
+def canonical_ledger(df, label):
+    return stamp_version(sort_by_day(compact_ledger(df)), label)
+
+# Conexões HTTP compartilhadas (pool, timeouts, novas tentativas, revalidação e última cópia válida)
+@st.cache_resource
+def get_transport():
+    return SheetTransport(
+        connect_timeout=config.HTTP_CONNECT_TIMEOUT, read_timeout=config.HTTP_READ_TIMEOUT,
+        retries=config.HTTP_RETRIES, backoff=config.HTTP_BACKOFF,
+        pool_size=config.FETCH_WORKERS + 2, max_bytes=config.HTTP_CACHE_BYTES
+    )
+
+# Sincronização incremental compartilhada (busca só as linhas novas do fim da aba). O transporte é
+# obtido aqui, na thread do script: a thread do modo ao vivo usa o objeto já criado
+@st.cache_resource
+def get_delta_sync(sheet_url):
+    transport = get_transport()
+    sheet_id = sheet_id_from_url(sheet_url)
+    
+    def fetch_raw(sheet_name, offset):
+        query = f"select * offset {offset}" if offset else None
+        csv_url = build_csv_url(sheet_url, sheet_name, query=query, headers=1)
+        return read_ledger_csv(transport.open(csv_url, key=(sheet_id, sheet_name)))
+    
+    return DeltaSync(fetch_raw, full_reload_interval=config.DELTA_FULL_RELOAD)
 
-# Função para carregar dados do Google Sheets
-def load_google_sheets(sheet_url, sheet_name=None):
-    sheet_id = sheet_url.split("/d/")[1].split("/")[0]
+# Modo ao vivo: uma thread por aba consulta as apostas novas e mantém os indicadores acumulados.
+# A thread recebe o cache e a sincronização já criados (sem chamar funções @st.cache_resource,
+# que dependem do contexto de execução do script)
+@st.cache_resource(show_spinner=False)
+def get_live_poller(sheet_url, sheet_name):
+    sheet_cache = get_sheet_cache()
+    cache_key = (sheet_id_from_url(sheet_url), sheet_name)
     
-    # Se um nome de aba específico for fornecido, usamos ele para construir a URL
-    if sheet_name:
-        csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
+    # Cada atualização substitui a aba no cache compartilhado (gráficos e tabela da próxima execução)
+    def on_update(df):
+        sheet_cache.set(cache_key, canonical_ledger(df, sheet_name))
+    
+    poller = LivePoller(
+        get_delta_sync(sheet_url), sheet_name, interval=config.LIVE_INTERVAL,
+        on_update=on_update, idle_timeout=config.LIVE_IDLE_TIMEOUT
+    )
+    poller.poll()
+    return poller.start()
+
+# Função para obter os recursos compartilhados usados nas buscas de uma planilha (snapshots,
+# transporte HTTP e sincronização incremental). Chamada na thread do script: as buscas em threads
+# de fundo recebem os objetos já criados, sem chamar funções @st.cache_resource
+def sheet_resources(sheet_url):
+    return get_snapshot_store(), get_transport(), get_delta_sync(sheet_url)
+
+# Função para buscar e converter os dados de uma aba do Google Sheets
+def fetch_google_sheets(sheet_url, sheet_name=None, trace=None, resources=None):
+    sheet_id = sheet_id_from_url(sheet_url)
+    store, transport, delta_sync = resources or sheet_resources(sheet_url)
+    
+    # Meses já encerrados são servidos do snapshot local, sem acessar a rede
+    month_start = tab_months.get(sheet_name)
+    closed = month_start is not None and is_closed_month(month_start)
+    if store is not None and closed:
+        with optional_span(trace, f'snapshot {sheet_name}') as span:
+            snapshot = store.load(sheet_id, sheet_name, fetched_after=month_close(month_start))
+            span['rows'] = len(snapshot[0]) if snapshot is not None else None
+        if snapshot is not None:
+            return canonical_ledger(snapshot[0], sheet_name)
+    
+    if config.DELTA_SYNC and not closed:
+        # Mês atual: apenas as apostas novas são baixadas e convertidas
+        with optional_span(trace, f'delta sync {sheet_name}') as span:
+            df = delta_sync.sync(sheet_name)
+            span['rows'] = len(df)
     else:
-        csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv"
+        # Leitura com esquema de tipos, conversão vetorizada (ano obtido do nome da aba),
+        # lucro/prejuízo de cada aposta e variação do saldo, calculados uma vez por carga
+        csv_url = build_csv_url(sheet_url, sheet_name)
+        with optional_span(trace, f'fetch {sheet_name}') as span:
+            raw = read_ledger_csv(transport.open(csv_url, key=(sheet_id, sheet_name)))
+            span['rows'] = len(raw)
+        with optional_span(trace, f'parse {sheet_name}') as span:
+            df = prepare_tab(raw, sheet_name)
+            span['rows'] = len(df)
+    
+    # Ledger canônico (tipos compactos, ordenado pelo dia), compartilhado entre as sessões
+    df = canonical_ledger(df, sheet_name)
+    
+    if store is not None:
+        # Sem snapshot quando a planilha não respondeu e a última cópia válida foi servida
+        stale_since = transport.stale_since((sheet_id, sheet_name))
+        if stale_since is None and config.DELTA_SYNC and not closed:
+            stale_since = delta_sync.stale_since(sheet_name)
+        store.save_fetched(sheet_id, sheet_name, df, stale_since)
+    return df
+
+# Tabela de detalhes preparada uma vez por recorte do ledger e compartilhada (somente leitura)
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_details_table(slice_key, _df):
+    return format_details(_df)
+
+# Cache dos arquivos exportados, compartilhado entre sessões
+@st.cache_resource
+def get_export_cache():
+    return TTLCache(ttl=config.CACHE_TTL, max_bytes=config.EXPORT_CACHE_BYTES)
+
+# Função para gerar (ou reaproveitar) o arquivo de exportação dos dados filtrados, apenas com as
+# colunas da planilha (sem as colunas calculadas pelo dashboard). Executada no clique, fora da thread
+# do script: recebe o cache já obtido (sem chamar funções @st.cache_resource)
+def get_export(cache, df, export_format):
+    df = source_columns(df)
+    return cache.get_or_load(
+        (content_hash(df), export_format), lambda: export_bytes(df, export_format)
+    )
+
+# Histórico de desempenho compartilhado (p50/p95 das últimas execuções)
+@st.cache_resource
+def get_perf_history():
+    configure_logging(config.PERF_LOG)
+    return PerfHistory(maxlen=config.PERF_HISTORY)
+
+# Cache compartilhado entre todas as sessões (uma busca por aba a cada TTL)
+@st.cache_resource
+def get_sheet_cache():
+    return TTLCache(ttl=config.CACHE_TTL, max_bytes=config.CACHE_MAX_BYTES)
+
+# Aquecimento do processo (uma vez): módulos pesados importados e a aba do mês padrão buscada e
+# convertida em segundo plano, direto para o cache compartilhado (a thread recebe o cache e os
+# recursos da planilha já criados)
+@st.cache_resource(show_spinner=False)
+def get_warmup(sheet_url, sheet_name):
+    cache_key = (sheet_id_from_url(sheet_url), sheet_name)
+    sheet_cache = get_sheet_cache()
+    resources = sheet_resources(sheet_url)
+    
+    def load_default():
+        return sheet_cache.get_or_load(
+            cache_key, lambda: fetch_google_sheets(sheet_url, sheet_name, resources=resources)
+        )
+    
+    return Warmup([(f'load {sheet_name}', load_default)]).start()
+
+# Função para carregar dados do Google Sheets (passando pelo cache)
+def load_google_sheets(sheet_url, sheet_name=None, trace=None):
+    cache_key = (sheet_id_from_url(sheet_url), sheet_name)
     
     try:
-        df = pd.read_csv(csv_url)
-        
-        # Converter colunas numéricas
-        numeric_columns = ['Balance', 'Odds', 'Stake']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = df[col].apply(convert_to_float)
-        
-        # Converter a coluna Day para datetime
-        if 'Day' in df.columns:
-            try:
-                df['Day'] = pd.to_datetime(df['Day'], format='%d/%m', errors='coerce')
-                df['Day'] = df['Day'].apply(lambda x: x.replace(year=2025) if pd.notnull(x) else x)
-                df = df.dropna(subset=['Day'])
-            except Exception as e:
-                st.warning(f"Aviso: Erro ao converter datas: {e}")
-        
-        return df
+        return get_sheet_cache().get_or_load(
+            cache_key, lambda: fetch_google_sheets(sheet_url, sheet_name, trace)
+        )
     except Exception as e:
         st.error(f"Erro ao carregar a planilha: {e}")
         return None
 
+# Função para carregar várias abas em paralelo e juntar em um único ledger
+def load_google_sheets_tabs(sheet_url, sheet_names, trace=None):
+    sheet_id = sheet_id_from_url(sheet_url)
+    cache = get_sheet_cache()
+    resources = sheet_resources(sheet_url)
+    
+    frames, errors = load_tabs(
+        lambda name: cache.get_or_load(
+            (sheet_id, name), lambda: fetch_google_sheets(sheet_url, name, trace, resources)
+        ),
+        sheet_names
+    )
+    
+    # Abas com erro são ignoradas e avisadas, sem derrubar a página
+    for name, error in errors.items():
+        st.warning(f"Aviso: não foi possível carregar a aba {name}: {error}")
+    
+    # O ledger combinado também fica no cache compartilhado (uma cópia para todas as sessões),
+    # identificado pelas abas carregadas; recarregar qualquer aba gera uma nova combinação
+    loaded = [frames[name] for name in sheet_names if name in frames]
+    if len(loaded) <= 1:
+        return concat_tabs(loaded)
+    concat_key = (sheet_id, tuple(ledger_version(frame) for frame in loaded))
+    return cache.get_or_load(
+        concat_key, lambda: canonical_ledger(concat_tabs(loaded), 'concat')
+    )
+
+# Função para carregar as abas de vários ledgers ao mesmo tempo (asyncio) e juntar em um único
+# ledger marcado pela origem; o tempo total fica próximo da aba mais lenta
+def load_ledgers(ledgers, months, trace=None):
+    cache = get_sheet_cache()
+    labels = [spec.label for spec in ledgers]
+    jobs = [(spec, name) for spec in ledgers for name in spec.tabs_for(months)]
+    resources = {spec.sheet_url: sheet_resources(spec.sheet_url) for spec in ledgers}
+    
+    frames, errors = load_ledger_tabs(
+        lambda spec, name: cache.get_or_load(
+            (spec.sheet_id, name),
+            lambda: fetch_google_sheets(spec.sheet_url, name, trace, resources[spec.sheet_url])
+        ),
+        jobs
+    )
+    
+    # Abas com erro são ignoradas e avisadas, sem derrubar a página
+    for (label, name), error in errors.items():
+        st.warning(f"Aviso: não foi possível carregar a aba {name} de {label}: {error}")
+    
+    # O ledger combinado também fica no cache compartilhado, identificado pelas abas de cada ledger
+    loaded = [(spec.label, frames[spec.label, name]) for spec, name in jobs if (spec.label, name) in frames]
+    if not loaded:
+        return None
+    concat_key = ('ledgers', tuple((label, ledger_version(frame)) for label, frame in loaded))
+    return cache.get_or_load(
+        concat_key,
+        lambda: canonical_ledger(
+            concat_tabs([tag_ledger(frame, label, labels) for label, frame in loaded]), 'ledgers'
+        )
+    )
+
+# Indicadores, séries e gráficos memoizados pelo recorte do ledger (chave) e pelas opções do gráfico
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_kpis(slice_key, _cube):
+    return _cube.kpis()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_balance_figure(slice_key, multiple_months, calendar, _cube):
+    df_complete, df_balance_line, month_title = daily_frames(_cube.daily(), *calendar)
+    return balance_figure(df_complete, df_balance_line, month_title, multiple_months)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_long_range_figure(slice_key, resolution, zoom, _df):
+    line, bars, bar_label = long_range_frames(
+        _df, start=pd.Timestamp(zoom[0]), end=pd.Timestamp(zoom[1]),
+        resolution=resolution, max_points=config.CHART_MAX_POINTS
+    )
+    title = f"{zoom[0]:%d/%m/%Y} – {zoom[1]:%d/%m/%Y}"
+    return long_range_figure(line, bars, bar_label, title)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_market_breakdown(slice_key, _cube):
+    # Calcular profit, stake e ROI por mercado (soma das células do cubo), ordenado pelo valor absoluto
+    return _cube.market_breakdown().sort_values('Profit', key=abs, ascending=True)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_market_figure(slice_key, chart_type, _df_profits):
+    return market_figure(_df_profits, chart_type)
+
+# Cubo de agregados de cada versão do ledger, compartilhado entre sessões
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_cube(ledger_key, _df):
+    return build_cube(_df)
+
+# Comparação entre ledgers: indicadores e profit por mercado de cada um
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_ledger_kpis(slice_key, _cube):
+    return {label: ledger_cube.kpis() for label, ledger_cube in _cube.by_ledger().items()}
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_ledger_market_breakdown(slice_key, _cube):
+    return pd.concat([
+        ledger_cube.market_breakdown().assign(Ledger=label)
+        for label, ledger_cube in _cube.by_ledger().items()
+    ], ignore_index=True)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_ledger_market_figure(slice_key, _df_profits):
+    return ledger_market_figure(_df_profits)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_breakdown(slice_key, dimension, _df):
+    grouped = grouped_breakdown(_df, dimension)
+    return grouped, breakdown_figure(grouped, dimension)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_calibration(slice_key, confidence, _df):
+    table = calibration_table(_df, confidence=confidence)
+    return table, calibration_figure(table), calibration_profit_figure(table)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_risk_summary(slice_key, _df):
+    return risk_summary(_df)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_risk_figures(slice_key, window, _df):
+    underwater, rolling = risk_frames(_df, window, max_points=config.CHART_MAX_POINTS)
+    return drawdown_figure(underwater), rolling_figure(rolling, window)
+
+# Pool de processos das simulações, compartilhado entre sessões (None = no próprio processo)
+@st.cache_resource
+def get_process_pool():
+    return process_pool(config.SIM_WORKERS)
+
+# Distribuição de entrada da projeção (P/L, odds e stake) e sua chave, uma vez por recorte
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_bet_distribution(slice_key, _df):
+    distribution = bet_distribution(_df)
+    return distribution_key(distribution), distribution
+
+# Simulações memoizadas pela distribuição de entrada (recortes com as mesmas apostas reaproveitam)
+@st.cache_data(max_entries=16, show_spinner="Simulating...")
+def get_projection(dist_key, n_paths, n_bets, bankroll, method, _distribution):
+    return monte_carlo(
+        _distribution, n_paths=n_paths, n_bets=n_bets, bankroll=bankroll, method=method,
+        executor=get_process_pool()
+    )
+
+# Cada seção da página é um fragmento: interações dentro dela reexecutam apenas a própria seção
+
+# Função para exibir os indicadores do período (Profit, ROI, Win Rate e Avg Odds)
+def show_kpis(period_kpis, period_label):
+    # Layout principal com quatro colunas
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # 💰 Saldo Total
+    with col1:
+        if period_kpis['profit'] is not None:
+            st.metric(label=f"💰 {period_label} Profit", value=f"R$ {period_kpis['profit']:.2f}")
+        else:
+            st.metric(label=f"💰 {period_label} Profit", value="N/A")
+    
+    # 📊 ROI
+    with col2:
+        if period_kpis['roi'] is not None:
+            st.metric(
+                label=f"📊 {period_label} ROI", 
+                value=f"{period_kpis['roi']:.1f}%"
+            )
+        else:
+            st.metric(label=f"📊 {period_label} ROI", value="N/A")
+    
+    # 📈 Taxa de Acerto
+    with col3:
+        if period_kpis['win_rate'] is not None:
+            st.metric(
+                label=f"📈 {period_label} Win Rate",
+                value=f"{period_kpis['win_rate']:.1f}%",
+            )
+        else:
+            st.metric(label=f"📈 {period_label} Win Rate", value="N/A")
+    
+    # 🎯 Odds Média
+    with col4:
+        if period_kpis['avg_odds'] is not None:
+            st.metric(label=f"🎯 {period_label} Avg Odds", value=f"{period_kpis['avg_odds']:.2f}")
+        else:
+            st.metric(label=f"🎯 {period_label} Avg Odds", value="N/A")
+
+# 💰 Indicadores do período
+@st.fragment
+def render_kpis(slice_key, cube, period_label):
+    show_kpis(get_kpis(slice_key, cube), period_label)
+
+# 📒 Indicadores de cada ledger, abaixo dos indicadores do conjunto
+@st.fragment
+def render_ledger_kpis(slice_key, cube, period_label):
+    for label, period_kpis in get_ledger_kpis(slice_key, cube).items():
+        st.caption(f"📒 {label} · {period_kpis['bets']} bets")
+        show_kpis(period_kpis, period_label)
+
+# 🔴 Indicadores ao vivo: lidos dos acumulados da thread a cada intervalo, sem recalcular o mês;
+# quando chegam apostas novas, a página inteira é reexecutada para atualizar gráficos e tabela
+@st.fragment(run_every=config.LIVE_INTERVAL)
+def render_live_kpis(poller, rendered_version, period_label):
+    poller.touch()
+    live_state = poller.snapshot()
+    if live_state['version'] != rendered_version:
+        st.rerun()
+    
+    show_kpis(live_state['kpis'], period_label)
+    
+    live_caption = "🔴 Live"
+    if live_state['updated_at'] is not None:
+        live_caption += f" · updated {live_state['updated_at']:%H:%M:%S}"
+    if live_state['new_rows']:
+        live_caption += f" · +{live_state['new_rows']} new"
+    if live_state['error'] is not None:
+        live_caption += f" · ⚠️ {live_state['error']}"
+    st.caption(live_caption)
+
+# 📈 Evolução do Saldo, com a projeção por Monte Carlo ao lado
+@st.fragment
+def render_balance_chart(slice_key, df_filtered, cube, multiple_months, calendar=(None, None)):
+    col_chart, col_fan = st.columns([3, 2])
+    with col_fan:
+        render_projection(slice_key, df_filtered)
+    
+    with col_chart:
+        render_balance_line(slice_key, df_filtered, cube, multiple_months, calendar)
+
+# Função para exibir o gráfico de saldo (diário ou, em períodos longos, reduzido com zoom)
+def render_balance_line(slice_key, df_filtered, cube, multiple_months, calendar):
+    first_day, last_day = df_filtered['Day'].min(), df_filtered['Day'].max()
+    
+    if (last_day - first_day).days < config.CHART_LONG_RANGE_DAYS:
+        fig_balance = get_balance_figure(slice_key, multiple_months, calendar, cube)
+    else:
+        # Períodos longos: WebGL, linha reduzida por LTTB e zoom que recalcula o detalhe do intervalo
+        col_resolution, col_zoom = st.columns([1, 3])
+        with col_resolution:
+            resolution = st.radio("Resolution:", ["Daily", "Per bet"], horizontal=True)
+        with col_zoom:
+            zoom = st.slider(
+                "Zoom:",
+                min_value=first_day.date(),
+                max_value=last_day.date(),
+                value=(first_day.date(), last_day.date()),
+                format="DD/MM/YYYY"
+            )
+        fig_balance = get_long_range_figure(slice_key, resolution, zoom, df_filtered)
+    
+    # Show the chart
+    st.plotly_chart(fig_balance, use_container_width=True)
+
+# 🎲 Profit por mercado (trocar o tipo de gráfico reconstrói apenas o gráfico de mercado)
+@st.fragment
+def render_market_breakdown(slice_key, df_profits):
+    if 'Ledger' in df_profits.columns:
+        # Comparação entre ledgers: barras agrupadas por ledger
+        fig = get_ledger_market_figure(slice_key, df_profits)
+    else:
+        # Criar seletor para escolher o tipo de visualização
+        chart_type = st.radio(" ", 
+                             ["Bar Chart", "Pie Chart"],
+                             horizontal=True)
+        
+        # Mostrar o gráfico selecionado
+        fig = get_market_figure(slice_key, chart_type, df_profits)
+    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    
+    # Inserir CSS global para controlar espaçamentos
+    st.markdown("""
+        <style>
+            /* Remove espaço extra após o gráfico */
+            [data-testid="stMetric"] {
+                margin-bottom: 1rem;
+            }
+
+            /* Controla espaço do título */
+            div.stMarkdown h4 {
+                margin-top: -3rem !important;
+                padding-top: 0 !important;
+                margin-bottom: 0.5rem !important;
+            }
+
+            /* Controla espaço da tabela */
+            div[data-testid="stDataFrame"] {
+                margin-top: -2rem !important;
+                padding-top: 0 !important;
+            }
+
+            /* Remove padding extra dos containers */
+            .element-container {
+                padding-top: 0 !important;
+                margin-top: 0 !important;
+            }
+        </style>
+    """, unsafe_allow_html=True)
+
+    # Inserir um espaço invisível para ajudar no posicionamento
+    st.markdown('<div style="margin-top: -3rem;"></div>', unsafe_allow_html=True)
+
+    # Adicionar CSS para centralizar colunas
+    st.markdown("""
+        <style>
+        div[data-testid="stDataFrame"] td {
+            text-align: center !important;
+        }
+        div[data-testid="stDataFrame"] th {
+            text-align: center !important;
+        }
+        </style>
+    """, unsafe_allow_html=True)
+
+
+    st.markdown("""
+        <h4 style='text-align: center; color: white;'>Detailed Profit by Market</h4>
+    """, unsafe_allow_html=True)
+
+    # Formatar os valores da tabela
+    df_table = df_profits.drop(columns=['Stake']).copy()
+
+    # Formatar os valores
+    df_table['Profit'] = df_table['Profit'].apply(lambda x: f"{float(x):,.2f}")
+    df_table['ROI'] = df_table['ROI'].apply(lambda x: f"{x:.2f}%")
+
+    # Criar uma função de estilo para centralizar todas as colunas
+    def style_df(df):
+        return df.style.set_properties(**{
+            'text-align': 'center',
+            'font-size': '1rem',
+            'padding': '0.5rem'
+        }).set_table_styles([
+            {'selector': 'th', 'props': [('text-align', 'center')]},
+            {'selector': 'td', 'props': [('text-align', 'center')]}
+        ])
+
+    # Aplicar o estilo e mostrar a tabela
+    table_index = ['Ledger', 'Market'] if 'Ledger' in df_table.columns else 'Market'
+    styled_df = style_df(df_table.set_index(table_index))
+
+    st.dataframe(
+        styled_df,
+        use_container_width=True,
+        hide_index=False
+    )
+
+# 📋 Tabela de Detalhamento de Apostas (filtros e páginas reexecutam apenas a tabela)
+@st.fragment
+def render_details(slice_key, df):
+    # Selecionar colunas da B à M e ordenar (mais recentes primeiro), uma vez por recorte
+    df_detailed = get_details_table(slice_key, df)
+    
+    # Filtros, ordenação e paginação feitos no servidor: o navegador recebe só a página visível
+    col_results, col_search, col_sort, col_order, col_size = st.columns([3, 3, 2, 1, 1])
+    with col_results:
+        result_filter = st.multiselect(
+            "Results:",
+            [result for result in RESULT_STYLES if result in set(df_detailed['Results'].dropna())]
+        )
+    with col_search:
+        search_text = st.text_input("Search:", placeholder="League, match, market, tipster...")
+    with col_sort:
+        sort_column = st.selectbox("Sort by:", ["Most recent"] + list(df_detailed.columns))
+    with col_order:
+        sort_ascending = st.selectbox("Order:", ["Desc", "Asc"]) == "Asc"
+    with col_size:
+        page_size = st.selectbox("Rows:", PAGE_SIZES, index=1)
+    
+    df_view = filter_details(df_detailed, results=result_filter, search=search_text)
+    if sort_column != "Most recent":
+        df_view = sort_details(df_view, sort_column, ascending=sort_ascending)
+    elif sort_ascending:
+        df_view = df_view.iloc[::-1]
+    
+    n_pages = page_count(len(df_view), page_size)
+    page = st.number_input("Page:", min_value=1, max_value=n_pages, value=1, step=1)
+    df_page = paginate(df_view, page, page_size)
+    first_row = (page - 1) * page_size
+    st.caption(f"Showing {first_row + 1 if len(df_page) else 0}–{first_row + len(df_page)} "
+               f"of {len(df_view)} bets · page {page} of {n_pages}")
+    
+    # Mostrar a tabela com o novo espaçamento (cores calculadas apenas para a página)
+    st.dataframe(
+        style_details(df_page),
+        column_config={
+            'Day': st.column_config.DateColumn('Day', format='DD/MM'),
+            'Odds': st.column_config.NumberColumn('Odds', format='%.3f'),
+            'Stake': st.column_config.NumberColumn('Stake', format='%.2f'),
+            'Balance': st.column_config.NumberColumn('Balance', format='%.2f'),
+        },
+        use_container_width=True
+    )
+
+# 🧭 Profit, ROI e taxa de acerto por qualquer agrupamento (taxonomia dos mercados ou colunas da planilha)
+@st.fragment
+def render_breakdown(slice_key, df_filtered):
+    dimension = st.selectbox("Group by:", breakdown_dimensions(df_filtered))
+    grouped, fig = get_breakdown(slice_key, dimension, df_filtered)
+    
+    col_chart, col_table = st.columns([1, 1])
+    with col_chart:
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    with col_table:
+        st.dataframe(
+            grouped,
+            column_config={
+                'Profit': st.column_config.NumberColumn('Profit', format='%.2f'),
+                'Stake': st.column_config.NumberColumn('Stake', format='%.2f'),
+                'ROI': st.column_config.NumberColumn('ROI', format='%.2f%%'),
+                'Win Rate': st.column_config.NumberColumn('Win Rate', format='%.1f%%'),
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+# 🎯 Probabilidade implícita (1/Odds) × taxa de acerto por faixa de odds, com intervalos por bootstrap
+@st.fragment
+def render_calibration(slice_key, df_filtered):
+    confidence = st.select_slider("Confidence:", options=[80, 90, 95, 99], value=CONFIDENCE,
+                                  format_func=lambda value: f'{value}%')
+    table, fig_rate, fig_profit = get_calibration(slice_key, confidence, df_filtered)
+    if table.empty:
+        st.info("No settled bets with odds in this period to calibrate.")
+        return
+    
+    col_rate, col_profit = st.columns([1, 1])
+    with col_rate:
+        st.plotly_chart(fig_rate, use_container_width=True, config={'displayModeBar': False})
+    with col_profit:
+        st.plotly_chart(fig_profit, use_container_width=True, config={'displayModeBar': False})
+    st.dataframe(
+        table,
+        column_config={
+            'Avg Odds': st.column_config.NumberColumn('Avg Odds', format='%.2f'),
+            'Implied %': st.column_config.NumberColumn('Implied', format='%.1f%%'),
+            'Win Rate %': st.column_config.NumberColumn('Win Rate', format='%.1f%%'),
+            'Win Rate Low': st.column_config.NumberColumn('Win Rate Low', format='%.1f%%'),
+            'Win Rate High': st.column_config.NumberColumn('Win Rate High', format='%.1f%%'),
+            'Edge (pp)': st.column_config.NumberColumn('Edge (pp)', format='%+.1f'),
+            'Expected Wins': st.column_config.NumberColumn('Expected Wins', format='%.1f'),
+            'Wins': st.column_config.NumberColumn('Wins', format='%.1f'),
+            'Profit': st.column_config.NumberColumn('Profit', format='%.2f'),
+            'Profit Low': st.column_config.NumberColumn('Profit Low', format='%.2f'),
+            'Profit High': st.column_config.NumberColumn('Profit High', format='%.2f'),
+            'ROI': st.column_config.NumberColumn('ROI', format='%.2f%%'),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+# 🔮 Projeção do saldo por Monte Carlo (gráfico em leque a partir do saldo atual)
+@st.fragment
+def render_projection(slice_key, df_filtered):
+    dist_key, distribution = get_bet_distribution(slice_key, df_filtered)
+    if len(distribution['PnL']) == 0:
+        st.info("No settled bets in this period to project from.")
+        return
+    
+    # Parâmetros da simulação recolhidos, para o leque ocupar a altura do gráfico de saldo
+    with st.expander("🔮 Projection settings"):
+        method = st.radio("Method:", SIMULATION_METHODS, horizontal=True)
+        n_paths = st.select_slider("Paths:", options=[1_000, 5_000, 10_000, 20_000, 50_000], value=10_000)
+        n_bets = st.select_slider("Bets ahead:", options=[100, 250, 500, 1_000, 2_000], value=500)
+        bankroll = st.number_input(
+            "Bankroll (R$):", min_value=0.0, value=default_bankroll(distribution), step=100.0
+        )
+    
+    try:
+        projection = get_projection(dist_key, n_paths, n_bets, bankroll or None, method, distribution)
+    except ValueError as e:
+        st.warning(f"Não foi possível simular: {e}")
+        return
+    
+    start_balance = float(period_profit(df_filtered)) if 'Balance_Delta' in df_filtered.columns else 0.0
+    st.plotly_chart(
+        projection_figure(projection['bands'], start_balance), use_container_width=True
+    )
+    
+    # Probabilidade de ruína: perder o bankroll inteiro em algum ponto do caminho
+    col1, col2 = st.columns(2)
+    with col1:
+        if projection['ruin_probability'] is not None:
+            st.metric(label="☠️ Risk of Ruin", value=f"{projection['ruin_probability']:.1f}%")
+        else:
+            st.metric(label="☠️ Risk of Ruin", value="N/A")
+        st.metric(label="📈 Chance of Profit", value=f"{projection['profit_probability']:.1f}%")
+    with col2:
+        if projection['expected_roi'] is not None:
+            st.metric(label="📊 Expected ROI", value=f"{projection['expected_roi']:.1f}%")
+        else:
+            st.metric(label="📊 Expected ROI", value="N/A")
+        st.metric(label="💰 Expected Profit", value=f"R$ {projection['expected_profit']:.2f}")
+
+# 📉 Risco do período (drawdown, sequências, profit factor, yield e ROI móvel)
+@st.fragment
+def render_risk(slice_key, df_filtered):
+    risk = get_risk_summary(slice_key, df_filtered)
+    
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+    with col1:
+        st.metric(label="📉 Max Drawdown", value=f"R$ {-risk['max_drawdown']:.2f}")
+    with col2:
+        duration = f"{risk['duration_bets']} bets · {risk['duration_days']}d"
+        st.metric(label="⏳ Drawdown Duration", value=duration,
+                  delta=None if risk['recovered'] else "ongoing", delta_color="off")
+    with col3:
+        st.metric(label="🔥 Longest Win Streak", value=risk['longest_win'])
+    with col4:
+        st.metric(label="🧊 Longest Losing Streak", value=risk['longest_loss'])
+    with col5:
+        if risk['profit_factor'] is not None:
+            st.metric(label="⚖️ Profit Factor", value=f"{risk['profit_factor']:.2f}")
+        else:
+            st.metric(label="⚖️ Profit Factor", value="N/A")
+    with col6:
+        if risk['yield'] is not None:
+            st.metric(label="💹 Yield", value=f"{risk['yield']:.1f}%")
+        else:
+            st.metric(label="💹 Yield", value="N/A")
+    
+    # Janela do ROI/yield móvel (apenas os gráficos de risco são refeitos)
+    window = st.selectbox("Rolling window (bets):", ROLLING_WINDOWS, index=1)
+    fig_drawdown, fig_rolling = get_risk_figures(slice_key, window, df_filtered)
+    col_drawdown, col_rolling = st.columns(2)
+    with col_drawdown:
+        st.plotly_chart(fig_drawdown, use_container_width=True, config={'displayModeBar': False})
+    with col_rolling:
+        st.plotly_chart(fig_rolling, use_container_width=True, config={'displayModeBar': False})
+
+# 📥 Download dos dados filtrados
+@st.fragment
+def render_export(df_filtered):
+    export_format = st.selectbox("Export format:", available_formats())
+    export_name, export_mime = export_file(export_format)
+    st.download_button(
+        label="📥 Download dos dados",
+        data=partial(get_export, get_export_cache(), df_filtered, export_format),
+        file_name=export_name,
+        mime=export_mime,
+        on_click="ignore"
+    )
+
 # URL da planilha do Google Sheets
 google_sheets_url = "https://docs.google.com/spreadsheets/d/1fe_WjUo_8F68a0nOUZQjFCPbP0k7C2EkgkM-tjCFwD0/edit"
 
@@ -64,25 +772,188 @@ sheet_mapping = {
     "May/2025": "May2025"      # Adicionando a nova aba de Abril/2025
 }
 
-# Lista dos meses disponíveis para o seletor
-available_months = list(sheet_mapping.keys())
-available_months.sort()  # Ordena os meses
+# Ledgers acompanhados (bankrolls/tipsters, cada um em sua planilha com o mesmo layout):
+# registro em ledgers.json; sem o arquivo, apenas a planilha acima
+default_ledger = LedgerSpec("Main", google_sheets_url, sheet_mapping)
+try:
+    ledgers = load_registry(config.LEDGERS_FILE, default=[default_ledger]) or [default_ledger]
+except (OSError, ValueError) as e:
+    st.error(f"Erro no registro de ledgers ({config.LEDGERS_FILE}): {e}")
+    ledgers = [default_ledger]
 
 # Sidebar com filtros
 st.sidebar.header("📊 Filters")
 
-# Criar selectbox com o mês mais recente pré-selecionado
-selected_month = st.sidebar.selectbox(
-    "Select month:",
-    options=available_months,
-    index=len(available_months)-1  # Seleciona o último item da lista
+# Ledgers exibidos (todos por padrão); com mais de um, a página mostra o conjunto e a comparação
+selected_ledgers = ledgers
+compare_ledgers = False
+if len(ledgers) > 1:
+    ledger_labels = [spec.label for spec in ledgers]
+    picked_labels = st.sidebar.multiselect("Ledgers:", options=ledger_labels, default=ledger_labels)
+    selected_ledgers = [spec for spec in ledgers if spec.label in picked_labels] or ledgers
+    if len(selected_ledgers) > 1:
+        compare_ledgers = st.sidebar.toggle("Compare ledgers", value=True)
+multiple_ledgers = len(selected_ledgers) > 1
+
+# Planilha e abas de cada mês; com vários ledgers, os meses de qualquer um deles
+google_sheets_url = selected_ledgers[0].sheet_url
+sheet_mapping = {}
+for spec in selected_ledgers:
+    for month, tab in spec.sheet_mapping.items():
+        sheet_mapping.setdefault(month, tab)
+
+# Início do mês de cada aba (para saber quais meses já foram encerrados)
+tab_months = {}
+for spec in selected_ledgers:
+    tab_months.update(spec.tab_months)
+
+# Aquecimento (SBI_WARMUP=1): na primeira execução do processo, o mês padrão do primeiro ledger
+# é buscado enquanto os filtros são desenhados (a carga abaixo aguarda a mesma busca)
+warmup = None
+if config.WARMUP:
+    default_month = max(ledgers[0].sheet_mapping, key=lambda month: datetime.strptime(month, '%B/%Y'))
+    warmup = get_warmup(ledgers[0].sheet_url, ledgers[0].sheet_mapping[default_month])
+
+# Lista dos meses disponíveis para o seletor
+available_months = list(sheet_mapping.keys())
+available_months.sort(key=lambda month: datetime.strptime(month, '%B/%Y'))  # Ordena os meses
+
+# Modo de visualização: um mês, todos os meses, um intervalo de meses ou um intervalo de datas
+view_mode = st.sidebar.radio(
+    "View:",
+    options=["Single month", "All months", "Custom range", "Date range"]
 )
 
-# Obter o nome da aba correspondente ao mês selecionado
-sheet_name = sheet_mapping.get(selected_month)
+if view_mode == "All months":
+    selected_months = available_months
+elif view_mode == "Date range":
+    # Intervalo de datas livre (pode cruzar abas): carregamos só as abas dos meses envolvidos
+    month_starts = list(tab_months.values())
+    first_available = pd.Timestamp(min(month_starts))
+    last_available = pd.Timestamp(max(month_starts)) + pd.offsets.MonthEnd(0)
+    range_preset = st.sidebar.selectbox("Range:", options=[*RANGE_PRESETS, "Custom dates"])
+    
+    if range_preset == "Custom dates":
+        picked_dates = st.sidebar.date_input(
+            "Dates:",
+            value=(last_available.replace(day=1).date(), last_available.date()),
+            min_value=first_available.date(),
+            max_value=last_available.date(),
+            format="DD/MM/YYYY"
+        )
+        # Enquanto o usuário escolhe, o seletor devolve apenas a data inicial
+        range_start, range_end = pd.Timestamp(picked_dates[0]), pd.Timestamp(picked_dates[-1])
+    else:
+        # Referência dos intervalos prontos: hoje, ou a última aposta quando hoje está fora das abas
+        last_bet_day = None
+        if not first_available <= pd.Timestamp('today') <= last_available:
+            latest_month = available_months[-1]
+            latest_ledger = next(spec for spec in selected_ledgers if latest_month in spec.sheet_mapping)
+            df_latest = load_google_sheets(
+                latest_ledger.sheet_url, latest_ledger.sheet_mapping[latest_month]
+            )
+            if df_latest is not None:
+                last_bet_day = df_latest['Day'].max()
+        range_start, range_end = preset_range(
+            range_preset, range_anchor(month_starts, last_bet_day=last_bet_day)
+        )
+    
+    range_tabs = tabs_in_range(tab_months, range_start, range_end)
+    selected_months = [month for month in available_months if sheet_mapping[month] in range_tabs]
+    st.sidebar.caption(f"{range_start:%d/%m/%Y} – {range_end:%d/%m/%Y}")
+elif view_mode == "Custom range" and len(available_months) > 1:
+    first_month, last_month = st.sidebar.select_slider(
+        "Select months:",
+        options=available_months,
+        value=(available_months[0], available_months[-1])
+    )
+    selected_months = available_months[
+        available_months.index(first_month):available_months.index(last_month) + 1
+    ]
+else:
+    # Criar selectbox com o mês mais recente pré-selecionado
+    selected_month = st.sidebar.selectbox(
+        "Select month:",
+        options=available_months,
+        index=len(available_months)-1  # Seleciona o último item da lista
+    )
+    selected_months = [selected_month]
+
+# Obter os nomes das abas correspondentes aos meses selecionados
+sheet_names = [sheet_mapping.get(month) for month in selected_months]
+ledger_tabs = [(spec, name) for spec in selected_ledgers for name in spec.tabs_for(selected_months)]
+
+# Modo ao vivo: disponível apenas para um único mês (inteiro) ainda em andamento, de um único ledger
+live_poller = None
+if (view_mode != "Date range" and len(sheet_names) == 1 and not multiple_ledgers
+        and not is_closed_month(tab_months[sheet_names[0]])):
+    if st.sidebar.toggle("🔴 Live", help="Check the sheet for new bets in the background and update the page"):
+        try:
+            live_poller = get_live_poller(google_sheets_url, sheet_names[0])
+            live_poller.touch()
+            live_state = live_poller.snapshot()  # Lido antes da carga: a aba no cache é no mínimo tão recente
+        except Exception as e:
+            st.sidebar.warning(f"Modo ao vivo indisponível: {e}")
+
+# Botão para forçar uma nova busca das abas selecionadas; meses encerrados voltam do snapshot
+# (sem acessar a rede) e apenas os snapshots de meses em andamento são apagados
+sheet_cache = get_sheet_cache()
+snapshot_store = get_snapshot_store()
+if st.sidebar.button("🔄 Refresh now", use_container_width=True):
+    for spec, name in ledger_tabs:
+        sheet_cache.invalidate((spec.sheet_id, name))
+        month_start = spec.tab_months.get(name)
+        if month_start is None or not is_closed_month(month_start):
+            get_delta_sync(spec.sheet_url).forget(name)
+            if snapshot_store is not None:
+                snapshot_store.delete(spec.sheet_id, name)
+
+# Ação administrativa (SBI_ADMIN=1): apagar todos os snapshots, inclusive de meses encerrados
+if config.ADMIN and st.sidebar.button("🗑️ Purge snapshots", use_container_width=True):
+    sheet_cache.invalidate()
+    for spec in selected_ledgers:
+        get_delta_sync(spec.sheet_url).forget()
+    if snapshot_store is not None:
+        snapshot_store.clear()
+
+# Página e filtros desenhados (primeiro desenho); o conteúdo é preenchido à medida que fica pronto
+run_trace.lap('setup')
+
+# Carregar os dados das abas selecionadas (em paralelo quando houver mais de uma)
+with st.spinner(f"Loading {', '.join(selected_months)}…"):
+    if multiple_ledgers:
+        df = load_ledgers(selected_ledgers, selected_months, trace=run_trace)
+    elif len(sheet_names) == 1:
+        df = load_google_sheets(google_sheets_url, sheet_names[0], trace=run_trace)
+    else:
+        df = load_google_sheets_tabs(google_sheets_url, sheet_names, trace=run_trace)
+run_trace.lap('load', rows=len(df) if df is not None else 0)
+
+# Estatísticas do cache (idade da aba mais antiga em uso)
+cache_stats = sheet_cache.stats()
+cache_ages = [sheet_cache.age((spec.sheet_id, name)) for spec, name in ledger_tabs]
+cache_ages = [age for age in cache_ages if age is not None]
+cache_age = max(cache_ages) if cache_ages else None
+cache_caption = f"Cache: {cache_stats['hits']} hits · {cache_stats['misses']} misses"
+if cache_age is not None:
+    cache_caption += f" · age {cache_age:.0f}s"
+transport_stats = get_transport().stats()
+if transport_stats['requests']:
+    cache_caption += f" · HTTP {transport_stats['requests']} ({transport_stats['not_modified']} not modified)"
+st.sidebar.caption(cache_caption)
 
-# Carregar os dados da aba selecionada
-df = load_google_sheets(google_sheets_url, sheet_name)
+# Abas servidas pela última cópia válida porque a planilha não respondeu (por aba: inclui as
+# buscas da sincronização incremental, feitas em outras URLs)
+for spec, name in ledger_tabs:
+    stale_since = get_transport().stale_since((spec.sheet_id, name))
+    if stale_since is None and config.DELTA_SYNC:
+        stale_since = get_delta_sync(spec.sheet_url).stale_since(name)
+    if stale_since is not None:
+        tab_label = f"{name} de {spec.label}" if multiple_ledgers else name
+        st.warning(
+            f"Planilha indisponível: a aba {tab_label} mostra a última cópia válida "
+            f"({datetime.fromtimestamp(stale_since):%d/%m %H:%M})."
+        )
 
 if df is not None:
     st.markdown(
@@ -97,447 +968,90 @@ if df is not None:
         unsafe_allow_html=True
     )
 
-    # Converter o mês selecionado para datetime para filtrar os dados
-    selected_date = pd.to_datetime(selected_month, format='%B/%Y')
+    # Período exibido: intervalo de datas escolhido ou os meses selecionados inteiros
+    if view_mode == "Date range":
+        period_start, period_end = range_start, range_end
+        calendar = (period_start, period_end)
+    else:
+        period_start = pd.to_datetime(selected_months[0], format='%B/%Y')
+        period_end = pd.to_datetime(selected_months[-1], format='%B/%Y') + pd.offsets.MonthEnd(0)
+        calendar = (None, None)
     
-    # Filtrar o dataframe para mostrar apenas dados do mês selecionado
-    df_filtered = df[
-        (df['Day'].dt.month == selected_date.month) & 
-        (df['Day'].dt.year == selected_date.year)
-    ]
+    # Recorte do período por busca binária no ledger ordenado pelo dia
+    # (sem cópia quando o período cobre o ledger inteiro)
+    df_filtered = day_slice(df, period_start, period_end)
+    
+    # Rótulo dos indicadores (mês único ou período com vários meses / intervalo de datas)
+    multiple_months = (period_start.year, period_start.month) != (period_end.year, period_end.month)
+    period_label = "Period" if multiple_months or view_mode == "Date range" else "Monthly"
+    
+    # Comparação apenas quando o período tem apostas de mais de um ledger
+    compare_ledgers = (compare_ledgers and 'Ledger' in df_filtered.columns
+                       and df_filtered['Ledger'].nunique() > 1)
+    run_trace.lap('filter', rows=len(df_filtered))
         
-    # Layout principal com quatro colunas
-    col1, col2, col3, col4 = st.columns(4)
+    # Chaves de memoização: conteúdo do ledger carregado e recorte do período exibido
+    ledger_key = ledger_version(df) or content_hash(df)
+    slice_key = f"{ledger_key}:{period_start:%Y-%m-%d}:{period_end:%Y-%m-%d}"
     
-    # 💰 Saldo Total
-    with col1:
-       if 'Balance' in df_filtered.columns and not df_filtered['Balance'].isna().all():
-           last_balance = df_filtered['Balance'].dropna().iloc[-1]  # Último valor do Balance
-           st.metric(label="💰 Monthly Profit", value=f"R$ {last_balance:.2f}")
-       else:
-           st.metric(label="💰 Monthly Profit", value="N/A")
-   
-   # 📊 ROI
-    with col2:
-       if 'Balance' in df_filtered.columns and 'Stake' in df_filtered.columns and not df_filtered['Balance'].isna().all():
-           last_balance = df_filtered['Balance'].dropna().iloc[-1]  # Último valor do Balance
-           total_stakes = df_filtered['Stake'].dropna().sum()
-           
-           # Calcular ROI
-           if total_stakes > 0:
-               roi = ((last_balance) / total_stakes) * 100
-               st.metric(
-                   label="📊 Monthly ROI", 
-                   value=f"{roi:.1f}%"
-               )
-           else:
-               st.metric(label="📊 Monthly ROI", value="N/A")
-       else:
-           st.metric(label="📊 Monthly ROI", value="N/A")
-   
-   # 📈 Taxa de Acerto
-    with col3:
-       if 'Results' in df_filtered.columns:
-           # [Rest of the existing win rate calculation remains the same]
-           total_wins = len(df_filtered[df_filtered['Results'] == 'Green'])
-           total_losses = len(df_filtered[df_filtered['Results'] == 'Red'])
-           total_half_win = len(df_filtered[df_filtered['Results'] == 'Green/void']) * 0.5
-           total_half_loss = len(df_filtered[df_filtered['Results'] == 'Red/void']) * 0.5
-           
-           total_valid_bets = total_wins + total_losses + total_half_win + total_half_loss
-           
-           if total_valid_bets > 0:
-               win_rate = ((total_wins + total_half_win) / total_valid_bets) * 100
-           else:
-               win_rate = 0
-
-           st.metric(
-               label="📈 Monthly Win Rate",
-               value=f"{win_rate:.1f}%",
-               
-           )
-       else:
-           st.metric(label="📈 Monthly Win Rate", value="N/A")
-   
-   # 🎯 Odds Média
-    with col4:
-       if 'Odds' in df_filtered.columns and not df_filtered['Odds'].isna().all():
-           avg_odds = df_filtered['Odds'].dropna().mean()
-           st.metric(label="🎯 Monthly Avg Odds", value=f"{avg_odds:.2f}")
-       else:
-           st.metric(label="🎯 Monthly Avg Odds", value="N/A")
+    # Cubo de agregados do ledger (montado uma vez por versão) recortado no período:
+    # KPIs, P/L diário e profit por mercado saem da soma das células, sem percorrer as apostas
+    cube = get_cube(ledger_key, df).slice(period_start, period_end)
+    
+    # Indicadores do período (Profit, ROI, Win Rate e Avg Odds); no modo ao vivo, acumulados da thread
+    if live_poller is not None:
+        slice_key = f"{slice_key}:live{live_state['version']}"
+        render_live_kpis(live_poller, live_state['version'], period_label)
+    else:
+        render_kpis(slice_key, cube, period_label)
+        if compare_ledgers:
+            render_ledger_kpis(slice_key, cube, period_label)
+    run_trace.lap('kpis', rows=len(df_filtered))
     
-    # O resto do código permanece inalterado
     # 📈 Evolução do Saldo
     if 'Balance' in df_filtered.columns and not df_filtered['Balance'].isna().all():
     
     # Criar layout de duas colunas para os gráficos
         col_balance, col_market = st.columns([2, 1])
         
-        # Na parte do gráfico, modifique esta seção:
         with col_balance:
-            # Create a copy and remove NaNs
-            df_graph = df_filtered.dropna(subset=['Day', 'Balance']).copy()
-            
-            # Create month column
-            df_graph['Month'] = df_graph['Day'].dt.strftime('%B')
-            
-            # Get month name for title
-            unique_months = df_graph['Month'].unique()
-            month_title = unique_months[0] if len(unique_months) == 1 else "Multiple Months"
+            render_balance_chart(slice_key, df_filtered, cube, multiple_months, calendar)
+            run_trace.lap('balance_chart', rows=len(df_filtered))
         
-            # Get the last Balance recorded per day
-            df_last_balance = df_graph.groupby(df_graph['Day'].dt.date).agg({
-                'Balance': 'last',
-                'Stake': 'sum',  # Soma das stakes do dia
-                'Results': lambda x: list(x)  # Lista de resultados do dia
-            }).reset_index()
-            
-            df_last_balance['Day'] = pd.to_datetime(df_last_balance['Day'])
-            
-            # Calculate daily profit
-            df_last_balance['Daily_Profit'] = df_last_balance.apply(lambda row: 
-                row['Balance'] - df_last_balance.loc[
-                    df_last_balance.index < row.name, 'Balance'
-                ].iloc[-1] if row.name > 0 else row['Balance'],
-                axis=1
-            )
-            
-            # Pegue o último dia com aposta para limitar a spline
-            last_day_with_bet = df_last_balance['Day'].max()
-            
-            # Create complete date range para todo o mês
-            first_day = df_last_balance['Day'].min().replace(day=1)
-            last_day = df_last_balance['Day'].max().replace(day=28) + pd.DateOffset(days=4)
-            last_day = last_day - pd.DateOffset(days=last_day.day)
-            full_date_range = pd.date_range(start=first_day, end=last_day, freq='D')
-            
-            # Create complete DataFrame com todos os dias do mês
-            df_complete = pd.DataFrame({'Day': full_date_range})
-            
-            # Fazer o merge mantendo todos os dias e preenchendo valores ausentes
-            df_complete = df_complete.merge(df_last_balance, on='Day', how='left')
-            
-            # Forward fill para a coluna Balance (propagar o último valor conhecido)
-            df_complete['Balance'] = df_complete['Balance'].fillna(method='ffill')
-            
-            # Para Daily_Profit, dias sem apostas ficam como zero
-            df_complete['Daily_Profit'] = df_complete['Daily_Profit'].fillna(0)
-            
-            # Criar dataframe separado para a linha de saldo (apenas até o último dia com aposta)
-            df_balance_line = df_complete[df_complete['Day'] <= last_day_with_bet].copy()
-            
-            # Create the figure
-            fig_balance = go.Figure()
-            
-            # Add daily profit/loss bars para todos os dias
-            fig_balance.add_trace(
-                go.Bar(
-                    x=df_complete['Day'],
-                    y=df_complete['Daily_Profit'],
-                    name='Daily P/L',
-                    marker_color=df_complete['Daily_Profit'].apply(
-                        lambda x: '#51cf66' if pd.notnull(x) and x > 0 else 
-                                 '#ff6b6b' if pd.notnull(x) and x < 0 else 
-                                 'rgba(0,0,0,0)'
-                    ),
-                    opacity=0.7,
-                    hovertemplate='<b>Daily P/L</b>: %{y:.2f}<extra></extra>'
-                )
-            )
-            
-            # Add spline curve for cumulative balance (apenas até o último dia com aposta)
-            fig_balance.add_trace(
-                go.Scatter(
-                    x=df_balance_line['Day'],
-                    y=df_balance_line['Balance'],
-                    name='Balance',
-                    line=dict(shape='spline', smoothing=0.3, width=3, color='#1f77b4'),
-                    mode='lines',
-                    hovertemplate='<b>Balance</b>: %{y:.2f}<extra></extra>'
-                )
-            )
-            
-            # Update layout
-            fig_balance.update_layout(
-                title=dict(
-                    text=f'{month_title}',
-                    x=0.5,
-                    font=dict(size=24)
-                ),
-                xaxis=dict(
-                    tickformat="%d",
-                    dtick="D1",
-                    title='Day',
-                    showgrid=True,
-                    gridcolor='rgba(255,255,255,0.1)',
-                    gridwidth=1
-                ),
-                yaxis=dict(
-                    title='Balance / Daily P&L',
-                    showgrid=True,
-                    gridcolor='rgba(255,255,255,0.1)',
-                    gridwidth=1,
-                    range=[
-                        min(
-                            0, 
-                            df_complete['Daily_Profit'].min() * 1.1 if not pd.isna(df_complete['Daily_Profit'].min()) else 0
-                        ),
-                        max(
-                            df_complete['Balance'].max() * 1.1 if not pd.isna(df_complete['Balance'].max()) else 0,
-                            df_complete['Daily_Profit'].max() * 1.1 if not pd.isna(df_complete['Daily_Profit'].max()) else 0
-                        )
-                    ]
-                ),
-                height=600,
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                ),
-                hovermode='x unified',
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)'
-            )
-            
-            # Show the chart
-            st.plotly_chart(fig_balance, use_container_width=True)
-            
-            
-            
-            
-        # O restante do código permanece o mesmo...
         with col_market:
-            # Função para calcular profit por mercado
-            def calculate_market_profit(df, market_type):
-                market_df = df[df['Market'].str.contains(market_type, case=False, na=False)]
-                
-                if len(market_df) == 0:
-                    return 0
-                    
-                market_profit = 0
-                for _, bet in market_df.iterrows():
-                    if bet['Results'] == 'Green':
-                        market_profit += bet['Stake'] * (bet['Odds'] - 1)
-                    elif bet['Results'] == 'Green/void':
-                        market_profit += bet['Stake'] * (bet['Odds'] - 1) * 0.5
-                    elif bet['Results'] == 'Red':
-                        market_profit -= bet['Stake']
-                    elif bet['Results'] == 'Red/void':
-                        market_profit -= bet['Stake'] * 0.5
-                
-                return market_profit
-            
-            # Calcular profits por mercado
-            profits = {
-                '1X2': calculate_market_profit(df_filtered, '1X2'),
-                'AH': calculate_market_profit(df_filtered, 'AH'),
-                'Under': calculate_market_profit(df_filtered, 'Under'),
-                'Over': calculate_market_profit(df_filtered, 'Over')
-            }
-            
-            # Criar DataFrame para os gráficos
-            df_profits = pd.DataFrame({
-                'Market': profits.keys(),
-                'Profit': profits.values()
-            })
-            
-            # Ordenar por valor absoluto do profit
-            df_profits = df_profits.sort_values('Profit', key=abs, ascending=True)
-            
-            # Criar seletor para escolher o tipo de visualização
-            chart_type = st.radio(" ", 
-                                 ["Bar Chart", "Pie Chart"],
-                                 horizontal=True)
-            
-            if chart_type == "Bar Chart":
-                # Criar gráfico de barras horizontais
-                fig = px.bar(
-                    df_profits,
-                    x='Profit',
-                    y='Market',
-                    orientation='h',
-                    title='Profit by Market'
-                )
-                
-                # Definir cores baseadas no sinal do profit
-                fig.update_traces(
-                    marker_color=['#ff6b6b' if x < 0 else '#51cf66' for x in df_profits['Profit']]
-                )
-                
-                # Ajustar layout
-                fig.update_layout(
-                    title=dict(
-                        text='Profit by Market',
-                        x=0.5,
-                        y=0.95,
-                        xanchor='center',
-                        yanchor='top'
-                    ),
-                    title_font=dict(size=24),
-                    showlegend=False,
-                    xaxis_title="Profit",
-                    yaxis_title="",
-                    height=250,
-                    margin=dict(b=0, t=40)
-                )
-                
-            else:  # Gráfico de Pizza
-                # Usar valor absoluto para tamanho dos segmentos
-                df_profits['AbsProfit'] = abs(df_profits['Profit'])
-                
-                # Definir uma paleta de cores diferentes para cada mercado
-                color_palette = ['#0077B6', '#00B4D8', '#48CAE4', '#90E0EF']
-                
-                # Criar gráfico de pizza
-                fig = px.pie(
-                    df_profits,
-                    values='AbsProfit',
-                    names='Market',
-                    title='Profit by Market',
-                    color='Market',  # Usar Market como base para as cores
-                    color_discrete_sequence=color_palette  # Usar nossa paleta personalizada
-                )
-                
-                # Ajustar layout
-                fig.update_layout(
-                    title=dict(
-                        text='Profit by Market',
-                        x=0.5,
-                        y=0.95,
-                        xanchor='center',
-                        yanchor='top'
-                    ),
-                    title_font=dict(size=24),
-                    showlegend=False,
-                    legend=dict(
-                        orientation="v",
-                        yanchor="middle",
-                        y=0.5,
-                        xanchor="right",
-                        x=1.2
-                    ),
-                    height=250,
-                    margin=dict(b=0, t=40)
-                )
-                
-                # Ajustar o formato dos valores no hover e text
-                fig.update_traces(
-                    texttemplate="<b>%{label}</b><br>%{customdata[0]:.2f}",
-                    customdata=df_profits[['Profit']],
-                    hovertemplate="<b>%{label}</b><br>%{customdata[0]:.2f}<br>%{percent}<extra></extra>"
-                )
-            
-            # Mostrar o gráfico selecionado
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
-            
-            # Inserir CSS global para controlar espaçamentos
-            st.markdown("""
-                <style>
-                    /* Remove espaço extra após o gráfico */
-                    [data-testid="stMetric"] {
-                        margin-bottom: 1rem;
-                    }
-                    
-                    /* Controla espaço do título */
-                    div.stMarkdown h4 {
-                        margin-top: -3rem !important;
-                        padding-top: 0 !important;
-                        margin-bottom: 0.5rem !important;
-                    }
-                    
-                    /* Controla espaço da tabela */
-                    div[data-testid="stDataFrame"] {
-                        margin-top: -2rem !important;
-                        padding-top: 0 !important;
-                    }
-                    
-                    /* Remove padding extra dos containers */
-                    .element-container {
-                        padding-top: 0 !important;
-                        margin-top: 0 !important;
-                    }
-                </style>
-            """, unsafe_allow_html=True)
-            
-            # Inserir um espaço invisível para ajudar no posicionamento
-            st.markdown('<div style="margin-top: -3rem;"></div>', unsafe_allow_html=True)
-            
-            # Adicionar CSS para centralizar colunas
-            st.markdown("""
-                <style>
-                div[data-testid="stDataFrame"] td {
-                    text-align: center !important;
-                }
-                div[data-testid="stDataFrame"] th {
-                    text-align: center !important;
-                }
-                </style>
-            """, unsafe_allow_html=True)
-            
-            
-            st.markdown("""
-                <h4 style='text-align: center; color: white;'>Detailed Profit by Market</h4>
-            """, unsafe_allow_html=True)
-            
-            # Formatar os valores da tabela
-            df_table = df_profits.copy()
-            
-            def calculate_roi(df_table, df_profits, df):
-                markets = ['1X2', 'Under', 'Over']
-                
-                for market in markets:
-                    profits = df_profits[df_profits['Market'] == market]['Profit'].sum()
-                    stakes = pd.to_numeric(df[df['Market'] == market]['Stake'], errors='coerce').sum()
-                    df_table.loc[df_table['Market'] == market, 'ROI'] = 100 * (profits / stakes)
-                
-                ah_profits = df_profits[df_profits['Market'] == 'AH']['Profit'].sum()
-                ah_stakes = pd.to_numeric(df[df['Market'] == 'AH']['Stake'], errors='coerce').sum()
-                df_table.loc[df_table['Market'] == 'AH', 'ROI'] = 100 * (ah_profits / ah_stakes)
-                
-                return df_table
-            
-            # Calcular ROI
-            df_table = calculate_roi(df_table, df_profits, df)
-            
-            # Formatar os valores
-            df_table['Profit'] = df_table['Profit'].apply(lambda x: f"{float(x):,.2f}")
-            df_table['ROI'] = df_table['ROI'].apply(lambda x: f"{x:.2f}%")
-            
-            # Remover a coluna AbsProfit se existir
-            if 'AbsProfit' in df_table.columns:
-                df_table = df_table.drop('AbsProfit', axis=1)
-            
-            # Criar uma função de estilo para centralizar todas as colunas
-            def style_df(df):
-                return df.style.set_properties(**{
-                    'text-align': 'center',
-                    'font-size': '1rem',
-                    'padding': '0.5rem'
-                }).set_table_styles([
-                    {'selector': 'th', 'props': [('text-align', 'center')]},
-                    {'selector': 'td', 'props': [('text-align', 'center')]}
-                ])
-            
-            # Aplicar o estilo e mostrar a tabela
-            styled_df = style_df(df_table.set_index('Market'))
-            
-            st.dataframe(
-                styled_df,
-                use_container_width=True,
-                hide_index=False
-            )
-            
-            
-            
-               
+            market_key = slice_key
+            if live_poller is not None:
+                df_profits = live_state['markets'].sort_values('Profit', key=abs, ascending=True)
+            elif compare_ledgers:
+                market_key = f"{slice_key}:ledgers"
+                df_profits = get_ledger_market_breakdown(slice_key, cube)
+            else:
+                df_profits = get_market_breakdown(slice_key, cube)
+            render_market_breakdown(market_key, df_profits)
+            run_trace.lap('market_breakdown', rows=len(df_filtered))
     
     
-    # Substitua a seção do Betting Details por este código
-
+    elif len(df_filtered):
+        # Sem saldo na planilha: a projeção ganha seção própria
+        st.markdown('<h2 class="section-title">🔮 Projection</h2>', unsafe_allow_html=True)
+        render_projection(slice_key, df_filtered)
+        run_trace.lap('projection', rows=len(df_filtered))
+    
+    
+    # 🧭 Agrupamentos, 🎯 calibração das odds e 📉 análise de risco do período
+    if len(df_filtered):
+        st.markdown('<h2 class="section-title">🧭 Breakdown</h2>', unsafe_allow_html=True)
+        render_breakdown(slice_key, df_filtered)
+        run_trace.lap('breakdown', rows=len(df_filtered))
+        
+        st.markdown('<h2 class="section-title">🎯 Calibration</h2>', unsafe_allow_html=True)
+        render_calibration(slice_key, df_filtered)
+        run_trace.lap('calibration', rows=len(df_filtered))
+        
+        st.markdown('<h2 class="section-title">📉 Risk</h2>', unsafe_allow_html=True)
+        render_risk(slice_key, df_filtered)
+        run_trace.lap('risk', rows=len(df_filtered))
+    
     # 📋 Tabela de Detalhamento de Apostas
     st.markdown("""
         <style>
@@ -571,73 +1085,50 @@ if df is not None:
     
     st.markdown('<h2 class="section-title">📋 Betting Details</h2>', unsafe_allow_html=True)
     
-    # Selecionar colunas da B à M (índices 1 a 12)
-    df_detailed = df.iloc[:, 1:13]
-    
-    df_detailed['Day'] = pd.to_datetime(df_detailed['Day']).dt.strftime('%d/%m')
-    
-    # Converter as colunas "Balance", "Stake" e "Odds" para float
-    df_detailed['Balance'] = df_detailed['Balance'].astype(float)
-    df_detailed['Stake'] = df_detailed['Stake'].astype(float)
-    df_detailed['Odds'] = df_detailed['Odds'].astype(float)
-    
-    # Arredondar as colunas
-    df_detailed['Balance'] = df_detailed['Balance'].round(2)
-    df_detailed['Stake'] = df_detailed['Stake'].round(2)
-    df_detailed['Odds'] = df_detailed['Odds'].round(3)
-    
-    # Funções para formatação
-    def format_two_decimals(value):
-        return f"{value:.2f}"
-    def format_three_decimals(value):
-        return f"{value:.3f}"
-    
-    # Aplicar formatação
-    df_detailed['Balance'] = df_detailed['Balance'].apply(format_two_decimals)
-    df_detailed['Stake'] = df_detailed['Stake'].apply(format_two_decimals)
-    df_detailed['Odds'] = df_detailed['Odds'].apply(format_three_decimals)
-    
-    # Ordenar o DataFrame
-    df_detailed = df_detailed.iloc[::-1]
-    
-    def highlight_result(row):
-        color_map = {
-            'Red': 'color: #FF4C4C; font-weight: bold;',
-            'Red/void': 'color: #FF9999; font-weight: bold;',
-            'Void': 'color: #FFD700; font-weight: bold;',
-            'Green/void': 'color: #90EE90; font-weight: bold;',
-            'Green': 'color: #008000; font-weight: bold;'
-        }
-    
-        result_column = [col for col in row.index if col.lower() in ['results', 'resultado']]
-        styles = [''] * len(row)
-    
-        if result_column:
-            col_index = row.index.get_loc(result_column[0])
-            result_value = row[result_column[0]]
+    render_details(slice_key, df_filtered)
+    run_trace.lap('details', rows=len(df_filtered))
     
-            if result_value in color_map:
-                styles[col_index] = color_map[result_value]
-    
-        return styles
-    
-    # Mostrar a tabela com o novo espaçamento
-    st.dataframe(
-        df_detailed.style.apply(highlight_result, axis=1),
-        use_container_width=True
-    )
-    
-    
-    
-    # 📥 Download dos dados filtrados
-    csv = df_filtered.to_csv(index=False).encode('utf-8')
-    st.download_button(
-        label="📥 Download dos dados",
-        data=csv,
-        file_name="betting_data.csv",
-        mime="text/csv"
-    )
+    render_export(df_filtered)
+    run_trace.lap('export', rows=len(df_filtered))
 else:
     st.error("⚠️ Não foi possível carregar os dados.")
 
 st.write("Desenvolvido por SBI ⚽")
+
+# ⏱️ Desempenho desta execução e resumo (p50/p95) das últimas execuções
+perf_history = get_perf_history()
+perf_history.add(run_trace, view=view_mode, tabs=[name for _, name in ledger_tabs])
+
+if config.PERF_PANEL:
+    with st.sidebar.expander("⏱️ Performance", expanded=False):
+        st.caption(f"This run: {run_trace.total() * 1000:.0f} ms")
+        if warmup is not None and warmup.done:
+            st.caption(f"Warm-up: {sum(warmup.timings.values()) * 1000:.0f} ms")
+        df_spans = pd.DataFrame(run_trace.spans)
+        st.dataframe(
+            pd.DataFrame({
+                'Stage': df_spans['stage'],
+                'ms': (df_spans['seconds'] * 1000).round(1),
+                'Rows': df_spans['rows'],
+                'Mem Δ (MB)': (df_spans['memory_delta'] / 1024 / 1024).round(1),
+            }),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption(f"Last {len(perf_history)} runs")
+        st.dataframe(
+            pd.DataFrame(perf_history.summary()).round(1),
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Memória do ledger compartilhado (a mesma cópia atende todas as sessões)
+        if df is not None:
+            st.caption(f"Shared ledger: {len(df)} rows · {frame_bytes(df) / 1024 / 1024:.1f} MB")
+            if st.checkbox("Memory report", value=False):
+                df_memory = memory_report(df)
+                st.caption(
+                    f"Original dtypes: {df_memory['Bytes'].sum() / 1024 / 1024:.1f} MB → "
+                    f"compact: {df_memory['Compact Bytes'].sum() / 1024 / 1024:.1f} MB"
+                )
+                st.dataframe(df_memory.round(1), hide_index=True, use_container_width=True)
@@ -0,0 +1,217 @@
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from sbintelligence.calibration import calibration_table  # noqa: E402
+from sbintelligence.cube import build_cube  # noqa: E402
+from sbintelligence.daily import complete_days, daily_balance, graph_balance  # noqa: E402
+from sbintelligence.details import filter_details, format_details, paginate, style_details  # noqa: E402
+from sbintelligence.export import export_bytes  # noqa: E402
+from sbintelligence.figures import (  # noqa: E402
+    balance_figure, balance_frames, drawdown_figure, long_range_figure, long_range_frames, market_figure,
+    risk_frames, rolling_figure
+)
+from sbintelligence.ingest import parse_ledger, read_ledger_csv  # noqa: E402
+from sbintelligence.ledger import day_slice, sort_by_day, tag_tab  # noqa: E402
+from sbintelligence.metrics import kpis  # noqa: E402
+from sbintelligence.risk import risk_summary  # noqa: E402
+from sbintelligence.simulation import bet_distribution, monte_carlo  # noqa: E402
+from sbintelligence.settlement import add_settlement, market_breakdown  # noqa: E402
+from sbintelligence.synthetic import generate_ledger  # noqa: E402
+from sbintelligence.taxonomy import grouped_breakdown  # noqa: E402
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+TAB_NAME = 'Jan2025'
+
+
+# Função para filtrar o mês exibido (mesma busca binária usada pelo dashboard)
+def monthly_filter(df):
+    period_start = pd.Timestamp('2025-01-01')
+    period_end = period_start + pd.offsets.MonthEnd(0)
+    return day_slice(df, period_start, period_end)
+
+
+# Função para recortar os últimos 30 dias do ledger (filtro de datas do dashboard)
+def range_filter(df):
+    period_end = df['Day'].iloc[len(df) // 2]
+    return day_slice(df, period_end - pd.Timedelta(days=29), period_end)
+
+
+# Função para responder o bloco de KPIs, o P/L diário e o profit por mercado dos últimos 30 dias pelo cubo
+def cube_rollup(cube):
+    period_end = pd.Timestamp(cube.cells['Day'][len(cube) // 2])
+    period = cube.slice(period_end - pd.Timedelta(days=29), period_end)
+    return period.kpis(), period.daily(), period.market_breakdown()
+
+
+# Etapas do dashboard: (nome, entrada, saída, função)
+STAGES = [
+    ('csv_parse', 'csv', 'raw', lambda csv: read_ledger_csv(io.BytesIO(csv))),
+    ('numeric_date_conversion', 'raw', 'parsed', lambda raw: parse_ledger(raw.copy(), year=2025)),
+    ('settlement', 'parsed', 'ledger', lambda df: tag_tab(add_settlement(df.copy()), TAB_NAME)),
+    ('day_sort', 'ledger', 'ledger', sort_by_day),
+    ('monthly_filter', 'ledger', 'filtered', monthly_filter),
+    ('range_filter', 'ledger', None, range_filter),
+    ('cube_build', 'ledger', 'cube', build_cube),
+    ('cube_rollup', 'cube', None, cube_rollup),
+    ('kpi_block', 'filtered', None, kpis),
+    ('daily_aggregation', 'filtered', None,
+     lambda df: complete_days(daily_balance(graph_balance(df)))),
+    ('balance_figure', 'filtered', None, lambda df: balance_figure(*balance_frames(df))),
+    ('long_range_figure', 'filtered', None,
+     lambda df: long_range_figure(*long_range_frames(df, resolution='Per bet'))),
+    ('risk_summary', 'filtered', None, risk_summary),
+    ('risk_frames', 'filtered', 'risk', lambda df: risk_frames(df, 100)),
+    ('risk_figures', 'risk', None,
+     lambda frames: (drawdown_figure(frames[0]), rolling_figure(frames[1], 100))),
+    ('monte_carlo', 'filtered', None,
+     lambda df: monte_carlo(bet_distribution(df), n_paths=10_000, n_bets=500, bankroll=1_000)),
+    ('market_profit', 'filtered', 'markets', market_breakdown),
+    ('market_figure', 'markets', None, market_figure),
+    ('market_line_breakdown', 'filtered', None, lambda df: grouped_breakdown(df, 'Market line')),
+    ('odds_bucket_breakdown', 'filtered', None, lambda df: grouped_breakdown(df, 'Odds bucket')),
+    ('odds_calibration', 'filtered', None, calibration_table),
+    ('table_formatting', 'ledger', 'details', format_details),
+    ('table_page', 'details', None,
+     lambda df: style_details(paginate(filter_details(df, results=['Green', 'Red']), 1, 50)).to_html()),
+    ('table_styling', 'details', None, lambda df: style_details(df).to_html()),
+    ('csv_export', 'filtered', None, lambda df: export_bytes(df, 'CSV')),
+    ('csv_gzip_export', 'filtered', None, lambda df: export_bytes(df, 'CSV (gzip)')),
+]
+
+# Etapas lentas demais para tamanhos grandes (limitadas por --max-style-rows)
+ROW_LIMITED_STAGES = {'table_styling'}
+
+
+# Função para medir o tempo (várias repetições) e o pico de memória de uma etapa
+def measure(func, value, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(value)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    func(value)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return result, timings, peak
+
+
+# Função para executar todas as etapas para um tamanho de ledger
+def run_size(rows, repeat, max_style_rows, seed):
+    context = {'csv': generate_ledger(rows, seed=seed).to_csv(index=False).encode('utf-8')}
+    results = []
+    for name, source, target, func in STAGES:
+        entry = {'stage': name, 'rows': rows}
+        if name in ROW_LIMITED_STAGES and rows > max_style_rows:
+            entry['skipped'] = f'rows > --max-style-rows ({max_style_rows})'
+            results.append(entry)
+            continue
+
+        output, timings, peak = measure(func, context[source], repeat)
+        if target is not None:
+            context[target] = output
+        entry.update({
+            'seconds_min': min(timings),
+            'seconds_median': statistics.median(timings),
+            'peak_bytes': int(peak),
+        })
+        results.append(entry)
+        print(f"{rows:>10,} {name:<26} {entry['seconds_min'] * 1000:>10.1f} ms "
+              f"{peak / 1024 / 1024:>9.1f} MB", file=sys.stderr)
+    return results
+
+
+# Função para comparar com um resultado anterior e listar as regressões
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {
+        (entry['stage'], entry['rows']): entry
+        for entry in baseline.get('results', []) if 'seconds_min' in entry
+    }
+
+    regressions = []
+    for entry in results:
+        old = previous.get((entry.get('stage'), entry.get('rows')))
+        if old is None or 'seconds_min' not in entry:
+            continue
+        if entry['seconds_min'] > old['seconds_min'] * (1 + tolerance):
+            regressions.append({
+                'stage': entry['stage'],
+                'rows': entry['rows'],
+                'before': old['seconds_min'],
+                'after': entry['seconds_min'],
+            })
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark every dashboard stage on synthetic ledgers.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='ledger sizes in rows (1k to 10M)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed repetitions per stage')
+    parser.add_argument('--max-style-rows', type=int, default=20_000,
+                        help='skip Styler rendering above this many rows')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', '-o', default='bench_results.json', help='JSON results path')
+    parser.add_argument('--compare', help='previous results JSON to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown before a stage counts as a regression (0.25 = 25%%)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    results = []
+    for rows in args.sizes:
+        results.extend(run_size(rows, args.repeat, args.max_style_rows, args.seed))
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+
+    exit_code = 0
+    if args.compare:
+        report['regressions'] = compare(results, args.compare, args.tolerance)
+        for regression in report['regressions']:
+            print(f"REGRESSION {regression['stage']} ({regression['rows']:,} rows): "
+                  f"{regression['before'] * 1000:.1f} ms -> {regression['after'] * 1000:.1f} ms",
+                  file=sys.stderr)
+        exit_code = 1 if report['regressions'] else 0
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
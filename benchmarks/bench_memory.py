@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from sbintelligence.compact import compact_ledger, frame_bytes, memory_report  # noqa: E402
+from sbintelligence.daily import complete_days, daily_balance, graph_balance  # noqa: E402
+from sbintelligence.details import format_details, paginate  # noqa: E402
+from sbintelligence.ingest import parse_ledger  # noqa: E402
+from sbintelligence.ledger import tag_tab  # noqa: E402
+from sbintelligence.settlement import add_settlement  # noqa: E402
+from sbintelligence.synthetic import generate_ledger  # noqa: E402
+
+
+MB = 1024 * 1024
+TAB_NAME = 'Jan2025'
+
+
+# Função para medir os dataframes que cada sessão mantinha antes (tudo por sessão, tipos originais)
+def session_before(ledger):
+    df_filtered = ledger[ledger['Day'].notna()].copy()
+    df_graph = graph_balance(df_filtered)
+    df_last_balance = daily_balance(df_graph)
+    df_complete = complete_days(df_last_balance)
+
+    # A tabela de detalhes era montada inteira, com Balance/Stake/Odds formatados como texto
+    df_detailed = format_details(ledger)
+    for col in ('Balance', 'Stake', 'Odds'):
+        df_detailed[col] = df_detailed[col].map('{:.2f}'.format)
+
+    frames = {
+        'df': ledger, 'df_filtered': df_filtered, 'df_graph': df_graph,
+        'df_last_balance': df_last_balance, 'df_complete': df_complete, 'df_detailed': df_detailed,
+    }
+    return {name: frame_bytes(frame) for name, frame in frames.items()}
+
+
+# Função para medir o que fica compartilhado e o que resta por sessão no ledger compacto
+def session_after(compact, page_size=50):
+    shared = {'df (shared)': compact, 'df_detailed (shared)': format_details(compact)}
+
+    # O período cobre o ledger inteiro: df_filtered é o próprio ledger (sem cópia)
+    per_session = {'details page': paginate(shared['df_detailed (shared)'], 1, page_size)}
+    return (
+        {name: frame_bytes(frame) for name, frame in shared.items()},
+        {name: frame_bytes(frame) for name, frame in per_session.items()},
+    )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Compare per-session memory of the original and compact ledgers.')
+    parser.add_argument('--rows', type=int, default=100_000, help='synthetic ledger size in rows')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 10, 50],
+                        help='numbers of concurrent sessions to project')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', '-o', help='JSON results path')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    ledger = tag_tab(add_settlement(parse_ledger(generate_ledger(args.rows, seed=args.seed), year=2025)),
+                     TAB_NAME)
+    compact = compact_ledger(ledger)
+
+    before = session_before(ledger)
+    shared, per_session = session_after(compact)
+
+    print(memory_report(ledger).round(1).to_string(index=False), file=sys.stderr)
+    print(file=sys.stderr)
+    for name, size in before.items():
+        print(f'before  {name:<22} {size / MB:>9.1f} MB (per session)', file=sys.stderr)
+    for name, size in shared.items():
+        print(f'after   {name:<22} {size / MB:>9.1f} MB (once)', file=sys.stderr)
+    for name, size in per_session.items():
+        print(f'after   {name:<22} {size / MB:>9.1f} MB (per session)', file=sys.stderr)
+
+    projections = []
+    for sessions in args.sessions:
+        total_before = sessions * sum(before.values())
+        total_after = sum(shared.values()) + sessions * sum(per_session.values())
+        projections.append({'sessions': sessions, 'before_bytes': total_before, 'after_bytes': total_after})
+        print(f'{sessions:>4} sessions: {total_before / MB:>9.1f} MB -> {total_after / MB:>7.1f} MB',
+              file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'rows': args.rows,
+                'pandas': pd.__version__,
+                'before': before,
+                'shared': shared,
+                'per_session': per_session,
+                'projections': projections,
+            }, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
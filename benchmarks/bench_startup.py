@@ -0,0 +1,170 @@
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DASHBOARD = os.path.join(ROOT, 'Dashboard.py')
+SHEET_SERVER = os.path.join(ROOT, 'benchmarks', 'sheet_server.py')
+
+# Módulos que o dashboard importa sob demanda: não podem ser carregados pelos imports do script
+LAZY_MODULES = ('plotly.express', 'requests')
+
+# Mede os imports do Dashboard.py em um processo novo (o streamlit já vem importado pelo servidor)
+IMPORT_PROBE = '''
+import json, sys, time
+import streamlit
+sys.path.insert(0, sys.argv[2])
+start = time.perf_counter()
+exec(compile(sys.argv[1], 'Dashboard.py', 'exec'), {'__name__': 'dashboard_imports'})
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'loaded': [name for name in sys.argv[3:] if name in sys.modules]}))
+'''
+
+# Executa o dashboard inteiro uma vez (primeira execução de um processo novo)
+PAINT_PROBE = '''
+import sys
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=300).run()
+sys.exit(1 if at.exception else 0)
+'''
+
+
+# Função para extrair os imports do nível do módulo do Dashboard.py (o que roda antes da página)
+def dashboard_imports(path=DASHBOARD):
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source)
+    return '\n'.join(
+        ast.get_source_segment(source, node) for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
+# Função para medir o tempo dos imports do dashboard (mediana de vários processos novos)
+def measure_imports(runs):
+    code = dashboard_imports()
+    timings, loaded = [], set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_PROBE, code, ROOT, *LAZY_MODULES],
+            capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout
+        probe = json.loads(output.strip().splitlines()[-1])
+        timings.append(probe['seconds'])
+        loaded.update(probe['loaded'])
+    return {'seconds_median': statistics.median(timings), 'seconds_max': max(timings),
+            'eager_modules': sorted(loaded)}
+
+
+# Função para subir o servidor local que imita o Google Sheets (latência fixa por resposta)
+def start_sheet_server(latency, rows):
+    server = subprocess.Popen(
+        [sys.executable, SHEET_SERVER, '--port', '0', '--latency', str(latency), '--rows', str(rows)],
+        stderr=subprocess.PIPE, text=True
+    )
+    line = server.stderr.readline().strip()
+    if not line.startswith('SBI_SHEETS_BASE_URL='):
+        server.kill()
+        raise RuntimeError(f'sheet_server did not start: {line}')
+    return server, line.split('=', 1)[1]
+
+
+# Função para medir o primeiro desenho: imports + página e filtros (etapas "imports" e "setup"
+# do registro JSON da execução), antes da carga das abas
+def measure_first_paint(runs, latency, rows, warmup=False):
+    server, base_url = start_sheet_server(latency, rows)
+    env = dict(os.environ, SBI_SHEETS_BASE_URL=base_url, SBI_SNAPSHOT_DIR='', SBI_PERF_LOG='1',
+               SBI_SIM_WORKERS='1', SBI_WARMUP='1' if warmup else '0', PYTHONPATH=ROOT)
+    paints, loads, totals = [], [], []
+    try:
+        for _ in range(runs):
+            # Diretório vazio: sem ledgers.json nem snapshots de execuções anteriores
+            with tempfile.TemporaryDirectory() as cwd:
+                result = subprocess.run(
+                    [sys.executable, '-c', PAINT_PROBE, DASHBOARD],
+                    capture_output=True, text=True, env=env, cwd=cwd
+                )
+            records = [json.loads(line) for line in result.stderr.splitlines()
+                       if line.startswith('{"event": "rerun"')]
+            if result.returncode or not records:
+                raise RuntimeError(f'dashboard run failed:\n{result.stderr[-2000:]}')
+            laps = {span['stage']: span['seconds'] for span in records[-1]['spans'] if not span.get('nested')}
+            paints.append(laps.get('imports', 0.0) + laps.get('setup', 0.0))
+            loads.append(laps.get('load', 0.0))
+            totals.append(records[-1]['total_seconds'])
+    finally:
+        server.kill()
+        server.wait()
+    return {
+        'seconds_median': statistics.median(paints),
+        'seconds_max': max(paints),
+        'load_seconds_median': statistics.median(loads),
+        'total_seconds_median': statistics.median(totals),
+        'latency': latency,
+        'warmup': warmup,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the dashboard cold start (imports and first paint) against a time budget.'
+    )
+    parser.add_argument('--runs', type=int, default=3, help='fresh processes per measurement (median)')
+    parser.add_argument('--import-budget-ms', type=float, default=1500)
+    parser.add_argument('--paint-budget-ms', type=float, default=2000)
+    parser.add_argument('--latency', type=float, default=1.0,
+                        help='seconds the stand-in sheet server waits before each response')
+    parser.add_argument('--rows', type=int, default=1000, help='rows per synthetic tab')
+    parser.add_argument('--warmup', action='store_true', help='run the dashboard with SBI_WARMUP=1')
+    parser.add_argument('--output', '-o', default='startup_results.json', help='JSON results path')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    imports = measure_imports(args.runs)
+    paint = measure_first_paint(args.runs, args.latency, args.rows, args.warmup)
+    print(f"imports      {imports['seconds_median'] * 1000:>8.0f} ms (budget {args.import_budget_ms:.0f} ms)",
+          file=sys.stderr)
+    print(f"first paint  {paint['seconds_median'] * 1000:>8.0f} ms (budget {args.paint_budget_ms:.0f} ms)",
+          file=sys.stderr)
+    print(f"load         {paint['load_seconds_median'] * 1000:>8.0f} ms "
+          f"(sheet latency {args.latency * 1000:.0f} ms)", file=sys.stderr)
+
+    failures = []
+    if imports['seconds_median'] * 1000 > args.import_budget_ms:
+        failures.append(f"imports took {imports['seconds_median'] * 1000:.0f} ms")
+    if paint['seconds_median'] * 1000 > args.paint_budget_ms:
+        failures.append(f"first paint took {paint['seconds_median'] * 1000:.0f} ms")
+    if imports['eager_modules']:
+        failures.append(f"imported at startup: {', '.join(imports['eager_modules'])}")
+    for failure in failures:
+        print(f'OVER BUDGET {failure}', file=sys.stderr)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'runs': args.runs,
+        },
+        'budget': {'import_ms': args.import_budget_ms, 'paint_ms': args.paint_budget_ms},
+        'imports': imports,
+        'first_paint': paint,
+        'failures': failures,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import argparse
+import gzip
+import hashlib
+import os
+import random
+import re
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from sbintelligence.synthetic import generate_csv  # noqa: E402
+
+
+_OFFSET = re.compile(r'offset\s+(\d+)', re.IGNORECASE)
+
+# Last-Modified das abas sintéticas
+SERVER_START = time.time()
+
+
+# Função para obter o CSV de uma aba: arquivo <dir>/<aba>.csv ou ledger sintético do mês da aba
+def tab_csv(name, directory=None, rows=1000):
+    if directory:
+        path = os.path.join(directory, f'{name}.csv')
+        if not os.path.exists(path):
+            return None, None
+        with open(path, 'rb') as f:
+            return f.read(), os.path.getmtime(path)
+
+    try:
+        month = pd.to_datetime(name, format='%b%Y')
+    except ValueError:
+        return None, None
+    seed = int(hashlib.blake2b(name.encode(), digest_size=4).hexdigest(), 16)
+    return generate_csv(rows, seed=seed, year=month.year, month=month.month), SERVER_START
+
+
+# Função para aplicar o "select * offset N" da consulta gviz (mantém a linha de cabeçalho)
+def apply_offset(data, query):
+    match = _OFFSET.search(query or '')
+    if not match:
+        return data
+    lines = data.split(b'\n')
+    return b'\n'.join([lines[0]] + lines[1 + int(match.group(1)):])
+
+
+# Servidor que imita a exportação CSV (gviz) do Google Sheets, com latência e falhas injetadas
+class SheetHandler(BaseHTTPRequestHandler):
+    options = None
+    rng = random.Random(0)
+    rng_lock = threading.Lock()
+
+    def _chance(self, rate):
+        with self.rng_lock:
+            return self.rng.random() < rate
+
+    def do_GET(self):
+        options = self.options
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+
+        latency = options.latency
+        if options.jitter:
+            with self.rng_lock:
+                latency += self.rng.uniform(0, options.jitter)
+        if latency:
+            time.sleep(latency)
+
+        if self._chance(options.drop_rate):
+            self.close_connection = True
+            self.connection.close()  # Conexão encerrada sem resposta
+            return
+        if self._chance(options.error_rate):
+            self.send_response(options.error_status)
+            if options.retry_after is not None:
+                self.send_header('Retry-After', str(options.retry_after))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        name = params.get('sheet', ['Jan2025'])[0]
+        data, modified = tab_csv(name, options.dir, options.rows)
+        if data is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        data = apply_offset(data, params.get('tq', [''])[0])
+
+        etag = '"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"'
+        last_modified = formatdate(modified, usegmt=True)
+        if options.validators and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        encoding = None
+        if options.gzip and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            data, encoding = gzip.compress(data, compresslevel=5), 'gzip'
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if options.validators:
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', last_modified)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.options.verbose:
+            super().log_message(format, *args)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Local stand-in for the Google Sheets CSV export, with injectable latency and errors.'
+    )
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--dir', help='serve <dir>/<tab>.csv instead of synthetic ledgers')
+    parser.add_argument('--rows', type=int, default=1000, help='rows per synthetic tab')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with an error')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--retry-after', type=float, help='Retry-After header sent with errors')
+    parser.add_argument('--drop-rate', type=float, default=0.0,
+                        help='fraction of connections closed without a response')
+    parser.add_argument('--no-validators', dest='validators', action='store_false',
+                        help='do not send ETag/Last-Modified (no 304 responses)')
+    parser.add_argument('--no-gzip', dest='gzip', action='store_false')
+    parser.add_argument('--verbose', action='store_true')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    SheetHandler.options = parse_args(argv)
+    server = ThreadingHTTPServer(('127.0.0.1', SheetHandler.options.port), SheetHandler)
+    print(f'SBI_SHEETS_BASE_URL=http://127.0.0.1:{server.server_port}', file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
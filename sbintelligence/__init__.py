@@ -0,0 +1 @@
+# SBIntelligence - núcleo de dados do Dashboard de Apostas
@@ -0,0 +1,135 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+# Função para estimar o tamanho (bytes) de um valor guardado no cache
+def estimate_size(value):
+    memory_usage = getattr(value, 'memory_usage', None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(index=True, deep=True)
+            return int(usage.sum() if hasattr(usage, 'sum') else usage)
+        except TypeError:
+            pass
+    return sys.getsizeof(value)
+
+
+# Cache LRU com tempo de vida (TTL) e limite de memória, compartilhado entre sessões
+class TTLCache:
+    def __init__(self, ttl=300, max_bytes=256 * 1024 * 1024, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries = OrderedDict()  # chave -> (valor, tamanho, momento da carga)
+        self._lock = threading.RLock()
+        self._loading = {}  # chave -> lock, para que apenas uma sessão busque cada aba
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _expired(self, stored_at):
+        return self.ttl is not None and self._clock() - stored_at >= self.ttl
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry[2]):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # Valores maiores que o limite não são guardados
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, self._clock())
+            self._bytes += size
+            # Remover as entradas menos usadas até caber no limite
+            while self.max_bytes is not None and self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    # Retorna o valor em cache ou executa o loader (uma única vez por chave)
+    def get_or_load(self, key, loader):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[0]
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Outra sessão pode ter carregado enquanto esperávamos
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry[0]
+                self.misses += 1
+            try:
+                value = loader()
+                # Falhas (None) não são guardadas para permitir nova tentativa
+                if value is not None:
+                    self.set(key, value)
+                return value
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+
+    def age(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            return self._clock() - entry[2]
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            elif key in self._entries:
+                self._remove(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry[2])
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+            }
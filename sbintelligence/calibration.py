@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from .settlement import settle, win_weights
+from .taxonomy import ODDS_BINS, ODDS_LABELS
+
+
+# Nível de confiança (%) dos intervalos e número de reamostragens do bootstrap
+CONFIDENCE = 90
+BOOTSTRAP_SAMPLES = 1000
+
+# Máximo de células (reamostragens × apostas) de um sorteio em lote
+BATCH_CELLS = 2_000_000
+
+# Colunas somadas por faixa: vitórias, apostas válidas, vitórias esperadas (1/Odds), P/L e stake
+_WINS, _VALID, _EXPECTED, _PROFIT, _STAKE = range(5)
+
+
+# Função para montar os valores de cada aposta usados na calibração (apenas apostas com resultado e odds)
+def calibration_values(df):
+    odds = df['Odds'].to_numpy(dtype='float64') if 'Odds' in df.columns else np.full(len(df), np.nan)
+    wins, valid = win_weights(df['Results']) if 'Results' in df.columns else (np.zeros(len(df)),) * 2
+
+    pnl = (df['PnL'] if 'PnL' in df.columns else settle(df)).to_numpy(dtype='float64')
+    stake = df['Stake'].to_numpy(dtype='float64') if 'Stake' in df.columns else np.zeros(len(df))
+
+    # Faixa de odds de cada aposta (mesmas faixas do agrupamento "Odds bucket")
+    bucket = np.digitize(odds, ODDS_BINS) - 1
+    keep = (valid > 0) & (odds > 0) & (bucket >= 0) & (bucket < len(ODDS_LABELS)) & ~np.isnan(pnl)
+
+    values = np.column_stack([
+        wins, valid, np.divide(valid, odds, out=np.zeros(len(df)), where=odds > 0),
+        pnl, np.nan_to_num(stake) * valid,
+    ])
+    return bucket[keep], values[keep], odds[keep]
+
+
+# Função para reamostrar as somas de uma faixa em lote: todas as reamostragens sorteiam apostas com
+# reposição de uma vez (contagem de cada aposta por reamostragem via bincount) e as somas saem de um
+# produto de matrizes. Faixas grandes demais para o lote usam a distribuição normal das somas
+# (limite do bootstrap para somas de muitas apostas)
+def bootstrap_sums(values, n_samples=BOOTSTRAP_SAMPLES, rng=None):
+    rng = rng if rng is not None else np.random.default_rng(0)
+    n = len(values)
+    if n * n_samples > BATCH_CELLS:
+        mean, cov = values.mean(axis=0), np.cov(values, rowvar=False)
+        return rng.multivariate_normal(n * mean, n * np.atleast_2d(cov), size=n_samples, method='eigh')
+    picks = rng.integers(0, n, size=(n_samples, n)) + n * np.arange(n_samples)[:, None]
+    counts = np.bincount(picks.ravel(), minlength=n_samples * n).reshape(n_samples, n)
+    return counts @ values
+
+
+# Função para comparar a probabilidade implícita (1/Odds) com a taxa de acerto realizada por faixa de
+# odds, com vitórias esperadas/realizadas e intervalos de confiança por bootstrap. Na probabilidade
+# implícita o profit esperado é zero (odds justas), então o profit e seu intervalo medem a vantagem
+def calibration_table(df, n_samples=BOOTSTRAP_SAMPLES, confidence=CONFIDENCE, seed=0):
+    bucket, values, odds = calibration_values(df)
+    n_bins = len(ODDS_LABELS)
+
+    totals = np.column_stack([
+        np.bincount(bucket, weights=values[:, col], minlength=n_bins) for col in range(values.shape[1])
+    ])
+    bets = np.bincount(bucket, minlength=n_bins)
+    odds_sum = np.bincount(bucket, weights=odds, minlength=n_bins)
+
+    # Intervalos de confiança da taxa de acerto e do profit (uma reamostragem em lote por faixa)
+    tail = (100 - confidence) / 2
+    win_rate_ci = np.full((n_bins, 2), np.nan)
+    profit_ci = np.full((n_bins, 2), np.nan)
+    rng = np.random.default_rng(seed)
+    order = np.argsort(bucket, kind='stable')
+    bounds = np.concatenate([[0], np.cumsum(bets)])
+    for b in np.flatnonzero(bets):
+        sums = bootstrap_sums(values[order[bounds[b]:bounds[b + 1]]], n_samples, rng)
+        win_rate_ci[b] = np.percentile(100 * sums[:, _WINS] / sums[:, _VALID], [tail, 100 - tail])
+        profit_ci[b] = np.percentile(sums[:, _PROFIT], [tail, 100 - tail])
+
+    valid = totals[:, _VALID]
+    implied = np.divide(100 * totals[:, _EXPECTED], valid, out=np.full(n_bins, np.nan), where=valid > 0)
+    win_rate = np.divide(100 * totals[:, _WINS], valid, out=np.full(n_bins, np.nan), where=valid > 0)
+    table = pd.DataFrame({
+        'Odds bucket': ODDS_LABELS,
+        'Bets': bets,
+        'Avg Odds': np.divide(odds_sum, bets, out=np.full(n_bins, np.nan), where=bets > 0),
+        'Implied %': implied,
+        'Win Rate %': win_rate,
+        'Win Rate Low': win_rate_ci[:, 0],
+        'Win Rate High': win_rate_ci[:, 1],
+        'Edge (pp)': win_rate - implied,
+        'Expected Wins': totals[:, _EXPECTED],
+        'Wins': totals[:, _WINS],
+        'Profit': totals[:, _PROFIT],
+        'Profit Low': profit_ci[:, 0],
+        'Profit High': profit_ci[:, 1],
+        'ROI': np.divide(100 * totals[:, _PROFIT], totals[:, _STAKE],
+                         out=np.full(n_bins, np.nan), where=totals[:, _STAKE] > 0),
+    })
+    return table[table['Bets'] > 0].reset_index(drop=True)
@@ -0,0 +1,144 @@
+import argparse
+import json
+import math
+import os
+import sys
+
+import pandas as pd
+
+from . import config
+from .ingest import read_ledger_csv
+from .ledger import concat_tabs, prepare_tab
+from .metrics import analyze
+from .sheets import build_csv_url, load_tabs
+from .transport import SheetTransport
+
+
+# Função para converter valores do pandas/numpy em tipos aceitos pelo JSON
+def _json_value(value):
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+# Função para converter um dataframe em lista de registros serializáveis
+def _records(df):
+    if df is None:
+        return None
+    return [
+        {key: _json_value(value) for key, value in row.items()}
+        for row in df.to_dict(orient='records')
+    ]
+
+
+# Função para carregar os ledgers informados (CSVs locais e/ou abas do Google Sheets)
+def load_sources(csv_paths=(), sheet_url=None, tabs=(), year=None):
+    ledgers, errors = {}, {}
+
+    for path in csv_paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            ledgers[name] = prepare_tab(read_ledger_csv(path), name, year=year)
+        except Exception as e:
+            errors[name] = e
+
+    if sheet_url and tabs:
+        transport = SheetTransport(
+            connect_timeout=config.HTTP_CONNECT_TIMEOUT, read_timeout=config.HTTP_READ_TIMEOUT,
+            retries=config.HTTP_RETRIES, backoff=config.HTTP_BACKOFF, pool_size=config.FETCH_WORKERS
+        )
+        try:
+            frames, tab_errors = load_tabs(
+                lambda name: prepare_tab(
+                    read_ledger_csv(transport.open(build_csv_url(sheet_url, name))), name, year=year
+                ),
+                list(tabs)
+            )
+        finally:
+            transport.close()
+        ledgers.update((name, frames[name]) for name in tabs if name in frames)
+        errors.update(tab_errors)
+
+    return ledgers, errors
+
+
+# Função para montar o relatório de vários ledgers
+def build_report(ledgers, combined=False):
+    analyses = {name: analyze(df) for name, df in ledgers.items()}
+    # Ledgers vazios (apenas o cabeçalho) não entram no combinado
+    frames = [df for df in ledgers.values() if len(df)]
+    if combined and len(ledgers) > 1 and frames:
+        # Ordem cronológica, para o saldo acumulado seguir de uma aba para a outra
+        # (ledgers sem nenhuma data ficam no fim)
+        frames.sort(key=lambda df: (df['Day'].isna().all(), df['Day'].min()))
+        analyses['ALL'] = analyze(concat_tabs(frames))
+    return analyses
+
+
+# Função para converter o relatório para JSON
+def report_to_json(analyses):
+    return {
+        name: {
+            'kpis': {key: _json_value(value) for key, value in analysis['kpis'].items()},
+            'markets': _records(analysis['markets']),
+            'daily': _records(analysis['daily']),
+        }
+        for name, analysis in analyses.items()
+    }
+
+
+# Função para gravar as séries diárias e os mercados de cada ledger em Parquet
+def write_parquet(analyses, directory):
+    os.makedirs(directory, exist_ok=True)
+    kpi_rows = []
+    for name, analysis in analyses.items():
+        kpi_rows.append({'Ledger': name, **analysis['kpis']})
+        for part in ('daily', 'markets'):
+            if analysis[part] is not None:
+                analysis[part].assign(Ledger=name).to_parquet(
+                    os.path.join(directory, f'{name}.{part}.parquet'), index=False
+                )
+    pd.DataFrame(kpi_rows).to_parquet(os.path.join(directory, 'kpis.parquet'), index=False)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m sbintelligence',
+        description='Compute dashboard metrics (KPIs, daily P/L, profit by market) for many ledgers.'
+    )
+    parser.add_argument('csv', nargs='*', help='local CSV files in the sheet layout (tab name taken from the file name)')
+    parser.add_argument('--sheet-url', help='Google Sheets URL to fetch tabs from')
+    parser.add_argument('--tabs', nargs='+', default=[], help='tab names to fetch from --sheet-url (e.g. Feb2025 Mar2025)')
+    parser.add_argument('--year', type=int, help='year used for the %%d/%%m dates (default: taken from the tab/file name)')
+    parser.add_argument('--combined', action='store_true', help='also report all ledgers combined as "ALL"')
+    parser.add_argument('--output', '-o', help='JSON report path (default: stdout)')
+    parser.add_argument('--parquet-dir', help='directory to write kpis/daily/markets Parquet files')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.csv and not (args.sheet_url and args.tabs):
+        print('Nenhum ledger informado: use arquivos CSV ou --sheet-url com --tabs.', file=sys.stderr)
+        return 2
+
+    ledgers, errors = load_sources(args.csv, args.sheet_url, args.tabs, year=args.year)
+    for name, error in errors.items():
+        print(f'Aviso: não foi possível carregar {name}: {error}', file=sys.stderr)
+
+    analyses = build_report(ledgers, combined=args.combined)
+    report = json.dumps(report_to_json(analyses), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report)
+    else:
+        print(report)
+
+    if args.parquet_dir:
+        write_parquet(analyses, args.parquet_dir)
+
+    return 1 if errors else 0
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+
+# Colunas em que float32 basta (odds e stakes com até 3 casas decimais); saldo, PnL e
+# variações continuam float64, pois são somados ao longo de todo o período
+FLOAT32_COLUMNS = ['Odds', 'Stake']
+
+# Colunas de texto (liga, mercado, resultado, tipster, aba...) viram categorias quando
+# os valores distintos são no máximo esta fração das linhas
+CATEGORY_MAX_RATIO = 0.5
+
+
+# Função para verificar se uma coluna numérica cabe em int32 sem perda
+def _fits_int32(values):
+    if values.dtype == np.int32 or values.isna().any():
+        return False
+    limits = np.iinfo(np.int32)
+    return bool(len(values) == 0 or (
+        (values % 1 == 0).all() and values.min() >= limits.min and values.max() <= limits.max
+    ))
+
+
+# Função para converter o ledger para tipos compactos (categorias, float32 e inteiros menores)
+def compact_ledger(df):
+    if df is None:
+        return None
+
+    converted = {}
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object:
+            if values.nunique(dropna=True) <= max(1, len(values) * CATEGORY_MAX_RATIO):
+                converted[col] = values.astype('category')
+        elif col in FLOAT32_COLUMNS and values.dtype == np.float64:
+            converted[col] = values.astype(np.float32)
+        elif col == 'ID' and pd.api.types.is_numeric_dtype(values.dtype) and _fits_int32(values):
+            converted[col] = values.astype(np.int32)
+
+    if not converted:
+        return df
+    return df.assign(**converted)
+
+
+# Função para calcular a memória (bytes) de um dataframe, incluindo o conteúdo dos textos
+def frame_bytes(df):
+    if df is None:
+        return 0
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+# Função para voltar aos tipos originais da leitura (texto como object, números em 64 bits)
+def expand_ledger(df):
+    expanded = {}
+    for col in df.columns:
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            expanded[col] = df[col].astype(object)
+        elif pd.api.types.is_float_dtype(dtype) and dtype.itemsize < 8:
+            expanded[col] = df[col].astype(np.float64)
+        elif pd.api.types.is_integer_dtype(dtype) and dtype.itemsize < 8:
+            expanded[col] = df[col].astype(np.int64)
+    return df.assign(**expanded) if expanded else df
+
+
+# Função para comparar, coluna a coluna, a memória do ledger nos tipos originais e compactos
+def memory_report(df):
+    original = expand_ledger(df)
+    compact = compact_ledger(original)
+    report = pd.DataFrame({
+        'Column': original.columns,
+        'Dtype': [str(dtype) for dtype in original.dtypes],
+        'Bytes': original.memory_usage(index=False, deep=True).to_numpy(),
+        'Compact Dtype': [str(dtype) for dtype in compact.dtypes],
+        'Compact Bytes': compact.memory_usage(index=False, deep=True).to_numpy(),
+    })
+    original_bytes = report['Bytes'].to_numpy(dtype='float64')
+    saved = original_bytes - report['Compact Bytes'].to_numpy(dtype='float64')
+    report['Saved %'] = np.divide(100 * saved, original_bytes,
+                                  out=np.zeros(len(report)), where=original_bytes > 0)
+    return report
@@ -0,0 +1,84 @@
+import os
+
+
+# Função para ler números das variáveis de ambiente com valor padrão
+def _env_float(name, default):
+    value = os.environ.get(name)
+    if value is None or value.strip() == '':
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+# Endereço base do Google Sheets (pode apontar para um servidor local de testes)
+SHEETS_BASE_URL = os.environ.get('SBI_SHEETS_BASE_URL', 'https://docs.google.com').rstrip('/')
+
+# Buscas HTTP: timeouts de conexão e de leitura (segundos), novas tentativas e espera base (segundos)
+HTTP_CONNECT_TIMEOUT = _env_float('SBI_HTTP_CONNECT_TIMEOUT', 3.05)
+HTTP_READ_TIMEOUT = _env_float('SBI_HTTP_READ_TIMEOUT', 20)
+HTTP_RETRIES = max(0, int(_env_float('SBI_HTTP_RETRIES', 3)))
+HTTP_BACKOFF = _env_float('SBI_HTTP_BACKOFF', 0.5)
+
+# Limite de memória das últimas cópias válidas das abas (revalidação e fallback) (MB)
+HTTP_CACHE_BYTES = int(_env_float('SBI_HTTP_CACHE_MB', 64) * 1024 * 1024)
+
+# Registro dos ledgers acompanhados (planilha, abas e rótulo de cada um)
+LEDGERS_FILE = os.environ.get('SBI_LEDGERS_FILE', 'ledgers.json')
+
+# Tempo de vida (segundos) das abas em cache
+CACHE_TTL = _env_float('SBI_CACHE_TTL', 300)
+
+# Limite de memória do cache compartilhado (MB)
+CACHE_MAX_BYTES = int(_env_float('SBI_CACHE_MAX_MB', 256) * 1024 * 1024)
+
+# Limite de memória do cache de arquivos exportados (MB)
+EXPORT_CACHE_BYTES = int(_env_float('SBI_EXPORT_CACHE_MB', 64) * 1024 * 1024)
+
+# Engine do pandas.read_csv: 'auto' usa pyarrow quando estiver instalado
+CSV_ENGINE = os.environ.get('SBI_CSV_ENGINE', 'auto')
+
+# Número máximo de abas buscadas em paralelo
+FETCH_WORKERS = max(1, int(_env_float('SBI_FETCH_WORKERS', 4)))
+
+# Diretório dos snapshots em disco das abas (vazio desativa)
+SNAPSHOT_DIR = os.environ.get('SBI_SNAPSHOT_DIR', '.sbi_snapshots')
+
+# Ler os snapshots com memory-map (1) ou carregando o arquivo inteiro (0)
+SNAPSHOT_MMAP = _env_float('SBI_SNAPSHOT_MMAP', 1) != 0
+
+# Sincronização incremental da aba do mês atual (1 ativa)
+DELTA_SYNC = _env_float('SBI_DELTA_SYNC', 0) != 0
+
+# Intervalo (segundos) entre recargas completas no modo incremental
+DELTA_FULL_RELOAD = _env_float('SBI_DELTA_FULL_RELOAD', 3600)
+
+# Modo ao vivo: intervalo (segundos) entre consultas da aba do mês atual
+LIVE_INTERVAL = max(5.0, _env_float('SBI_LIVE_INTERVAL', 30))
+
+# Modo ao vivo: segundos sem nenhuma sessão exibindo o modo até a consulta ser pausada
+LIVE_IDLE_TIMEOUT = _env_float('SBI_LIVE_IDLE_TIMEOUT', 300)
+
+# Gráfico de saldo: períodos a partir deste número de dias usam o modo de longo prazo (WebGL + LTTB)
+CHART_LONG_RANGE_DAYS = _env_float('SBI_CHART_LONG_RANGE_DAYS', 366)
+
+# Número máximo de pontos da linha de saldo no modo de longo prazo
+CHART_MAX_POINTS = max(3, int(_env_float('SBI_CHART_MAX_POINTS', 2000)))
+
+# Número de processos das simulações de Monte Carlo (1 executa no próprio processo)
+SIM_WORKERS = max(1, int(_env_float('SBI_SIM_WORKERS', min(4, os.cpu_count() or 1))))
+
+# Painel "Performance" na barra lateral (1 exibe) e logs JSON por execução (1 ativa)
+PERF_PANEL = _env_float('SBI_PERF_PANEL', 1) != 0
+PERF_LOG = _env_float('SBI_PERF_LOG', 1) != 0
+
+# Quantidade de execuções usadas no resumo p50/p95
+PERF_HISTORY = max(1, int(_env_float('SBI_PERF_HISTORY', 50)))
+
+# Aquecimento do processo (1 ativa): importa os módulos pesados e busca/converte o mês padrão
+# em segundo plano na primeira execução do dashboard
+WARMUP = _env_float('SBI_WARMUP', 0) != 0
+
+# Ações administrativas na barra lateral (1 ativa), como apagar todos os snapshots em disco
+ADMIN = _env_float('SBI_ADMIN', 0) != 0
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+
+from .settlement import MARKETS, WIN_WEIGHTS, market_codes, settle
+from .taxonomy import ODDS_BINS
+
+
+# Função para obter os códigos de uma coluna (-1 quando ausente/vazia) e os valores distintos
+# (colunas categóricas do ledger compacto usam os próprios códigos, na ordem das categorias)
+def _codes(df, col):
+    if col not in df.columns:
+        return np.full(len(df), -1, dtype=np.int64), []
+    if isinstance(df[col].dtype, pd.CategoricalDtype):
+        return df[col].cat.codes.to_numpy().astype(np.int64), list(df[col].cat.categories)
+    codes, uniques = pd.factorize(df[col])
+    return codes.astype(np.int64), list(uniques)
+
+
+# Função para obter o rótulo de cada código (posição 0 = valor ausente)
+def _labels(values, index):
+    return [values[i - 1] if i > 0 else None for i in index]
+
+
+# Cubo de agregados de um ledger: células dia × origem (ledger/aba) × família de mercado ×
+# resultado × faixa de odds, cada uma com medidas somáveis. KPIs, profit por mercado e P/L
+# diário de qualquer recorte de datas saem da soma das células, sem percorrer as apostas
+class AggregateCube:
+    def __init__(self, cells, sources, results, markets, flags):
+        self.cells = cells  # dict coluna -> array, ordenado pelo dia
+        self.sources = sources  # DataFrame (Ledger, Tab) por código de origem
+        self.results = results
+        self.markets = tuple(markets)
+        self.flags = flags  # colunas presentes no ledger (Balance, Stake, Results, Odds, Market)
+        self._base = None  # saldo antes do recorte, por origem (recortes do cubo)
+
+    @classmethod
+    def from_frame(cls, df, markets=MARKETS):
+        n = len(df)
+        days = df['Day'].dt.normalize().to_numpy()
+        day_values, day_codes = np.unique(days, return_inverse=True)
+
+        ledger_codes, ledgers = _codes(df, 'Ledger')
+        tab_codes, tabs = _codes(df, 'Tab')
+        source_values, source_codes = np.unique(
+            (ledger_codes + 1) * (len(tabs) + 1) + (tab_codes + 1), return_inverse=True
+        )
+        ledger_index, tab_index = np.divmod(source_values, len(tabs) + 1)
+        sources = pd.DataFrame({'Ledger': _labels(ledgers, ledger_index), 'Tab': _labels(tabs, tab_index)})
+
+        family_codes = market_codes(df['Market'], markets) if 'Market' in df.columns else np.full(n, -1)
+        result_codes, results = _codes(df, 'Results')
+        odds = df['Odds'].to_numpy(dtype='float64') if 'Odds' in df.columns else np.full(n, np.nan)
+        bucket_codes = np.digitize(odds, ODDS_BINS) - 1  # NaN cai na última posição
+        bucket_codes[np.isnan(odds)] = -1
+
+        # Chave única de cada célula (o dia é o componente mais significativo: células ordenadas pelo dia)
+        sizes = [len(source_values), len(markets) + 1, len(results) + 1, len(ODDS_BINS)]
+        key = day_codes.astype(np.int64)
+        for codes, size in zip([source_codes, family_codes + 1, result_codes + 1, bucket_codes + 1], sizes):
+            key = key * size + codes
+        cell_keys, cell_index = np.unique(key, return_inverse=True)
+
+        stake = np.nan_to_num(df['Stake'].to_numpy(dtype='float64')) if 'Stake' in df.columns else np.zeros(n)
+        pnl = df['PnL'] if 'PnL' in df.columns else settle(df)
+        delta = df['Balance_Delta'].to_numpy(dtype='float64') if 'Balance_Delta' in df.columns else np.zeros(n)
+        balance_rows = df['Balance'].notna().to_numpy() if 'Balance' in df.columns else np.zeros(n, dtype=bool)
+
+        def total(weights=None):
+            return np.bincount(cell_index, weights=weights, minlength=len(cell_keys))
+
+        cells = {}
+        rest = cell_keys
+        for name, size in zip(['Bucket', 'Result', 'Family', 'Source'], sizes[::-1]):
+            rest, codes = np.divmod(rest, size)
+            cells[name] = codes - (0 if name == 'Source' else 1)
+        cells['Day'] = day_values[rest]
+        cells.update({
+            'Bets': total().astype(np.int64),
+            'Stake': total(stake),
+            'PnL': total(np.nan_to_num(pnl.to_numpy(dtype='float64'))),
+            'Delta': total(np.nan_to_num(delta)),
+            'OddsSum': total(np.nan_to_num(odds)),
+            'OddsCount': total(~np.isnan(odds)).astype(np.int64),
+            'BalanceRows': total(balance_rows).astype(np.int64),
+        })
+
+        flags = {col: col in df.columns for col in ('Balance', 'Stake', 'Results', 'Odds', 'Market')}
+        return cls(cells, sources, results, markets, flags)
+
+    def __len__(self):
+        return len(self.cells['Day'])
+
+    def _subset(self, selector):
+        return AggregateCube(
+            {name: values[selector] for name, values in self.cells.items()},
+            self.sources, self.results, self.markets, self.flags
+        )
+
+    # Recorte de datas (mesmas regras de ledger.day_slice: fim inclusivo), por busca binária nas células
+    def slice(self, start=None, end=None):
+        days = self.cells['Day']
+        first, last = 0, len(days)
+        if start is not None:
+            first = np.searchsorted(days, np.datetime64(pd.Timestamp(start).normalize()), side='left')
+        if end is not None:
+            last = np.searchsorted(days, np.datetime64(pd.Timestamp(end).normalize()), side='right')
+        cube = self._subset(slice(first, last))
+        # Saldo acumulado de cada origem antes do recorte (abertura do gráfico de saldo)
+        cube._base = np.bincount(self.cells['Source'][:first], weights=self.cells['Delta'][:first],
+                                 minlength=len(self.sources))
+        return cube
+
+    # Recortes de cada ledger (na ordem das categorias do ledger)
+    def by_ledger(self):
+        ledgers = self.sources['Ledger'].to_numpy()
+        cell_ledgers = ledgers[self.cells['Source']]
+        views = {}
+        for label in pd.unique(ledgers):  # Origens em ordem de código: ledgers na ordem das categorias
+            if label is None or not (cell_ledgers == label).any():
+                continue
+            views[label] = self._subset(cell_ledgers == label)
+            views[label]._base = self._base
+        return views
+
+    def win_rate(self):
+        wins = valid = 0.0
+        counts = np.bincount(self.cells['Result'] + 1, weights=self.cells['Bets'],
+                             minlength=len(self.results) + 1)[1:]
+        for result, count in zip(self.results, counts):
+            win_weight, valid_weight = WIN_WEIGHTS.get(result, (0.0, 0.0))
+            wins += count * win_weight
+            valid += count * valid_weight
+        return float(wins / valid * 100) if valid > 0 else 0.0
+
+    # Mesmo formato de metrics.kpis (None quando não disponível)
+    def kpis(self):
+        cells = self.cells
+        has_balance = self.flags['Balance'] and cells['BalanceRows'].sum() > 0
+        profit = float(cells['Delta'].sum()) if has_balance else None
+        total_stakes = float(cells['Stake'].sum()) if self.flags['Stake'] else None
+        roi = None
+        if profit is not None and total_stakes is not None and total_stakes > 0:
+            roi = profit / total_stakes * 100
+        odds_count = cells['OddsCount'].sum()
+        return {
+            'bets': int(cells['Bets'].sum()),
+            'profit': profit,
+            'total_stakes': total_stakes,
+            'roi': roi,
+            'win_rate': self.win_rate() if self.flags['Results'] else None,
+            'avg_odds': float(cells['OddsSum'].sum() / odds_count) if self.flags['Odds'] and odds_count else None,
+        }
+
+    # Mesmo formato de settlement.market_breakdown
+    def market_breakdown(self):
+        groups = np.where(self.cells['Family'] >= 0, self.cells['Family'], len(self.markets))
+        size = len(self.markets) + 1
+        profit = np.bincount(groups, weights=self.cells['PnL'], minlength=size)[:len(self.markets)]
+        stake = np.bincount(groups, weights=self.cells['Stake'], minlength=size)[:len(self.markets)]
+        roi = np.divide(100 * profit, stake, out=np.full(len(self.markets), np.nan), where=stake > 0)
+        return pd.DataFrame({'Market': list(self.markets), 'Profit': profit, 'Stake': stake, 'ROI': roi})
+
+    # Mesmo formato de daily.daily_balance(daily.graph_balance(recorte)): último saldo, stake e lucro de cada dia
+    def daily(self):
+        cells = self.cells
+        days, day_index = np.unique(cells['Day'], return_inverse=True)
+        delta = np.bincount(day_index, weights=cells['Delta'], minlength=len(days))
+        stake = np.bincount(day_index, weights=cells['Stake'], minlength=len(days))
+        balance_rows = np.bincount(day_index, weights=cells['BalanceRows'], minlength=len(days))
+
+        # Uma única origem: saldo da própria aba (abertura = saldo antes do recorte);
+        # várias origens: saldo contínuo a partir do início do recorte
+        sources = np.unique(cells['Source'][cells['Bets'] > 0])
+        opening = 0.0
+        if len(sources) == 1 and self._base is not None:
+            opening = float(self._base[sources[0]])
+
+        keep = balance_rows > 0
+        return pd.DataFrame({
+            'Day': days[keep],
+            'Balance': (opening + np.cumsum(delta))[keep],
+            'Stake': stake[keep],
+            'Daily_Profit': delta[keep],
+        })
+
+
+# Função para montar o cubo de agregados de um ledger
+def build_cube(df, markets=MARKETS):
+    return AggregateCube.from_frame(df, markets)
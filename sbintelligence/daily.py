@@ -0,0 +1,51 @@
+import pandas as pd
+
+from .ledger import running_balance
+
+
+# Função para agregar o saldo por dia (último Balance do dia e soma das stakes)
+def daily_balance(df):
+    df = df.dropna(subset=['Day', 'Balance'])
+    days = df['Day'].dt.normalize()
+
+    daily = df.groupby(days.rename('Day'), sort=True).agg(
+        Balance=('Balance', 'last'),
+        Stake=('Stake', 'sum'),
+    ).reset_index()
+
+    # Lucro do dia = saldo do dia - saldo do dia anterior (primeiro dia = saldo - saldo de abertura;
+    # a abertura é zero no início da aba e o saldo anterior quando o recorte começa no meio dela)
+    daily_profit = daily['Balance'].diff()
+    if len(daily):
+        opening = 0.0
+        if 'Balance_Delta' in df.columns:
+            opening = df['Balance'].iloc[0] - df['Balance_Delta'].iloc[0]
+        daily_profit.iloc[0] = daily['Balance'].iloc[0] - opening
+    daily['Daily_Profit'] = daily_profit
+    return daily
+
+
+# Função para completar o calendário (do primeiro ao último mês com apostas, ou do início ao fim informados)
+def complete_days(daily, start=None, end=None):
+    first_day = pd.Timestamp(start) if start is not None else daily['Day'].min().replace(day=1)
+    last_day = pd.Timestamp(end) if end is not None else daily['Day'].max() + pd.offsets.MonthEnd(0)
+    full_date_range = pd.date_range(start=first_day, end=last_day, freq='D', name='Day')
+
+    df_complete = daily.set_index('Day').reindex(full_date_range).reset_index()
+
+    # Forward fill para a coluna Balance (propagar o último valor conhecido)
+    df_complete['Balance'] = df_complete['Balance'].ffill()
+
+    # Para Daily_Profit, dias sem apostas ficam como zero
+    df_complete['Daily_Profit'] = df_complete['Daily_Profit'].fillna(0)
+    return df_complete
+
+
+# Função para obter as linhas usadas no gráfico de saldo
+def graph_balance(df):
+    df_graph = df.dropna(subset=['Day', 'Balance']).copy()
+
+    # Com várias abas (ou vários ledgers), o saldo é acumulado de uma aba para a outra
+    if any(col in df.columns and df[col].nunique() > 1 for col in ('Tab', 'Ledger')):
+        df_graph['Balance'] = running_balance(df).loc[df_graph.index]
+    return df_graph
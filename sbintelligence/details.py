@@ -0,0 +1,87 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from .ledger import source_columns
+
+
+# Cores de cada resultado na tabela "Betting Details"
+RESULT_STYLES = {
+    'Red': 'color: #FF4C4C; font-weight: bold;',
+    'Red/void': 'color: #FF9999; font-weight: bold;',
+    'Void': 'color: #FFD700; font-weight: bold;',
+    'Green/void': 'color: #90EE90; font-weight: bold;',
+    'Green': 'color: #008000; font-weight: bold;'
+}
+
+# Colunas pesquisadas pelo filtro de texto da tabela
+SEARCH_COLUMNS = ['League', 'Match', 'Market', 'Tip', 'Tipster', 'Notes']
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+# Função para montar a tabela de detalhes (colunas B à M, mais recentes primeiro)
+def format_details(df):
+    # Selecionar colunas da B à M (índices 1 a 12)
+    df_detailed = source_columns(df).iloc[:, 1:13].copy()
+
+    # Os números continuam numéricos: a formatação (casas decimais, dd/mm) é feita na exibição
+    df_detailed['Day'] = pd.to_datetime(df_detailed['Day'])
+    df_detailed['Balance'] = df_detailed['Balance'].astype(float).round(2)
+    df_detailed['Stake'] = df_detailed['Stake'].astype(float).round(2)
+    df_detailed['Odds'] = df_detailed['Odds'].astype(float).round(3)
+
+    # Ordenar o DataFrame
+    return df_detailed.iloc[::-1]
+
+
+# Função para filtrar a tabela de detalhes por resultado e por texto
+def filter_details(df_detailed, results=None, search=None):
+    mask = np.ones(len(df_detailed), dtype=bool)
+
+    if results:
+        mask &= df_detailed['Results'].isin(results).to_numpy()
+
+    if search and search.strip():
+        found = np.zeros(len(df_detailed), dtype=bool)
+        for column in SEARCH_COLUMNS:
+            if column in df_detailed.columns:
+                found |= df_detailed[column].astype(str).str.contains(
+                    search.strip(), case=False, regex=False, na=False
+                ).to_numpy()
+        mask &= found
+
+    return df_detailed[mask] if not mask.all() else df_detailed
+
+
+# Função para ordenar a tabela de detalhes (sem coluna, mantém os mais recentes primeiro)
+def sort_details(df_detailed, column=None, ascending=True):
+    if not column or column not in df_detailed.columns:
+        return df_detailed
+    return df_detailed.sort_values(column, ascending=ascending, kind='stable', na_position='last')
+
+
+# Função para calcular o número de páginas da tabela (ao menos uma)
+def page_count(n_rows, page_size):
+    return max(1, math.ceil(n_rows / page_size))
+
+
+# Função para obter uma página da tabela (a página é ajustada ao intervalo válido)
+def paginate(df_detailed, page, page_size):
+    page = min(max(int(page), 1), page_count(len(df_detailed), page_size))
+    start = (page - 1) * page_size
+    return df_detailed.iloc[start:start + page_size]
+
+
+# Função para obter o estilo de cada resultado (calculado uma vez por valor distinto)
+def result_styles(results):
+    codes, uniques = pd.factorize(results)
+    styles = np.array([RESULT_STYLES.get(value, '') for value in uniques] + [''], dtype=object)
+    return pd.Series(styles[codes], index=results.index)
+
+
+# Função para aplicar as cores dos resultados na tabela de detalhes
+def style_details(df_detailed):
+    result_columns = [col for col in df_detailed.columns if col.lower() in ['results', 'resultado']]
+    return df_detailed.style.apply(result_styles, subset=result_columns[:1])
@@ -0,0 +1,36 @@
+import numpy as np
+
+
+# Função para reduzir uma série com Largest-Triangle-Three-Buckets (preserva picos e quedas)
+def lttb(x, y, n_out):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # O primeiro e o último ponto são mantidos; o meio é dividido em n_out - 2 blocos
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Ponto de referência: média do próximo bloco (no último bloco, o ponto final)
+        if i == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_end = edges[i + 2]
+            next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+
+        # Escolher o ponto do bloco que forma o maior triângulo com o anterior e a referência
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        keep[i + 1] = previous
+
+    return keep
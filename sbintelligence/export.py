@@ -0,0 +1,83 @@
+import gzip
+import importlib.util
+import io
+
+
+# Formatos de exportação: rótulo -> (extensão, MIME, módulos opcionais necessários)
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv', ()),
+    'CSV (gzip)': ('csv.gz', 'application/gzip', ()),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet', ('pyarrow',)),
+    'Excel': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+              ('openpyxl',)),
+}
+
+# Linhas serializadas por vez (limita os temporários da conversão; o arquivo final fica inteiro em memória)
+CHUNK_ROWS = 50_000
+
+
+# Função para listar os formatos cujas dependências opcionais estão instaladas
+def available_formats():
+    return [
+        label for label, (_, _, modules) in EXPORT_FORMATS.items()
+        if all(importlib.util.find_spec(module) is not None for module in modules)
+    ]
+
+
+# Função para obter o nome do arquivo e o MIME de um formato
+def export_file(label, base_name='betting_data'):
+    extension, mime, _ = EXPORT_FORMATS[label]
+    return f'{base_name}.{extension}', mime
+
+
+# Função para escrever o CSV em blocos num fluxo binário
+def _write_csv(df, stream):
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='', write_through=True)
+    try:
+        for start in range(0, max(len(df), 1), CHUNK_ROWS):
+            df.iloc[start:start + CHUNK_ROWS].to_csv(text, index=False, header=start == 0)
+        text.flush()
+    finally:
+        text.detach()
+
+
+# Função para escrever o Parquet em row groups (um bloco convertido por vez)
+def _write_parquet(df, stream):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(stream, schema) as writer:
+        for start in range(0, max(len(df), 1), CHUNK_ROWS):
+            chunk = df.iloc[start:start + CHUNK_ROWS]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+# Função para escrever a planilha Excel em blocos (mesma aba, continuando da última linha)
+def _write_excel(df, stream):
+    import pandas as pd
+
+    with pd.ExcelWriter(stream, engine='openpyxl') as writer:
+        for start in range(0, max(len(df), 1), CHUNK_ROWS):
+            df.iloc[start:start + CHUNK_ROWS].to_excel(
+                writer, sheet_name='Bets', index=False,
+                header=start == 0, startrow=start + 1 if start else 0
+            )
+
+
+# Função para gerar o arquivo de exportação de um dataframe no formato pedido. O conteúdo completo é
+# devolvido em bytes: o botão de download e o cache de exportações precisam do arquivo inteiro
+def export_bytes(df, label):
+    stream = io.BytesIO()
+    if label == 'CSV':
+        _write_csv(df, stream)
+    elif label == 'CSV (gzip)':
+        with gzip.GzipFile(fileobj=stream, mode='wb', compresslevel=6, mtime=0) as compressed:
+            _write_csv(df, compressed)
+    elif label == 'Parquet':
+        _write_parquet(df, stream)
+    elif label == 'Excel':
+        _write_excel(df, stream)
+    else:
+        raise ValueError(f'Formato de exportação desconhecido: {label}')
+    return stream.getvalue()
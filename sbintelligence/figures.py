@@ -0,0 +1,568 @@
+import numpy as np
+import pandas as pd
+
+from .daily import complete_days, daily_balance, graph_balance
+from .downsample import lttb
+from .risk import drawdown_series, equity_curve, rolling_returns
+
+# O plotly é importado dentro de cada função: o módulo carrega sem ele (início da página mais rápido)
+# e o custo do import fica para o primeiro gráfico
+
+
+# Paleta do gráfico de pizza (uma cor por mercado)
+MARKET_PALETTE = ['#0077B6', '#00B4D8', '#48CAE4', '#90E0EF']
+
+# Agrupamentos das barras de P/L no modo de longo prazo (do mais fino para o mais grosso)
+BAR_FREQUENCIES = [
+    ('D', 'Daily P/L'),
+    ('W', 'Weekly P/L'),
+    ('MS', 'Monthly P/L'),
+    ('QS', 'Quarterly P/L'),
+    ('YS', 'Yearly P/L'),
+]
+
+
+# Função para obter a cor de cada barra de P/L (verde, vermelho ou transparente)
+def profit_colors(values):
+    values = np.asarray(values, dtype=float)
+    return np.where(values > 0, '#51cf66', np.where(values < 0, '#ff6b6b', 'rgba(0,0,0,0)'))
+
+
+# Função para calcular o intervalo do eixo y (inclui o zero e folga de 10%)
+def _value_range(*series):
+    low = min((s.min() * 1.1 for s in series if not pd.isna(s.min())), default=0)
+    high = max((s.max() * 1.1 for s in series if not pd.isna(s.max())), default=0)
+    return [min(0, low), max(0, high)]
+
+
+# Função para montar as séries do gráfico de saldo (dias completos e linha de saldo)
+def balance_frames(df, start=None, end=None):
+    # Create a copy and remove NaNs (saldo acumulado entre abas quando houver várias)
+    df_graph = graph_balance(df)
+
+    # Get the last Balance recorded per day (lucro diário pela diferença entre saldos)
+    return daily_frames(daily_balance(df_graph), start, end)
+
+
+# Função para montar os dados do gráfico de saldo a partir do saldo diário
+# (daily.daily_balance ou AggregateCube.daily)
+def daily_frames(df_last_balance, start=None, end=None):
+    # Get month name for title (um valor por dia com aposta)
+    unique_months = df_last_balance['Day'].dt.strftime('%B').unique()
+    month_title = unique_months[0] if len(unique_months) == 1 else "Multiple Months"
+
+    # Pegue o último dia com aposta para limitar a spline
+    last_day_with_bet = df_last_balance['Day'].max()
+
+    # Create complete DataFrame com todos os dias dos meses exibidos (ou do intervalo escolhido)
+    df_complete = complete_days(df_last_balance, start, end)
+
+    # Criar dataframe separado para a linha de saldo (apenas até o último dia com aposta)
+    df_balance_line = df_complete[df_complete['Day'] <= last_day_with_bet].copy()
+    return df_complete, df_balance_line, month_title
+
+
+# Função para montar o gráfico de evolução do saldo (barras diárias e linha de saldo)
+def balance_figure(df_complete, df_balance_line, month_title, multiple_months=False):
+    import plotly.graph_objects as go
+
+    fig_balance = go.Figure()
+
+    # Add daily profit/loss bars para todos os dias
+    fig_balance.add_trace(
+        go.Bar(
+            x=df_complete['Day'],
+            y=df_complete['Daily_Profit'],
+            name='Daily P/L',
+            marker_color=profit_colors(df_complete['Daily_Profit']),
+            opacity=0.7,
+            hovertemplate='<b>Daily P/L</b>: %{y:.2f}<extra></extra>'
+        )
+    )
+
+    # Add spline curve for cumulative balance (apenas até o último dia com aposta)
+    fig_balance.add_trace(
+        go.Scatter(
+            x=df_balance_line['Day'],
+            y=df_balance_line['Balance'],
+            name='Balance',
+            line=dict(shape='spline', smoothing=0.3, width=3, color='#1f77b4'),
+            mode='lines',
+            hovertemplate='<b>Balance</b>: %{y:.2f}<extra></extra>'
+        )
+    )
+
+    # Update layout
+    fig_balance.update_layout(
+        title=dict(
+            text=f'{month_title}',
+            x=0.5,
+            font=dict(size=24)
+        ),
+        xaxis=dict(
+            tickformat="%d/%m" if multiple_months else "%d",
+            dtick=None if multiple_months else "D1",
+            title='Day',
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)',
+            gridwidth=1
+        ),
+        yaxis=dict(
+            title='Balance / Daily P&L',
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)',
+            gridwidth=1,
+            range=[
+                min(
+                    0,
+                    df_complete['Daily_Profit'].min() * 1.1 if not pd.isna(df_complete['Daily_Profit'].min()) else 0
+                ),
+                max(
+                    df_complete['Balance'].max() * 1.1 if not pd.isna(df_complete['Balance'].max()) else 0,
+                    df_complete['Daily_Profit'].max() * 1.1 if not pd.isna(df_complete['Daily_Profit'].max()) else 0
+                )
+            ]
+        ),
+        height=600,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        hovermode='x unified',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_balance
+
+
+# Função para montar as séries do modo de longo prazo (linha reduzida por LTTB e barras agrupadas)
+def long_range_frames(df, start=None, end=None, resolution='Daily', max_points=2000, max_bars=400):
+    # Saldo contínuo e lucro diário calculados no período inteiro, antes de aplicar o zoom
+    df_graph = graph_balance(df)
+    daily = daily_balance(df_graph)
+    if resolution == 'Per bet':
+        line = df_graph[['Day', 'Balance']]
+    else:
+        line = daily[['Day', 'Balance']]
+
+    # Zoom: apenas o intervalo escolhido é reduzido (mais detalhe quanto menor o intervalo)
+    if start is not None:
+        line = line[line['Day'] >= start]
+        daily = daily[daily['Day'] >= start]
+    if end is not None:
+        line = line[line['Day'] <= end]
+        daily = daily[daily['Day'] <= end]
+
+    keep = lttb(np.arange(len(line)), line['Balance'].to_numpy(), max_points)
+    line = line.iloc[keep]
+
+    # Barras de P/L no agrupamento mais fino que caiba no limite de barras
+    profit = daily.set_index('Day')['Daily_Profit']
+    for freq, bar_label in BAR_FREQUENCIES:
+        bars = profit.resample(freq).sum()
+        if len(bars) <= max_bars:
+            break
+    return line, bars.rename('Profit').reset_index(), bar_label
+
+
+# Função para montar o gráfico de saldo no modo de longo prazo (WebGL e tamanho limitado)
+def long_range_figure(line, bars, bar_label, title="Balance"):
+    import plotly.graph_objects as go
+
+    fig_balance = go.Figure()
+
+    fig_balance.add_trace(
+        go.Bar(
+            x=bars['Day'],
+            y=bars['Profit'],
+            name=bar_label,
+            marker_color=profit_colors(bars['Profit']),
+            opacity=0.7,
+            hovertemplate=f'<b>{bar_label}</b>: %{{y:.2f}}<extra></extra>'
+        )
+    )
+
+    # Scattergl desenha a linha em WebGL (sem spline, que não é suportada pelo WebGL)
+    fig_balance.add_trace(
+        go.Scattergl(
+            x=line['Day'],
+            y=line['Balance'],
+            name='Balance',
+            line=dict(width=2, color='#1f77b4'),
+            mode='lines',
+            hovertemplate='<b>Balance</b>: %{y:.2f}<extra></extra>'
+        )
+    )
+
+    fig_balance.update_layout(
+        title=dict(
+            text=title,
+            x=0.5,
+            font=dict(size=24)
+        ),
+        xaxis=dict(
+            tickformat="%d/%m/%Y",
+            title='Day',
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)',
+            gridwidth=1
+        ),
+        yaxis=dict(
+            title='Balance / P&L',
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)',
+            gridwidth=1,
+            range=_value_range(bars['Profit'], line['Balance'])
+        ),
+        height=600,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        hovermode='x unified',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_balance
+
+
+# Função para montar as séries de risco (drawdown e ROI/yield móveis), reduzidas por LTTB
+def risk_frames(df, window, max_points=2000):
+    drawdown = -drawdown_series(equity_curve(df))
+    underwater = pd.DataFrame({'Bet': np.arange(len(drawdown)), 'Drawdown': drawdown})
+    underwater = underwater.iloc[lttb(underwater['Bet'], underwater['Drawdown'], max_points)]
+
+    rolling = rolling_returns(df, window).dropna(subset=['ROI'])
+    rolling = rolling.iloc[lttb(rolling['Bet'], rolling['ROI'], max_points)]
+    return underwater, rolling
+
+
+# Função para montar o gráfico de drawdown (distância até o maior saldo anterior, por aposta)
+def drawdown_figure(underwater):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        go.Scattergl(
+            x=underwater['Bet'],
+            y=underwater['Drawdown'],
+            name='Drawdown',
+            fill='tozeroy',
+            line=dict(width=1, color='#ff6b6b'),
+            mode='lines',
+            hovertemplate='<b>Bet %{x}</b><br>Drawdown: %{y:.2f}<extra></extra>'
+        )
+    )
+    fig.update_layout(
+        title=dict(text='Drawdown', x=0.5, font=dict(size=20)),
+        xaxis=dict(title='Bet', showgrid=True, gridcolor='rgba(255,255,255,0.1)'),
+        yaxis=dict(title='R$', showgrid=True, gridcolor='rgba(255,255,255,0.1)'),
+        height=350,
+        showlegend=False,
+        margin=dict(t=50, b=0),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+# Função para montar o gráfico de ROI e yield das últimas N apostas
+def rolling_figure(rolling, window):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for column, color in (('ROI', '#1f77b4'), ('Yield', '#00B4D8')):
+        fig.add_trace(
+            go.Scattergl(
+                x=rolling['Bet'],
+                y=rolling[column],
+                name=column,
+                line=dict(width=2, color=color),
+                mode='lines',
+                hovertemplate=f'<b>{column}</b>: %{{y:.1f}}%<extra></extra>'
+            )
+        )
+    fig.add_hline(y=0, line=dict(color='rgba(255,255,255,0.3)', width=1))
+    fig.update_layout(
+        title=dict(text=f'Rolling ROI / Yield ({window} bets)', x=0.5, font=dict(size=20)),
+        xaxis=dict(title='Bet', showgrid=True, gridcolor='rgba(255,255,255,0.1)'),
+        yaxis=dict(title='%', showgrid=True, gridcolor='rgba(255,255,255,0.1)'),
+        height=350,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hovermode='x unified',
+        margin=dict(t=50, b=0),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+# Função para montar o gráfico em leque da projeção (faixas de percentis a partir do saldo atual)
+def projection_figure(bands, start_balance=0.0):
+    import plotly.graph_objects as go
+
+    start = pd.DataFrame({col: [0 if col == 'Bet' else 0.0] for col in bands.columns})
+    bands = pd.concat([start, bands], ignore_index=True)
+    levels = bands.drop(columns=['Bet']) + start_balance
+
+    fig = go.Figure()
+    # Faixas externas (P5-P95) e internas (P25-P75): a segunda linha de cada par preenche até a primeira
+    for low, high, opacity in (('P5', 'P95', 0.15), ('P25', 'P75', 0.3)):
+        fig.add_trace(go.Scatter(
+            x=bands['Bet'], y=levels[low], mode='lines', line=dict(width=0),
+            showlegend=False, hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=bands['Bet'], y=levels[high], mode='lines', line=dict(width=0),
+            fill='tonexty', fillcolor=f'rgba(31,119,180,{opacity})',
+            name=f'{low}–{high}', hoverinfo='skip'
+        ))
+    fig.add_trace(go.Scatter(
+        x=bands['Bet'], y=levels['P50'], mode='lines', name='Median',
+        line=dict(width=3, color='#1f77b4'),
+        hovertemplate='<b>Bet %{x}</b><br>Median: %{y:.2f}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=dict(text='Projection', x=0.5, font=dict(size=24)),
+        xaxis=dict(title='Bets ahead', showgrid=True, gridcolor='rgba(255,255,255,0.1)'),
+        yaxis=dict(title='Balance', showgrid=True, gridcolor='rgba(255,255,255,0.1)'),
+        height=600,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hovermode='x unified',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+# Função para montar o gráfico de profit por agrupamento (família, linha, liga, tipster...)
+def breakdown_figure(grouped, dimension):
+    import plotly.graph_objects as go
+
+    labels = grouped[dimension].astype(str)
+    fig = go.Figure(
+        go.Bar(
+            x=grouped['Profit'],
+            y=labels,
+            orientation='h',
+            marker_color=np.where(grouped['Profit'] < 0, '#ff6b6b', '#51cf66'),
+            customdata=grouped[['Bets', 'ROI', 'Win Rate']],
+            hovertemplate=(
+                '<b>%{y}</b><br>Profit: %{x:.2f}<br>Bets: %{customdata[0]}'
+                '<br>ROI: %{customdata[1]:.1f}%<br>Win Rate: %{customdata[2]:.1f}%<extra></extra>'
+            )
+        )
+    )
+    fig.update_layout(
+        title=dict(text=f'Profit by {dimension}', x=0.5, font=dict(size=20)),
+        xaxis_title="Profit",
+        yaxis=dict(title="", type='category', autorange='reversed'),
+        height=max(250, 40 + 28 * len(grouped)),
+        showlegend=False,
+        margin=dict(t=50, b=0),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+# Função para montar o gráfico de calibração: probabilidade implícita × taxa de acerto por faixa de
+# odds, com o intervalo de confiança e a diagonal (pontos acima dela = acerto acima do implícito)
+def calibration_figure(table):
+    import plotly.graph_objects as go
+
+    upper = float(np.nanmax(np.concatenate([table['Implied %'], table['Win Rate High'], [0.0]]))) + 5
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=[0, upper], y=[0, upper], mode='lines', line=dict(color='gray', dash='dot'), hoverinfo='skip'
+    ))
+    fig.add_trace(go.Scatter(
+        x=table['Implied %'],
+        y=table['Win Rate %'],
+        mode='markers+text',
+        text=table['Odds bucket'].astype(str),
+        textposition='top center',
+        marker=dict(size=10, color=np.where(table['Edge (pp)'] < 0, '#ff6b6b', '#51cf66')),
+        error_y=dict(
+            type='data', symmetric=False,
+            array=table['Win Rate High'] - table['Win Rate %'],
+            arrayminus=table['Win Rate %'] - table['Win Rate Low']
+        ),
+        customdata=table[['Bets', 'Edge (pp)', 'Win Rate Low', 'Win Rate High']],
+        hovertemplate=(
+            '<b>%{text}</b><br>Implied: %{x:.1f}%<br>Win Rate: %{y:.1f}%'
+            ' (%{customdata[2]:.1f}–%{customdata[3]:.1f})<br>Edge: %{customdata[1]:+.1f} pp'
+            '<br>Bets: %{customdata[0]}<extra></extra>'
+        )
+    ))
+    fig.update_layout(
+        title=dict(text='Implied vs Actual Win Rate', x=0.5, font=dict(size=20)),
+        xaxis=dict(title="Implied probability (%)", range=[0, upper]),
+        yaxis=dict(title="Win Rate (%)", range=[0, upper]),
+        height=400,
+        showlegend=False,
+        margin=dict(t=50, b=0),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+# Função para montar o gráfico de profit por faixa de odds com o intervalo de confiança
+# (o profit esperado na probabilidade implícita é zero)
+def calibration_profit_figure(table):
+    import plotly.graph_objects as go
+
+    labels = table['Odds bucket'].astype(str)
+    fig = go.Figure(
+        go.Bar(
+            x=labels,
+            y=table['Profit'],
+            marker_color=np.where(table['Profit'] < 0, '#ff6b6b', '#51cf66'),
+            error_y=dict(
+                type='data', symmetric=False,
+                array=table['Profit High'] - table['Profit'],
+                arrayminus=table['Profit'] - table['Profit Low']
+            ),
+            customdata=table[['Bets', 'ROI', 'Profit Low', 'Profit High']],
+            hovertemplate=(
+                '<b>%{x}</b><br>Profit: %{y:.2f} (%{customdata[2]:.2f} a %{customdata[3]:.2f})'
+                '<br>ROI: %{customdata[1]:.1f}%<br>Bets: %{customdata[0]}<extra></extra>'
+            )
+        )
+    )
+    fig.add_hline(y=0, line=dict(color='gray', dash='dot'))
+    fig.update_layout(
+        title=dict(text='Actual vs Expected Profit by Odds', x=0.5, font=dict(size=20)),
+        xaxis=dict(title="", type='category'),
+        yaxis_title="Profit",
+        height=400,
+        showlegend=False,
+        margin=dict(t=50, b=0),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+# Função para montar o gráfico de profit por mercado comparando ledgers (barras agrupadas por ledger)
+def ledger_market_figure(df_profits):
+    import plotly.express as px
+
+    fig = px.bar(
+        df_profits,
+        x='Profit',
+        y='Market',
+        color='Ledger',
+        barmode='group',
+        orientation='h',
+        custom_data=['ROI'],
+        title='Profit by Market'
+    )
+    fig.update_traces(
+        hovertemplate="<b>%{y}</b><br>Profit: %{x:.2f}<br>ROI: %{customdata[0]:.2f}%<extra></extra>"
+    )
+    fig.update_layout(
+        title=dict(
+            text='Profit by Market',
+            x=0.5,
+            y=0.95,
+            xanchor='center',
+            yanchor='top'
+        ),
+        title_font=dict(size=24),
+        legend=dict(orientation="h", yanchor="top", y=-0.2, x=0.5, xanchor="center", title_text=""),
+        xaxis_title="Profit",
+        yaxis_title="",
+        height=300,
+        margin=dict(b=0, t=40)
+    )
+    return fig
+
+
+# Função para montar o gráfico de profit por mercado ("Bar Chart" ou "Pie Chart")
+def market_figure(df_profits, chart_type="Bar Chart"):
+    import plotly.express as px
+
+    if chart_type == "Bar Chart":
+        # Criar gráfico de barras horizontais
+        fig = px.bar(
+            df_profits,
+            x='Profit',
+            y='Market',
+            orientation='h',
+            title='Profit by Market'
+        )
+
+        # Definir cores baseadas no sinal do profit
+        fig.update_traces(
+            marker_color=np.where(df_profits['Profit'] < 0, '#ff6b6b', '#51cf66')
+        )
+
+        # Ajustar layout
+        fig.update_layout(
+            title=dict(
+                text='Profit by Market',
+                x=0.5,
+                y=0.95,
+                xanchor='center',
+                yanchor='top'
+            ),
+            title_font=dict(size=24),
+            showlegend=False,
+            xaxis_title="Profit",
+            yaxis_title="",
+            height=250,
+            margin=dict(b=0, t=40)
+        )
+        return fig
+
+    # Gráfico de Pizza: usar valor absoluto para tamanho dos segmentos
+    df_pie = df_profits.assign(AbsProfit=df_profits['Profit'].abs())
+
+    fig = px.pie(
+        df_pie,
+        values='AbsProfit',
+        names='Market',
+        title='Profit by Market',
+        color='Market',  # Usar Market como base para as cores
+        color_discrete_sequence=MARKET_PALETTE
+    )
+
+    # Ajustar layout
+    fig.update_layout(
+        title=dict(
+            text='Profit by Market',
+            x=0.5,
+            y=0.95,
+            xanchor='center',
+            yanchor='top'
+        ),
+        title_font=dict(size=24),
+        showlegend=False,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="right",
+            x=1.2
+        ),
+        height=250,
+        margin=dict(b=0, t=40)
+    )
+
+    # Ajustar o formato dos valores no hover e text
+    fig.update_traces(
+        texttemplate="<b>%{label}</b><br>%{customdata[0]:.2f}",
+        customdata=df_pie[['Profit']],
+        hovertemplate="<b>%{label}</b><br>%{customdata[0]:.2f}<br>%{percent}<extra></extra>"
+    )
+    return fig
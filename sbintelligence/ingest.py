@@ -0,0 +1,112 @@
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from . import config
+
+
+# Colunas numéricas da planilha (valores como "R$ 1.234,56" ou "1,85")
+NUMERIC_COLUMNS = ['Balance', 'Odds', 'Stake']
+
+# Esquema explícito de leitura: as colunas tratadas aqui chegam sempre como texto
+CSV_DTYPES = {
+    'Day': 'object',
+    'Market': 'object',
+    'Results': 'object',
+    'Balance': 'object',
+    'Odds': 'object',
+    'Stake': 'object',
+}
+
+
+# Função para escolher o engine do read_csv ('pyarrow' quando disponível)
+def resolve_csv_engine(engine=None):
+    engine = engine or config.CSV_ENGINE
+    if engine != 'auto':
+        return engine
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return 'c'
+    return 'pyarrow'
+
+
+# Função para obter o ano a partir do nome da aba (ex.: "Feb2025" -> 2025)
+def year_from_tab(sheet_name, default=None):
+    if sheet_name:
+        years = re.findall(r'(?<!\d)(\d{4})(?!\d)', str(sheet_name))
+        if years:
+            return int(years[-1])
+    return default if default is not None else datetime.now().year
+
+
+# Função para limpar o texto de valores numéricos ("R$ 1,5" -> "1.5")
+def _clean_numeric_text(text):
+    return (
+        text.str.replace('R$', '', regex=False)
+            .str.replace(' ', '', regex=False)
+            .str.replace(',', '.', regex=False)
+    )
+
+
+# Função para converter uma coluna de valores monetários/decimais para float
+def parse_numeric(values):
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype('float64')
+
+    # Convertemos apenas os valores distintos (stakes e odds se repetem muito)
+    codes, uniques = pd.factorize(values)
+    parsed = np.full(len(values), np.nan)
+    if len(uniques):
+        text = _clean_numeric_text(pd.Series(uniques, dtype=object).astype(str))
+        unique_values = pd.to_numeric(text, errors='coerce').to_numpy('float64')
+        valid = codes >= 0
+        parsed[valid] = unique_values[codes[valid]]
+    return pd.Series(parsed, index=values.index, name=values.name)
+
+
+# Função para converter datas "%d/%m" usando o ano da aba
+def parse_day(values, year):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    text = values.astype(str) + f'/{int(year)}'
+    return pd.to_datetime(text, format='%d/%m/%Y', errors='coerce')
+
+
+# Função para converter as colunas numéricas e de data em uma única passada
+def parse_ledger(df, year=None):
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = parse_numeric(df[col])
+
+    if 'Day' in df.columns:
+        df['Day'] = parse_day(df['Day'], year if year is not None else datetime.now().year)
+        # Apostas sem data válida ficam fora; o recorte vira um ledger próprio (as colunas
+        # calculadas depois são adicionadas nele, sem Copy-on-Write global)
+        missing = df['Day'].isna()
+        if missing.any():
+            df = df[~missing].copy()
+
+    return df
+
+
+# Função para ler o CSV de uma aba com o esquema de tipos explícito
+def read_ledger_csv(source, engine=None):
+    engine = resolve_csv_engine(engine)
+    try:
+        return pd.read_csv(source, dtype=CSV_DTYPES, engine=engine)
+    except ImportError:
+        if engine != 'pyarrow':
+            raise
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return pd.read_csv(source, dtype=CSV_DTYPES)
+
+
+# Função para ler e converter uma aba da planilha
+def load_ledger_csv(source, sheet_name=None, year=None, engine=None):
+    if year is None:
+        year = year_from_tab(sheet_name)
+    return parse_ledger(read_ledger_csv(source, engine=engine), year=year)
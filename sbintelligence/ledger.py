@@ -0,0 +1,105 @@
+import hashlib
+import time
+
+import pandas as pd
+
+from .ingest import parse_ledger, year_from_tab
+from .settlement import add_settlement
+
+
+# Colunas calculadas pelo dashboard (não fazem parte da planilha original)
+DERIVED_COLUMNS = ('Tab', 'Ledger', 'PnL', 'Balance_Delta')
+
+
+# Função para marcar a aba de origem e a variação do saldo em cada linha
+def tag_tab(df, sheet_name, previous_balance=0.0):
+    df['Tab'] = sheet_name
+
+    # O Balance de cada aba é acumulado dentro do mês; a variação linha a linha
+    # permite somar o resultado de qualquer recorte (inclusive entre abas)
+    if 'Balance' in df.columns:
+        balance = df['Balance'].ffill().fillna(previous_balance)
+        df['Balance_Delta'] = balance - balance.shift(1, fill_value=previous_balance)
+    return df
+
+
+# Função para converter as linhas brutas de uma aba e calcular as colunas derivadas
+def prepare_tab(raw, sheet_name, previous_balance=0.0, year=None):
+    df = parse_ledger(raw, year=year if year is not None else year_from_tab(sheet_name))
+    df = add_settlement(df)
+    return tag_tab(df, sheet_name, previous_balance=previous_balance)
+
+
+# Função para obter o último saldo conhecido de uma aba já preparada
+def last_balance(df):
+    if 'Balance' not in df.columns:
+        return 0.0
+    balance = df['Balance'].dropna()
+    return float(balance.iloc[-1]) if len(balance) else 0.0
+
+
+# Função para juntar as abas carregadas em um único ledger (na ordem informada)
+def concat_tabs(frames):
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return None
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+# Função para obter apenas as colunas vindas da planilha
+def source_columns(df):
+    return df.drop(columns=[col for col in DERIVED_COLUMNS if col in df.columns])
+
+
+# Função para calcular o lucro do período (soma das variações de saldo)
+def period_profit(df):
+    if 'Balance_Delta' in df.columns:
+        return df['Balance_Delta'].sum()
+    return df['Balance'].dropna().iloc[-1]
+
+
+# Função para ordenar o ledger pelo dia (ordem estável; sem cópia quando já está ordenado)
+def sort_by_day(df):
+    if df is None or 'Day' not in df.columns or df['Day'].is_monotonic_increasing:
+        return df
+    # Apostas sem data ficam no fim (NaT é o maior valor na busca binária)
+    return df.sort_values('Day', kind='stable', na_position='last')
+
+
+# Função para recortar um intervalo de dias (fim inclusivo) por busca binária no ledger ordenado
+def day_slice(df, start=None, end=None):
+    days = df['Day']
+    first = days.searchsorted(pd.Timestamp(start).normalize(), side='left') if start is not None else 0
+    if end is not None:
+        last = days.searchsorted(pd.Timestamp(end).normalize() + pd.Timedelta(days=1), side='left')
+    else:
+        last = days.searchsorted(pd.Timestamp.max, side='right')  # Sem fim: apenas apostas com data
+    if first == 0 and last == len(df):
+        return df
+    return df.iloc[first:last]
+
+
+# Função para calcular o saldo contínuo do período (acumulando entre abas)
+def running_balance(df):
+    return df['Balance_Delta'].cumsum()
+
+
+# Função para calcular a impressão digital do conteúdo de um ledger (chave de caches)
+def content_hash(df):
+    hashed = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest = hashlib.blake2b(hashed.tobytes(), digest_size=16)
+    digest.update('\x1f'.join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+# Função para marcar a versão de um ledger carregado (identifica a carga sem re-hashear o conteúdo)
+def stamp_version(df, label=''):
+    df.attrs['sbi_version'] = f'{label}@{time.time_ns()}'
+    return df
+
+
+# Função para obter a versão marcada em um ledger (None quando não marcado)
+def ledger_version(df):
+    return df.attrs.get('sbi_version')
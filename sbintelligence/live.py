@@ -0,0 +1,222 @@
+import logging
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .settlement import MARKETS, WIN_WEIGHTS, market_codes
+
+
+logger = logging.getLogger('sbintelligence.live')
+
+# Resultados usados na taxa de acerto (Green/void e Red/void contam como meia aposta)
+_RESULTS = tuple(WIN_WEIGHTS)
+
+
+# Indicadores do período mantidos como somas acumuladas (cada aposta nova custa O(1))
+class RunningAggregates:
+    def __init__(self, markets=MARKETS):
+        self.markets = tuple(markets)
+        self.bets = 0
+        self.has_balance = False
+        self.profit = 0.0
+        self.total_stakes = 0.0
+        self.has_stake = False
+        self.odds_sum = 0.0
+        self.odds_count = 0
+        self.has_results = False
+        self.results = dict.fromkeys(_RESULTS, 0)
+        self.market_profit = np.zeros(len(self.markets))
+        self.market_stake = np.zeros(len(self.markets))
+
+    @classmethod
+    def from_frame(cls, df, markets=MARKETS):
+        aggregates = cls(markets)
+        aggregates.add(df)
+        return aggregates
+
+    # Cópia independente (os acumulados publicados nunca são alterados no lugar)
+    def copy(self):
+        other = RunningAggregates(self.markets)
+        other.__dict__.update(self.__dict__)
+        other.results = dict(self.results)
+        other.market_profit = self.market_profit.copy()
+        other.market_stake = self.market_stake.copy()
+        return other
+
+    # Soma as apostas novas aos acumulados (apenas as linhas recebidas são percorridas)
+    def add(self, df):
+        if df is None or df.empty:
+            return
+        self.bets += len(df)
+
+        if 'Balance' in df.columns and df['Balance'].notna().any():
+            self.has_balance = True
+        if 'Balance_Delta' in df.columns:
+            self.profit += float(df['Balance_Delta'].sum())
+
+        stake = np.nan_to_num(df['Stake'].to_numpy(dtype='float64')) if 'Stake' in df.columns else None
+        if stake is not None:
+            self.has_stake = True
+            self.total_stakes += float(stake.sum())
+
+        if 'Odds' in df.columns:
+            odds = df['Odds'].to_numpy(dtype='float64')
+            valid = ~np.isnan(odds)
+            self.odds_sum += float(odds[valid].sum())
+            self.odds_count += int(valid.sum())
+
+        if 'Results' in df.columns:
+            self.has_results = True
+            counts = df['Results'].value_counts()
+            for result in _RESULTS:
+                self.results[result] += int(counts.get(result, 0))
+
+        # Profit e stake por mercado, somados pelo código de mercado das apostas novas
+        if 'Market' in df.columns and stake is not None:
+            codes = market_codes(df['Market'], self.markets)
+            groups = np.where(codes >= 0, codes, len(self.markets))
+            pnl = np.nan_to_num(df['PnL'].to_numpy(dtype='float64')) if 'PnL' in df.columns else 0.0
+            self.market_profit += np.bincount(groups, weights=np.broadcast_to(pnl, len(df)),
+                                              minlength=len(self.markets) + 1)[:len(self.markets)]
+            self.market_stake += np.bincount(groups, weights=stake,
+                                             minlength=len(self.markets) + 1)[:len(self.markets)]
+
+    def win_rate(self):
+        wins = sum(count * WIN_WEIGHTS[result][0] for result, count in self.results.items())
+        total_valid_bets = sum(count * WIN_WEIGHTS[result][1] for result, count in self.results.items())
+        if total_valid_bets > 0:
+            return float(wins / total_valid_bets * 100)
+        return 0.0
+
+    # Mesmo formato de metrics.kpis (None quando não disponível)
+    def kpis(self):
+        profit = self.profit if self.has_balance else None
+        total_stakes = self.total_stakes if self.has_stake else None
+        roi = None
+        if profit is not None and total_stakes is not None and total_stakes > 0:
+            roi = profit / total_stakes * 100
+        return {
+            'bets': self.bets,
+            'profit': profit,
+            'total_stakes': total_stakes,
+            'roi': roi,
+            'win_rate': self.win_rate() if self.has_results else None,
+            'avg_odds': self.odds_sum / self.odds_count if self.odds_count else None,
+        }
+
+    # Mesmo formato de settlement.market_breakdown
+    def market_breakdown(self):
+        roi = np.divide(100 * self.market_profit, self.market_stake,
+                        out=np.full(len(self.markets), np.nan), where=self.market_stake > 0)
+        return pd.DataFrame({
+            'Market': list(self.markets),
+            'Profit': self.market_profit.copy(),
+            'Stake': self.market_stake.copy(),
+            'ROI': roi,
+        })
+
+
+# Atualização ao vivo: uma thread consulta a aba do mês atual e mantém os indicadores acumulados
+class LivePoller:
+    def __init__(self, sync, sheet_name, interval=30, on_update=None, idle_timeout=None,
+                 markets=MARKETS, clock=time.monotonic):
+        # sync: DeltaSync (apenas as linhas novas são baixadas a cada consulta)
+        self.sync = sync
+        self.sheet_name = sheet_name
+        self.interval = interval
+        self.on_update = on_update
+        self.idle_timeout = idle_timeout if idle_timeout is not None else 10 * interval
+        self.markets = markets
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._frame = None
+        self._generation = None
+        self._aggregates = RunningAggregates(markets)
+        self._last_seen = clock()
+        self.version = 0
+        self.updated_at = None
+        self.new_rows = 0
+        self.error = None
+
+    # Consulta a aba uma vez; retorna True quando houve apostas novas ou alteradas
+    def poll(self):
+        df = self.sync.sync(self.sheet_name)
+        generation = self.sync.generation(self.sheet_name)
+
+        with self._lock:
+            previous, aggregates = self._frame, self._aggregates
+            if df is previous:
+                return False
+            appended = (previous is not None and generation == self._generation
+                        and len(df) >= len(previous))
+
+        if appended:
+            # Apenas as linhas anexadas entram nos acumulados
+            new_rows = df.iloc[len(previous):]
+            updated = aggregates.copy()
+            updated.add(new_rows)
+            new_count = len(new_rows)
+        else:
+            # Primeira carga ou aba editada (recarga completa): acumulados refeitos
+            updated = RunningAggregates.from_frame(df, self.markets)
+            new_count = len(df) - len(previous) if previous is not None else 0
+
+        if self.on_update is not None:
+            self.on_update(df)
+
+        with self._lock:
+            self._frame = df
+            self._generation = generation
+            self._aggregates = updated
+            self.new_rows = new_count
+            self.updated_at = datetime.now()
+            self.error = None
+            self.version += 1
+        return True
+
+    # Marca que alguma sessão está exibindo o modo ao vivo
+    def touch(self):
+        self._last_seen = self._clock()
+
+    def idle(self):
+        return self._clock() - self._last_seen > self.idle_timeout
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self.idle():
+                continue  # Nenhuma sessão aberta no modo ao vivo: não consulta a planilha
+            try:
+                self.poll()
+            except Exception as e:
+                self.error = e
+                logger.warning('Falha na atualização ao vivo de %s: %s', self.sheet_name, e)
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f'sbi-live-{self.sheet_name}', daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    # Estado atual para exibição (indicadores, mercados e versão)
+    def snapshot(self):
+        with self._lock:
+            aggregates = self._aggregates
+            return {
+                'version': self.version,
+                'updated_at': self.updated_at,
+                'new_rows': self.new_rows,
+                'error': self.error,
+                'kpis': aggregates.kpis(),
+                'markets': aggregates.market_breakdown(),
+            }
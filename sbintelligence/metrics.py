@@ -0,0 +1,48 @@
+from .daily import complete_days, daily_balance, graph_balance
+from .ledger import period_profit
+from .settlement import market_breakdown, win_weights
+
+
+# Função para calcular a taxa de acerto (Green/void e Red/void contam como meia aposta)
+def win_rate(df):
+    wins, valid = win_weights(df['Results'])
+    total_valid_bets = valid.sum()
+    if total_valid_bets > 0:
+        return float(wins.sum() / total_valid_bets * 100)
+    return 0.0
+
+
+# Função para calcular os indicadores do período (None quando não disponível)
+def kpis(df):
+    has_balance = 'Balance' in df.columns and not df['Balance'].isna().all()
+    profit = float(period_profit(df)) if has_balance else None
+
+    total_stakes = float(df['Stake'].dropna().astype('float64').sum()) if 'Stake' in df.columns else None
+    roi = None
+    if profit is not None and total_stakes is not None and total_stakes > 0:
+        roi = profit / total_stakes * 100
+
+    avg_odds = None
+    if 'Odds' in df.columns and not df['Odds'].isna().all():
+        avg_odds = float(df['Odds'].dropna().astype('float64').mean())
+
+    return {
+        'bets': int(len(df)),
+        'profit': profit,
+        'total_stakes': total_stakes,
+        'roi': roi,
+        'win_rate': win_rate(df) if 'Results' in df.columns else None,
+        'avg_odds': avg_odds,
+    }
+
+
+# Função para executar o pipeline completo de um ledger já preparado
+def analyze(df):
+    report = {'kpis': kpis(df), 'daily': None, 'markets': None}
+
+    df_graph = graph_balance(df)
+    if len(df_graph):
+        report['daily'] = complete_days(daily_balance(df_graph))
+    if {'Market', 'Stake'}.issubset(df.columns):
+        report['markets'] = market_breakdown(df)
+    return report
@@ -0,0 +1,131 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+
+logger = logging.getLogger('sbintelligence.perf')
+
+
+# Função para obter a memória residente (RSS) do processo em bytes
+def rss_bytes():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        # ru_maxrss é o pico (KB no Linux, bytes no macOS); serve como aproximação
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if usage > 1 << 32 else usage * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+# Função para configurar a emissão dos logs JSON (uma linha por execução)
+def configure_logging(enabled=True, stream=None):
+    logger.disabled = not enabled
+    if enabled and not logger.handlers:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+# Função para medir um bloco apenas quando houver uma execução sendo medida
+def optional_span(trace, stage, **extra):
+    return trace.span(stage, **extra) if trace is not None else nullcontext({'rows': None})
+
+
+# Medição das etapas de uma execução do script
+class RunTrace:
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.spans = []
+        self._start = time.perf_counter()
+        self._lap_time = self._start
+        self._lap_rss = rss_bytes()
+        self._lock = threading.Lock()
+
+    def _record(self, stage, seconds, rows=None, memory_delta=0, **extra):
+        span = {'stage': stage, 'seconds': seconds, 'rows': rows, 'memory_delta': memory_delta}
+        span.update(extra)
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    # Fecha a etapa atual: mede o tempo desde a etapa anterior
+    def lap(self, stage, rows=None):
+        now, rss = time.perf_counter(), rss_bytes()
+        span = self._record(stage, now - self._lap_time, rows, rss - self._lap_rss)
+        self._lap_time, self._lap_rss = now, rss
+        return span
+
+    # Mede um bloco específico (pode ser usado em outras threads, ex.: busca das abas)
+    @contextmanager
+    def span(self, stage, rows=None, **extra):
+        start, rss = time.perf_counter(), rss_bytes()
+        info = {'rows': rows}
+        try:
+            yield info
+        finally:
+            self._record(stage, time.perf_counter() - start, info['rows'],
+                         rss_bytes() - rss, nested=True, **extra)
+
+    def total(self):
+        return time.perf_counter() - self._start
+
+    def to_dict(self, **extra):
+        return {
+            'event': 'rerun',
+            'started_at': self.started_at.isoformat(timespec='milliseconds'),
+            'total_seconds': self.total(),
+            **extra,
+            'spans': list(self.spans),
+        }
+
+
+# Histórico das últimas execuções (compartilhado entre sessões) para p50/p95
+class PerfHistory:
+    def __init__(self, maxlen=50):
+        self._runs = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def add(self, trace, **extra):
+        record = trace.to_dict(**extra)
+        with self._lock:
+            self._runs.append(record)
+        logger.info(json.dumps(record, default=str))
+        return record
+
+    def __len__(self):
+        return len(self._runs)
+
+    # Resumo por etapa (p50/p95 em ms) das últimas execuções
+    def summary(self):
+        import numpy as np
+
+        with self._lock:
+            runs = list(self._runs)
+
+        durations = {}
+        for run in runs:
+            durations.setdefault('total', []).append(run['total_seconds'])
+            for span in run['spans']:
+                durations.setdefault(span['stage'], []).append(span['seconds'])
+
+        return [
+            {
+                'stage': stage,
+                'runs': len(values),
+                'p50_ms': float(np.percentile(values, 50) * 1000),
+                'p95_ms': float(np.percentile(values, 95) * 1000),
+            }
+            for stage, values in durations.items()
+        ]
@@ -0,0 +1,41 @@
+import pandas as pd
+
+
+# Intervalos prontos do filtro de datas (número de dias até a data de referência; None = início do ano)
+RANGE_PRESETS = {
+    'Last 7 days': 7,
+    'Last 30 days': 30,
+    'Last 90 days': 90,
+    'Year to date': None,
+}
+
+
+# Função para obter o início e o fim (inclusivo) de um intervalo pronto
+def preset_range(preset, anchor):
+    end = pd.Timestamp(anchor).normalize()
+    days = RANGE_PRESETS[preset]
+    if days is None:
+        return end.replace(month=1, day=1), end
+    return end - pd.Timedelta(days=days - 1), end
+
+
+# Função para escolher a data de referência: hoje, ou o último mês disponível quando hoje está fora dele
+def range_anchor(month_starts, today=None, last_bet_day=None):
+    today = pd.Timestamp(today if today is not None else 'today').normalize()
+    first = min(month_starts)
+    last = max(month_starts) + pd.offsets.MonthEnd(0)
+    if first <= today <= last:
+        return today
+    if last_bet_day is not None and not pd.isna(last_bet_day):
+        return pd.Timestamp(last_bet_day).normalize()
+    return min(max(today, pd.Timestamp(first)), last)
+
+
+# Função para listar as abas cujo mês cruza o intervalo (em ordem cronológica)
+def tabs_in_range(tab_months, start, end):
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    tabs = [
+        (month, tab) for tab, month in tab_months.items()
+        if pd.Timestamp(month) <= end and pd.Timestamp(month) + pd.offsets.MonthEnd(0) >= start.normalize()
+    ]
+    return [tab for month, tab in sorted(tabs)]
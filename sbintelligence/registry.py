@@ -0,0 +1,106 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from . import config
+from .sheets import sheet_id_from_url
+
+
+# Um ledger acompanhado: planilha, abas de cada mês ("February/2025" -> "Feb2025") e rótulo
+class LedgerSpec:
+    def __init__(self, label, sheet_url, sheet_mapping):
+        self.label = label
+        self.sheet_url = sheet_url
+        self.sheet_mapping = dict(sheet_mapping)
+
+    @property
+    def sheet_id(self):
+        return sheet_id_from_url(self.sheet_url)
+
+    # Início do mês de cada aba
+    @property
+    def tab_months(self):
+        return {tab: datetime.strptime(month, '%B/%Y') for month, tab in self.sheet_mapping.items()}
+
+    # Abas dos meses pedidos que existem neste ledger (na ordem dos meses)
+    def tabs_for(self, months):
+        return [self.sheet_mapping[month] for month in months if month in self.sheet_mapping]
+
+    def __repr__(self):
+        return f'LedgerSpec({self.label!r}, {self.sheet_id!r}, {len(self.sheet_mapping)} tabs)'
+
+
+# Função para ler o registro de ledgers (JSON: lista de {"label", "sheet_url", "tabs"})
+def load_registry(path, default=None):
+    if not path or not os.path.exists(path):
+        return list(default or [])
+
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    if isinstance(entries, dict):
+        entries = entries.get('ledgers', [])
+
+    ledgers, labels = [], set()
+    for i, entry in enumerate(entries):
+        missing = [key for key in ('label', 'sheet_url', 'tabs') if not entry.get(key)]
+        if missing:
+            raise ValueError(f'ledger {i + 1} do registro sem {", ".join(missing)}')
+        if entry['label'] in labels:
+            raise ValueError(f'ledger "{entry["label"]}" repetido no registro')
+        if '/d/' not in entry['sheet_url']:
+            raise ValueError(f'URL inválida no ledger "{entry["label"]}"')
+        for month in entry['tabs']:
+            try:
+                datetime.strptime(month, '%B/%Y')
+            except ValueError:
+                raise ValueError(
+                    f'mês "{month}" inválido no ledger "{entry["label"]}" (use "February/2025")'
+                )
+        labels.add(entry['label'])
+        ledgers.append(LedgerSpec(entry['label'], entry['sheet_url'], entry['tabs']))
+    return ledgers
+
+
+# Função para buscar as abas de vários ledgers ao mesmo tempo (asyncio): cada busca roda em
+# uma thread de um pool próprio, limitado por SBI_FETCH_WORKERS no total (o mesmo limite das
+# conexões HTTP), e o tempo total fica próximo da busca mais lenta
+async def gather_tabs(load_tab, jobs, max_workers=None):
+    # jobs: lista de (ledger, aba); falhas individuais não interrompem as demais
+    frames, errors = {}, {}
+    if not jobs:
+        return frames, errors
+
+    max_workers = min(max_workers or config.FETCH_WORKERS, len(jobs))
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sbi-ledgers') as executor:
+        results = await asyncio.gather(
+            *(loop.run_in_executor(executor, load_tab, spec, name) for spec, name in jobs),
+            return_exceptions=True
+        )
+    for (spec, name), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            errors[(spec.label, name)] = result
+        elif result is None:
+            errors[(spec.label, name)] = ValueError('aba vazia ou inválida')
+        else:
+            frames[(spec.label, name)] = result
+    return frames, errors
+
+
+# Função para buscar as abas de vários ledgers a partir de código síncrono (script do Streamlit, CLI)
+def load_ledger_tabs(load_tab, jobs, max_workers=None):
+    return asyncio.run(gather_tabs(load_tab, jobs, max_workers))
+
+
+# Função para marcar o ledger de origem de cada linha (sem alterar o dataframe recebido)
+def tag_ledger(df, label, labels=None):
+    categories = list(labels) if labels is not None else [label]
+    code_type = np.int8 if len(categories) < 128 else np.int32
+    codes = np.full(len(df), categories.index(label), dtype=code_type)
+    return df.assign(Ledger=pd.Categorical.from_codes(codes, categories=categories))
+
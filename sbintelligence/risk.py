@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+
+# Janelas (número de apostas) disponíveis para o ROI e o yield móveis
+ROLLING_WINDOWS = [50, 100, 250, 500, 1000]
+
+
+# Função para obter o lucro/prejuízo de cada aposta (0 quando não disponível)
+def bet_pnl(df):
+    if 'PnL' not in df.columns:
+        return np.zeros(len(df))
+    return np.nan_to_num(df['PnL'].to_numpy(dtype='float64'))
+
+
+# Função para montar a curva de saldo do período (começando em zero, antes da primeira aposta)
+def equity_curve(df):
+    if 'Balance_Delta' in df.columns:
+        deltas = np.nan_to_num(df['Balance_Delta'].to_numpy(dtype='float64'))
+    else:
+        deltas = bet_pnl(df)
+    return np.concatenate([[0.0], np.cumsum(deltas)])
+
+
+# Função para calcular o drawdown de cada ponto (distância até o maior saldo anterior)
+def drawdown_series(equity):
+    return np.maximum.accumulate(equity) - equity
+
+
+# Função para calcular o drawdown máximo, onde começou, o fundo e a recuperação (se houve)
+def max_drawdown(df):
+    equity = equity_curve(df)
+    running_peak = np.maximum.accumulate(equity)
+    drawdown = running_peak - equity
+    trough = int(np.argmax(drawdown))
+    result = {
+        'max_drawdown': float(drawdown[trough]),
+        'peak_bet': None, 'trough_bet': None, 'recovery_bet': None,
+        'duration_bets': 0, 'duration_days': 0, 'recovered': True,
+    }
+    if drawdown[trough] <= 0:
+        return result
+
+    # Topo: último ponto antes do fundo com o saldo máximo; recuperação: primeiro ponto que volta a ele
+    top = running_peak[trough]
+    peak = int(np.flatnonzero(equity[:trough + 1] >= top)[-1])
+    recovered = np.flatnonzero(equity[trough:] >= top)
+    recovery = trough + int(recovered[0]) if len(recovered) else None
+    end = recovery if recovery is not None else len(equity) - 1
+
+    # Posição i da curva = saldo após a aposta i (a posição 0 é o saldo inicial)
+    result.update({
+        'peak_bet': peak, 'trough_bet': trough, 'recovery_bet': recovery,
+        'duration_bets': end - peak, 'recovered': recovery is not None,
+    })
+    if 'Day' in df.columns and len(df):
+        days = df['Day'].to_numpy()
+        result['duration_days'] = int((days[end - 1] - days[max(peak - 1, 0)]) / np.timedelta64(1, 'D'))
+    return result
+
+
+# Função para calcular as sequências de vitórias e derrotas (apostas devolvidas não interrompem)
+def streaks(pnl):
+    signs = np.sign(np.asarray(pnl, dtype='float64'))
+    signs = signs[signs != 0]
+    if len(signs) == 0:
+        return {'longest_win': 0, 'longest_loss': 0, 'current': 0}
+
+    # Run-length: início de cada sequência e seu tamanho
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(signs)) + 1])
+    lengths = np.diff(np.concatenate([starts, [len(signs)]]))
+    values = signs[starts]
+    wins, losses = lengths[values > 0], lengths[values < 0]
+    return {
+        'longest_win': int(wins.max()) if len(wins) else 0,
+        'longest_loss': int(losses.max()) if len(losses) else 0,
+        # Sequência atual: positiva para vitórias, negativa para derrotas
+        'current': int(lengths[-1] * values[-1]),
+    }
+
+
+# Função para calcular o profit factor (ganhos brutos / perdas brutas)
+def profit_factor(pnl):
+    pnl = np.asarray(pnl, dtype='float64')
+    gross_loss = -pnl[pnl < 0].sum()
+    if gross_loss == 0:
+        return None
+    return float(pnl[pnl > 0].sum() / gross_loss)
+
+
+# Função para calcular o yield (retorno médio por aposta, sem ponderar pela stake)
+def bet_yield(pnl, stake):
+    valid = stake > 0
+    if not valid.any():
+        return None
+    return float((pnl[valid] / stake[valid]).mean() * 100)
+
+
+# Função para calcular o ROI e o yield das últimas N apostas em cada ponto (somas acumuladas)
+def rolling_returns(df, window):
+    pnl = bet_pnl(df)
+    stake = np.nan_to_num(df['Stake'].to_numpy(dtype='float64')) if 'Stake' in df.columns else np.zeros(len(df))
+    bet_return = np.divide(pnl, stake, out=np.zeros(len(df)), where=stake > 0)
+
+    # Soma da janela = diferença entre duas somas acumuladas (O(n) para qualquer janela)
+    def window_sum(values):
+        totals = np.concatenate([[0.0], np.cumsum(values)])
+        sums = np.full(len(values), np.nan)
+        if len(values) >= window:
+            sums[window - 1:] = totals[window:] - totals[:-window]
+        return sums
+
+    profit, turnover = window_sum(pnl), window_sum(stake)
+    counted = window_sum((stake > 0).astype('float64'))
+    return pd.DataFrame({
+        'Bet': np.arange(1, len(df) + 1),
+        'ROI': np.divide(100 * profit, turnover, out=np.full(len(df), np.nan), where=turnover > 0),
+        'Yield': np.divide(100 * window_sum(bet_return), counted,
+                           out=np.full(len(df), np.nan), where=counted > 0),
+    })
+
+
+# Função para reunir os indicadores de risco do período
+def risk_summary(df):
+    pnl = bet_pnl(df)
+    stake = np.nan_to_num(df['Stake'].to_numpy(dtype='float64')) if 'Stake' in df.columns else np.zeros(len(df))
+    return {
+        **max_drawdown(df),
+        **streaks(pnl),
+        'profit_factor': profit_factor(pnl),
+        'yield': bet_yield(pnl, stake),
+    }
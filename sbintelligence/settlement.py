@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+
+# Mercados exibidos no "Profit by Market" (a ordem define a prioridade da classificação)
+MARKETS = ('1X2', 'AH', 'Under', 'Over')
+
+# Fração do lucro (Stake * (Odds - 1)) e da perda (Stake) de cada resultado
+RESULT_WEIGHTS = {
+    'Green': (1.0, 0.0),
+    'Green/void': (0.5, 0.0),
+    'Red': (0.0, 1.0),
+    'Red/void': (0.0, 0.5),
+}
+
+# Peso de cada resultado na taxa de acerto: (vitórias, apostas válidas); void conta como meia aposta
+WIN_WEIGHTS = {
+    'Green': (1.0, 1.0),
+    'Green/void': (0.5, 0.5),
+    'Red': (0.0, 1.0),
+    'Red/void': (0.0, 0.5),
+}
+
+
+# Função para obter o par de pesos de uma tabela para cada aposta, consultando cada resultado distinto
+# uma vez e expandindo pelos códigos (zero sem resultado válido; o código -1 cai na última linha)
+def _result_weights(results, table):
+    codes, uniques = pd.factorize(results)
+    weights = np.zeros((len(uniques) + 1, 2))
+    for i, result in enumerate(uniques):
+        weights[i] = table.get(result, (0.0, 0.0))
+    return weights[codes, 0], weights[codes, 1]
+
+
+# Função para obter as vitórias e o peso na taxa de acerto de cada aposta (zero sem resultado válido)
+def win_weights(results):
+    return _result_weights(results, WIN_WEIGHTS)
+
+
+# Função para calcular o lucro/prejuízo de cada aposta
+def settle(df):
+    if not {'Results', 'Stake', 'Odds'}.issubset(df.columns):
+        return pd.Series(np.zeros(len(df)), index=df.index, name='PnL')
+
+    stake = df['Stake'].to_numpy(dtype='float64')
+    odds = df['Odds'].to_numpy(dtype='float64')
+
+    win_fraction, loss_fraction = _result_weights(df['Results'], RESULT_WEIGHTS)
+
+    pnl = stake * (odds - 1) * win_fraction - stake * loss_fraction
+    return pd.Series(pnl, index=df.index, name='PnL')
+
+
+# Função para adicionar a coluna PnL ao dataframe
+def add_settlement(df):
+    df['PnL'] = settle(df)
+    return df
+
+
+# Função para obter o índice do mercado de cada aposta (-1 quando não se encaixa em nenhum)
+def market_codes(market_values, markets=MARKETS):
+    codes, uniques = pd.factorize(market_values)
+
+    # Classificamos apenas os textos distintos e depois expandimos pelos códigos
+    unique_codes = np.full(len(uniques) + 1, -1)
+    for i, value in enumerate(uniques):
+        text = str(value).lower()
+        for position, market in enumerate(markets):
+            if market.lower() in text:
+                unique_codes[i] = position
+                break
+    return unique_codes[codes]
+
+
+# Função para classificar cada aposta em um mercado (primeira correspondência vence)
+def classify_markets(market_values, markets=MARKETS):
+    labels = np.array(list(markets) + [None], dtype=object)[market_codes(market_values, markets)]
+    return pd.Series(labels, index=market_values.index, name='Market')
+
+
+# Função para calcular profit, stake e ROI por mercado em uma única agregação
+def market_breakdown(df, markets=MARKETS):
+    pnl = df['PnL'] if 'PnL' in df.columns else settle(df)
+    codes = market_codes(df['Market'], markets)
+
+    # Agregação por código de mercado (apostas fora dos mercados ficam no último grupo)
+    groups = np.where(codes >= 0, codes, len(markets))
+    profit = np.bincount(groups, weights=np.nan_to_num(pnl.to_numpy(dtype='float64')),
+                         minlength=len(markets) + 1)[:len(markets)]
+    stake = np.bincount(groups, weights=np.nan_to_num(df['Stake'].to_numpy(dtype='float64')),
+                        minlength=len(markets) + 1)[:len(markets)]
+
+    roi = np.divide(100 * profit, stake, out=np.full(len(markets), np.nan), where=stake > 0)
+    return pd.DataFrame({
+        'Market': list(markets),
+        'Profit': profit,
+        'Stake': stake,
+        'ROI': roi,
+    })
@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
+
+from . import config
+
+
+# Função para extrair o ID da planilha a partir da URL de edição
+def sheet_id_from_url(sheet_url):
+    return sheet_url.split("/d/")[1].split("/")[0]
+
+
+# Função para montar a URL de exportação CSV (gviz) de uma aba
+def build_csv_url(sheet_url, sheet_name=None, base_url=None, query=None, headers=None):
+    sheet_id = sheet_id_from_url(sheet_url)
+    base_url = (base_url or config.SHEETS_BASE_URL).rstrip('/')
+
+    # Se um nome de aba específico for fornecido, usamos ele para construir a URL
+    if sheet_name:
+        csv_url = f"{base_url}/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
+    else:
+        csv_url = f"{base_url}/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv"
+
+    # Número fixo de linhas de cabeçalho e consulta gviz (ex.: "select * offset 120")
+    if headers is not None:
+        csv_url += f"&headers={int(headers)}"
+    if query:
+        csv_url += f"&tq={quote(query)}"
+    return csv_url
+
+
+# Função para carregar várias abas em paralelo (falhas individuais não interrompem as demais)
+def load_tabs(load_tab, sheet_names, max_workers=None):
+    frames, errors = {}, {}
+    if not sheet_names:
+        return frames, errors
+
+    max_workers = min(max_workers or config.FETCH_WORKERS, len(sheet_names))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sbi-fetch') as pool:
+        futures = {pool.submit(load_tab, name): name for name in sheet_names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                df = future.result()
+            except Exception as e:
+                errors[name] = e
+                continue
+            if df is None:
+                errors[name] = ValueError('aba vazia ou inválida')
+            else:
+                frames[name] = df
+    return frames, errors
@@ -0,0 +1,127 @@
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+
+# Métodos de simulação: reamostrar o P/L observado ou sortear odds/stake com vantagem constante
+SIMULATION_METHODS = ['Bootstrap', 'Parametric']
+
+# Percentis das faixas do gráfico em leque
+BAND_PERCENTILES = [5, 25, 50, 75, 95]
+
+# Número máximo de valores (caminhos x apostas) gerados por lote (limita a memória de cada processo)
+BATCH_CELLS = 2_000_000
+
+
+# Função para extrair a distribuição de entrada da simulação (P/L, odds e stake de cada aposta)
+def bet_distribution(df):
+    columns = {}
+    for col in ('PnL', 'Odds', 'Stake'):
+        if col in df.columns:
+            columns[col] = df[col].to_numpy(dtype='float64')
+        else:
+            columns[col] = np.full(len(df), np.nan)
+
+    valid = ~np.isnan(columns['PnL']) & (np.nan_to_num(columns['Stake']) > 0)
+    return {col: values[valid] for col, values in columns.items()}
+
+
+# Função para sugerir o bankroll inicial da simulação (unidades de stake mediana)
+def default_bankroll(distribution, units=50):
+    if len(distribution['Stake']) == 0:
+        return 0.0
+    return float(round(units * np.median(distribution['Stake'])))
+
+
+# Função para identificar a distribuição de entrada (chave do cache das simulações)
+def distribution_key(distribution):
+    digest = hashlib.blake2b(digest_size=16)
+    for col in ('PnL', 'Odds', 'Stake'):
+        digest.update(np.ascontiguousarray(distribution[col]).tobytes())
+    return digest.hexdigest()
+
+
+# Função para simular um lote de caminhos (executada nos processos do pool)
+def _simulate_batch(seed, n_paths, n_bets, distribution, method, bankroll, steps):
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(distribution['PnL']), size=(n_paths, n_bets))
+    stake = distribution['Stake'][picks]
+
+    if method == 'Parametric':
+        # Vantagem constante: probabilidade de vitória = (1 + ROI observado) / odds
+        edge = 1 + distribution['PnL'].sum() / distribution['Stake'].sum()
+        odds = distribution['Odds'][picks]
+        win = rng.random((n_paths, n_bets)) < np.clip(edge / odds, 0, 1)
+        profit = np.where(win, stake * (odds - 1), -stake)
+    else:
+        profit = distribution['PnL'][picks]
+
+    paths = np.cumsum(profit, axis=1)
+    ruined = paths.min(axis=1) <= -bankroll if bankroll else np.zeros(n_paths, dtype=bool)
+    return paths[:, steps], ruined, paths[:, -1], stake.sum(axis=1)
+
+
+def _simulate_batch_args(args):
+    return _simulate_batch(*args)
+
+
+# Função para criar o pool de processos das simulações (None = executar no próprio processo)
+def process_pool(workers):
+    if workers is None or workers <= 1:
+        return None
+    # spawn: os processos não herdam as threads do servidor (cache, modo ao vivo)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+# Função para simular caminhos futuros do saldo em lotes vetorizados (em paralelo quando houver pool)
+def monte_carlo(distribution, n_paths=10_000, n_bets=1_000, bankroll=None, method='Bootstrap',
+                seed=0, executor=None, checkpoints=100):
+    if len(distribution['PnL']) == 0:
+        return None
+    if method == 'Parametric' and np.isnan(distribution['Odds']).any():
+        raise ValueError('simulação paramétrica requer odds em todas as apostas')
+
+    # Pontos do caminho guardados para as faixas (o caminho inteiro é usado na ruína)
+    steps = np.unique(np.linspace(0, n_bets - 1, min(checkpoints, n_bets)).astype(np.int64))
+
+    # Lotes com sementes independentes: o resultado não depende do número de processos
+    batch_paths = max(1, min(n_paths, BATCH_CELLS // n_bets))
+    sizes = [min(batch_paths, n_paths - start) for start in range(0, n_paths, batch_paths)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    batches = [
+        (batch_seed, size, n_bets, distribution, method, bankroll, steps)
+        for batch_seed, size in zip(seeds, sizes)
+    ]
+
+    results = None
+    if executor is not None and len(batches) > 1:
+        try:
+            results = list(executor.map(_simulate_batch_args, batches))
+        except BrokenProcessPool:
+            results = None  # Pool indisponível: a simulação continua no próprio processo
+    if results is None:
+        results = [_simulate_batch(*batch) for batch in batches]
+
+    values = np.concatenate([result[0] for result in results])
+    ruined = np.concatenate([result[1] for result in results])
+    final = np.concatenate([result[2] for result in results])
+    turnover = np.concatenate([result[3] for result in results])
+
+    bands = pd.DataFrame(
+        np.percentile(values, BAND_PERCENTILES, axis=0).T,
+        columns=[f'P{p}' for p in BAND_PERCENTILES]
+    )
+    bands.insert(0, 'Bet', steps + 1)
+    return {
+        'bands': bands,
+        'paths': n_paths,
+        'bets': n_bets,
+        'ruin_probability': float(ruined.mean() * 100) if bankroll else None,
+        'profit_probability': float((final > 0).mean() * 100),
+        'expected_profit': float(final.mean()),
+        'expected_roi': float(final.sum() / turnover.sum() * 100) if turnover.sum() > 0 else None,
+    }
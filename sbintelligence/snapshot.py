@@ -0,0 +1,108 @@
+import os
+import re
+from datetime import datetime
+
+import pandas as pd
+
+
+# Versão do formato salvo (incrementar quando o esquema das colunas mudar)
+SCHEMA_VERSION = 1
+
+_METADATA_VERSION = b'sbi.schema_version'
+_METADATA_FETCHED_AT = b'sbi.fetched_at'
+
+
+# Função para obter o momento em que um mês termina (início do mês seguinte)
+def month_close(month_start):
+    return pd.Timestamp(month_start).normalize().replace(day=1) + pd.offsets.MonthBegin(1)
+
+
+# Função para verificar se um mês já terminou
+def is_closed_month(month_start, now=None):
+    now = pd.Timestamp(now or datetime.now())
+    return month_close(month_start) <= now
+
+
+# Armazenamento colunar (Feather/Arrow IPC) de cada aba em disco
+class SnapshotStore:
+    def __init__(self, root, memory_map=True):
+        self.root = root
+        self.memory_map = memory_map
+
+    # Verifica se o pyarrow está disponível (dependência opcional)
+    @staticmethod
+    def available():
+        try:
+            import pyarrow.feather  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def path(self, sheet_id, sheet_name):
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', sheet_name or '_default')
+        return os.path.join(self.root, sheet_id, f'{safe_name}.feather')
+
+    def save(self, sheet_id, sheet_name, df, fetched_at=None):
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        fetched_at = fetched_at or datetime.now()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_METADATA_VERSION] = str(SCHEMA_VERSION).encode()
+        metadata[_METADATA_FETCHED_AT] = fetched_at.isoformat().encode()
+        table = table.replace_schema_metadata(metadata)
+
+        # Escrita atômica: arquivo temporário + rename (sem compressão para permitir mmap)
+        path = self.path(sheet_id, sheet_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, path)
+        return path
+
+    # Guarda a aba recém-buscada. A última cópia válida servida no lugar da planilha (stale_since)
+    # não é guardada: receberia o momento atual e fixaria um mês encerrado com dados antigos
+    def save_fetched(self, sheet_id, sheet_name, df, stale_since=None):
+        if stale_since is not None:
+            return None
+        try:
+            return self.save(sheet_id, sheet_name, df)
+        except OSError:
+            return None  # O snapshot é apenas uma otimização; a aba já foi carregada
+
+    # Retorna (dataframe, momento da busca) ou None quando não há snapshot válido
+    def load(self, sheet_id, sheet_name, fetched_after=None):
+        import pyarrow.feather as feather
+
+        path = self.path(sheet_id, sheet_name)
+        if not os.path.exists(path):
+            return None
+        try:
+            table = feather.read_table(path, memory_map=self.memory_map)
+        except (OSError, ValueError):
+            return None
+
+        metadata = table.schema.metadata or {}
+        if metadata.get(_METADATA_VERSION) != str(SCHEMA_VERSION).encode():
+            return None
+        fetched_at = datetime.fromisoformat(metadata[_METADATA_FETCHED_AT].decode())
+
+        # Snapshots feitos antes do fim do mês podem estar incompletos
+        if fetched_after is not None and fetched_at < fetched_after:
+            return None
+        return table.to_pandas(), fetched_at
+
+    def delete(self, sheet_id, sheet_name):
+        try:
+            os.remove(self.path(sheet_id, sheet_name))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        if not os.path.isdir(self.root):
+            return
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith('.feather'):
+                    os.remove(os.path.join(directory, name))
@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import threading
+import time
+
+import pandas as pd
+
+from .ledger import last_balance, prepare_tab
+
+
+logger = logging.getLogger('sbintelligence.sync')
+
+# Quantidade de linhas já conhecidas que são buscadas novamente para conferência
+OVERLAP_ROWS = 5
+
+
+# Função para obter o texto de cada célula independente do tipo inferido na leitura: a carga completa
+# e a busca a partir de um offset inferem os tipos separadamente (um ID lido como 3.0 numa coluna com
+# vazios e como 3 sem eles), então inteiros em float perdem o ".0" e células vazias viram ""
+def _cell_text(raw):
+    text = raw.astype(str).apply(lambda col: col.str.replace(r'\.0$', '', regex=True))
+    return text.where(raw.notna(), '')
+
+
+# Função para calcular um checksum barato de um bloco de linhas brutas
+def rows_checksum(raw):
+    hashed = pd.util.hash_pandas_object(_cell_text(raw), index=False).to_numpy()
+    digest = hashlib.blake2b(hashed.tobytes(), digest_size=16)
+    digest.update('\x1f'.join(map(str, raw.columns)).encode())
+    return digest.hexdigest()
+
+
+# Estado da sincronização de uma aba
+class _TabState:
+    def __init__(self, df, row_count, columns, tail_checksum, synced_at, fetched_at):
+        self.df = df
+        self.row_count = row_count
+        self.columns = columns
+        self.tail_checksum = tail_checksum
+        self.synced_at = synced_at
+        self.fetched_at = fetched_at  # momento (relógio de parede) da última busca bem-sucedida
+        self.stale = False  # a última busca falhou e as linhas já sincronizadas estão sendo servidas
+        self.lock = threading.Lock()
+
+
+# Sincronização incremental: busca apenas as linhas novas do fim da aba
+class DeltaSync:
+    def __init__(self, fetch_raw, overlap=OVERLAP_ROWS, full_reload_interval=3600,
+                 clock=time.monotonic, wall_clock=time.time):
+        # fetch_raw(sheet_name, offset) -> linhas brutas (texto) a partir de `offset`
+        self.fetch_raw = fetch_raw
+        self.overlap = overlap
+        self.full_reload_interval = full_reload_interval
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._states = {}
+        self._generations = {}  # aba -> número de cargas completas (muda quando o ledger é refeito)
+        self._lock = threading.Lock()
+        self.full_loads = 0
+        self.delta_loads = 0
+        self.rows_appended = 0
+
+    def _tail_checksum(self, raw):
+        return rows_checksum(raw.iloc[-self.overlap:]) if self.overlap else ''
+
+    def _full_load(self, sheet_name):
+        raw = self.fetch_raw(sheet_name, 0)
+        state = _TabState(
+            df=prepare_tab(raw.copy(), sheet_name),
+            row_count=len(raw),
+            columns=list(raw.columns),
+            tail_checksum=self._tail_checksum(raw),
+            synced_at=self._clock(),
+            fetched_at=self._wall_clock(),
+        )
+        self.full_loads += 1
+        with self._lock:
+            self._states[sheet_name] = state
+            self._generations[sheet_name] = self._generations.get(sheet_name, 0) + 1
+        return state.df
+
+    def sync(self, sheet_name):
+        with self._lock:
+            state = self._states.get(sheet_name)
+        if state is None:
+            return self._full_load(sheet_name)
+
+        with state.lock:
+            try:
+                return self._sync_tab(state, sheet_name)
+            except Exception as e:
+                # Aba já sincronizada: qualquer falha mantém as linhas conhecidas (marcadas como desatualizadas)
+                logger.warning('Falha ao sincronizar %s (%s); usando as linhas já sincronizadas', sheet_name, e)
+                state.stale = True
+                return state.df
+
+    def _sync_tab(self, state, sheet_name):
+        # Recarga completa periódica para capturar edições fora da janela conferida
+        if (self.full_reload_interval is not None
+                and self._clock() - state.synced_at >= self.full_reload_interval):
+            return self._full_load(sheet_name)
+
+        offset = max(state.row_count - self.overlap, 0)
+        raw = self.fetch_raw(sheet_name, offset)
+        known = state.row_count - offset
+
+        # Linhas removidas, colunas alteradas ou linhas editadas: recarga completa
+        if (len(raw) < known or list(raw.columns) != state.columns
+                or (known and rows_checksum(raw.iloc[:known]) != state.tail_checksum)):
+            return self._full_load(sheet_name)
+
+        self.delta_loads += 1
+        state.fetched_at = self._wall_clock()
+        state.stale = False
+        new_rows = raw.iloc[known:]
+        if new_rows.empty:
+            return state.df
+
+        # Apenas as linhas novas são convertidas e anexadas ao ledger
+        # (o índice segue a posição da linha na aba, como na carga completa)
+        new_rows = new_rows.copy()
+        new_rows.index = range(state.row_count, state.row_count + len(new_rows))
+        new_df = prepare_tab(new_rows, sheet_name, previous_balance=last_balance(state.df))
+        state.df = pd.concat([state.df, new_df])
+        state.row_count += len(new_rows)
+        state.tail_checksum = self._tail_checksum(raw)
+        self.rows_appended += len(new_rows)
+        return state.df
+
+    # Momento da última busca bem-sucedida de uma aba servida com as linhas já sincronizadas (ou None)
+    def stale_since(self, sheet_name):
+        with self._lock:
+            state = self._states.get(sheet_name)
+        return state.fetched_at if state is not None and state.stale else None
+
+    # Geração atual da aba: igual entre duas sincronizações = apenas linhas anexadas
+    def generation(self, sheet_name):
+        with self._lock:
+            return self._generations.get(sheet_name, 0)
+
+    def forget(self, sheet_name=None):
+        with self._lock:
+            if sheet_name is None:
+                self._states.clear()
+            else:
+                self._states.pop(sheet_name, None)
+
+    def stats(self):
+        return {
+            'full_loads': self.full_loads,
+            'delta_loads': self.delta_loads,
+            'rows_appended': self.rows_appended,
+        }
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+
+# Colunas das abas da planilha (A à M)
+SHEET_COLUMNS = [
+    'ID', 'Day', 'League', 'Match', 'Market', 'Tip', 'Odds', 'Stake',
+    'Results', 'Profit', 'Balance', 'Tipster', 'Notes',
+]
+
+# Mercados gerados, com as variações de linha usadas nas planilhas
+SYNTHETIC_MARKETS = np.array([
+    '1X2 Home', '1X2 Draw', '1X2 Away',
+    'AH -0.5', 'AH +0.5', 'AH -0.25', 'AH +0.75', 'AH -1.5', 'AH +1',
+    'Over 1.5', 'Over 2.5', 'Over 3.5', 'Over 9.5 Corners',
+    'Under 2.5', 'Under 3.5', 'Under 10.5 Corners',
+], dtype=object)
+
+# Linhas asiáticas de quarto (meio ganho/meia perda) e inteiras (devolução)
+_QUARTER_LINES = np.array([m.startswith('AH') and m.endswith(('.25', '.75')) for m in SYNTHETIC_MARKETS])
+_WHOLE_LINES = np.array([m.startswith('AH') and '.' not in m for m in SYNTHETIC_MARKETS])
+
+LEAGUES = np.array(['Brasileirão', 'Premier League', 'La Liga', 'Serie A', 'Bundesliga'], dtype=object)
+TIPSTERS = np.array(['SBI', 'Tipster A', 'Tipster B'], dtype=object)
+STAKES = np.array([10.0, 20.0, 25.0, 50.0, 100.0])
+
+
+# Função para formatar números no padrão da planilha ("R$ 1234,56" / "1,85")
+def _format_decimal(values, decimals, prefix=''):
+    # Formatamos apenas os valores distintos e expandimos pelo índice inverso
+    uniques, inverse = np.unique(np.round(values, decimals), return_inverse=True)
+    text = pd.Series(uniques).map(f'{{:.{decimals}f}}'.format).str.replace('.', ',', regex=False)
+    return (prefix + text).to_numpy(dtype=object)[inverse]
+
+
+# Função para gerar um ledger sintético determinístico no layout das abas
+def generate_ledger(n_rows, seed=0, year=2025, month=1, months=1):
+    rng = np.random.default_rng(seed)
+    n_rows = int(n_rows)
+
+    # Dias em ordem crescente, distribuídos pelos meses pedidos (dentro do mesmo ano)
+    month_starts = pd.date_range(f'{year}-{month:02d}-01', periods=months, freq='MS')
+    first_day = month_starts[0]
+    last_day = month_starts[-1] + pd.offsets.MonthEnd(0)
+    offsets = np.sort(rng.integers(0, (last_day - first_day).days + 1, n_rows))
+    calendar = pd.date_range(first_day, last_day, freq='D').strftime('%d/%m').to_numpy(dtype=object)
+
+    market_codes = rng.integers(0, len(SYNTHETIC_MARKETS), n_rows)
+    markets = SYNTHETIC_MARKETS[market_codes]
+    odds = np.round(1.2 + rng.gamma(2.0, 0.45, n_rows), 3)
+    stake = STAKES[rng.integers(0, len(STAKES), n_rows)]
+
+    # Resultado com probabilidade próxima da implícita nas odds (com pequena vantagem)
+    win_probability = np.clip(1.04 / odds, 0.02, 0.98)
+    roll = rng.random(n_rows)
+    quarter_line = _QUARTER_LINES[market_codes]
+    whole_line = _WHOLE_LINES[market_codes]
+    partial = rng.random(n_rows)
+
+    results = np.where(roll < win_probability, 'Green', 'Red').astype(object)
+    results[quarter_line & (results == 'Green') & (partial < 0.25)] = 'Green/void'
+    results[quarter_line & (results == 'Red') & (partial < 0.25)] = 'Red/void'
+    results[whole_line & (partial < 0.15)] = 'Void'
+
+    profit = np.select(
+        [results == 'Green', results == 'Green/void', results == 'Red', results == 'Red/void'],
+        [stake * (odds - 1), stake * (odds - 1) * 0.5, -stake, -stake * 0.5],
+        default=0.0
+    )
+    balance = np.cumsum(profit)
+
+    ledger = pd.DataFrame({
+        'ID': np.arange(1, n_rows + 1),
+        'Day': calendar[offsets],
+        'League': LEAGUES[rng.integers(0, len(LEAGUES), n_rows)],
+        'Match': 'Home x Away',
+        'Market': markets,
+        'Tip': '',
+        'Odds': _format_decimal(odds, 3),
+        'Stake': _format_decimal(stake, 2, 'R$ '),
+        'Results': results,
+        'Profit': _format_decimal(profit, 2),
+        'Balance': _format_decimal(balance, 2, 'R$ '),
+        'Tipster': TIPSTERS[rng.integers(0, len(TIPSTERS), n_rows)],
+        'Notes': '',
+    })
+    return ledger[SHEET_COLUMNS]
+
+
+# Função para gerar o CSV (bytes) de um ledger sintético, como o exportado pelo gviz
+def generate_csv(n_rows, seed=0, year=2025, month=1, months=1):
+    return generate_ledger(n_rows, seed=seed, year=year, month=month, months=months).to_csv(
+        index=False
+    ).encode('utf-8')
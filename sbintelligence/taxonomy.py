@@ -0,0 +1,184 @@
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .ledger import ledger_version
+from .settlement import MARKETS, settle, win_weights
+
+
+# Linha do mercado (handicap ou total): "-0.5", "+1", "2,5"
+_LINE = re.compile(r'^[+-]?\d+(?:[.,]\d+)?$')
+
+# Faixas de odds do agrupamento "Odds bucket"
+ODDS_BINS = [1.0, 1.5, 1.75, 2.0, 2.5, 3.0, 5.0, np.inf]
+ODDS_LABELS = ['< 1.50', '1.50–1.74', '1.75–1.99', '2.00–2.49', '2.50–2.99', '3.00–4.99', '5.00+']
+
+# Dias da semana na ordem do calendário
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Agrupamentos derivados do ledger (além das colunas de texto da planilha, como League e Tipster)
+BUILTIN_DIMENSIONS = ['Market family', 'Market line', 'AH line', 'Side', 'Odds bucket', 'Weekday']
+
+# Número de versões de ledger com os mercados já analisados em memória
+PARSED_VERSIONS = 8
+
+# Colunas de texto que não servem como agrupamento (identificam a aposta, são valores ou já estão na taxonomia)
+_NON_DIMENSIONS = {'Day', 'Match', 'Market', 'Results', 'Notes', 'Tip', 'Profit', 'Balance'}
+
+
+# Função para decompor o texto de um mercado em família, linha, lado e estatística
+def parse_market(text, markets=MARKETS):
+    text = str(text).strip()
+    tokens = text.split()
+    lowered = text.lower()
+
+    # Famílias conhecidas têm prioridade (mesma regra do "Profit by Market"); as demais
+    # são identificadas pela primeira palavra, sem precisar de código novo
+    family = next((market for market in markets if market.lower() in lowered), None)
+    if family is None:
+        family = tokens[0] if tokens else 'Other'
+
+    line = None
+    words = []
+    for token in tokens:
+        if line is None and _LINE.match(token):
+            line = float(token.replace(',', '.'))
+        elif token.lower() not in family.lower().split():
+            words.append(token)
+
+    # Lado: Over/Under pela família, handicap pelo sinal da linha, demais pela palavra seguinte
+    if family in ('Over', 'Under'):
+        side = family
+    elif family == 'AH' and line is not None:
+        side = 'Favourite' if line < 0 else 'Underdog' if line > 0 else 'Level'
+    else:
+        side = words.pop(0) if words else None
+
+    return family, line, side, ' '.join(words) or None
+
+
+# Função para formatar a linha de um mercado ("AH -0.5", "Over 2.5 Corners")
+def market_label(family, line, stat):
+    if line is None:
+        line_text = None
+    else:
+        line_text = f'{line:+g}' if family == 'AH' else f'{line:g}'
+    return ' '.join(part for part in (family, line_text, stat) if part)
+
+
+# Função para montar uma coluna categórica a partir dos valores de cada texto distinto
+def _expand(values, codes):
+    # A última posição (None) corresponde ao código -1 (mercado vazio); categorias em ordem alfabética
+    level_codes, levels = pd.factorize(pd.Series(list(values) + [None], dtype=object), sort=True)
+    return pd.Categorical.from_codes(level_codes[codes], categories=levels)
+
+
+# Mercados já analisados por versão de ledger: (versão, famílias) -> {texto: (família, linha, lado, estatística)}
+_parsed = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+# Função para obter os mercados já analisados de uma versão de ledger (None quando não versionado)
+def _parsed_markets(version, markets):
+    if version is None:
+        return {}
+    with _parsed_lock:
+        key = (version, tuple(markets))
+        parsed = _parsed.get(key)
+        if parsed is None:
+            parsed = _parsed[key] = {}
+            while len(_parsed) > PARSED_VERSIONS:
+                _parsed.popitem(last=False)
+        else:
+            _parsed.move_to_end(key)
+        return parsed
+
+
+# Função para obter a taxonomia (Family, Line, Side, Stat, Label) de cada aposta,
+# analisando cada texto distinto uma vez (por versão do ledger) e expandindo pelos códigos
+def market_taxonomy(market_values, markets=MARKETS, version=None):
+    if isinstance(market_values.dtype, pd.CategoricalDtype):
+        codes, uniques = market_values.cat.codes.to_numpy(), market_values.cat.categories
+    else:
+        codes, uniques = pd.factorize(market_values)
+
+    # Recortes do mesmo ledger reaproveitam a análise dos textos já vistos
+    known = _parsed_markets(version, markets)
+    parsed = []
+    for value in uniques:
+        result = known.get(value)
+        if result is None:
+            result = known[value] = parse_market(value, markets)
+        parsed.append(result)
+    families = [family for family, _, _, _ in parsed]
+    lines = np.array([np.nan if line is None else line for _, line, _, _ in parsed] + [np.nan])
+    return pd.DataFrame({
+        'Family': _expand(families, codes),
+        'Line': lines[codes],
+        'Side': _expand([side for _, _, side, _ in parsed], codes),
+        'Stat': _expand([stat for _, _, _, stat in parsed], codes),
+        'Label': _expand([market_label(family, line, stat) for family, line, _, stat in parsed], codes),
+    }, index=market_values.index)
+
+
+# Função para listar os agrupamentos disponíveis para um ledger
+def breakdown_dimensions(df):
+    extra = [
+        col for col in df.columns
+        if col not in _NON_DIMENSIONS
+        and (df[col].dtype == object or isinstance(df[col].dtype, pd.CategoricalDtype))
+    ]
+    return BUILTIN_DIMENSIONS + extra
+
+
+# Função para obter a chave de agrupamento de cada aposta para um agrupamento
+def dimension_values(df, dimension):
+    if dimension in ('Market family', 'Market line', 'AH line', 'Side'):
+        taxonomy = market_taxonomy(df['Market'], version=ledger_version(df))
+        if dimension == 'Market family':
+            return taxonomy['Family']
+        if dimension == 'Side':
+            return taxonomy['Side']
+        if dimension == 'AH line':
+            return taxonomy['Line'].where(taxonomy['Family'] == 'AH')
+        return taxonomy['Label']
+    if dimension == 'Odds bucket':
+        return pd.cut(df['Odds'].astype('float64'), ODDS_BINS, right=False, labels=ODDS_LABELS)
+    if dimension == 'Weekday':
+        return pd.Categorical.from_codes(
+            df['Day'].dt.dayofweek.fillna(-1).astype(int), categories=WEEKDAYS
+        )
+    return df[dimension]
+
+
+# Função para calcular apostas, profit, stake, ROI e taxa de acerto por qualquer agrupamento (um único groupby)
+def grouped_breakdown(df, dimension):
+    # Agrupamentos categóricos (Weekday, Odds bucket) mantêm a ordem das categorias
+    keys = pd.Series(dimension_values(df, dimension), index=df.index)
+    pnl = df['PnL'] if 'PnL' in df.columns else settle(df)
+
+    wins, counted = win_weights(df['Results']) if 'Results' in df.columns else (np.zeros(len(df)),) * 2
+
+    frame = pd.DataFrame({
+        'Key': keys,
+        'Profit': np.nan_to_num(pnl.to_numpy(dtype='float64')),
+        'Stake': np.nan_to_num(df['Stake'].to_numpy(dtype='float64')) if 'Stake' in df.columns else 0.0,
+        'Wins': wins,
+        'Counted': counted,
+    })
+    grouped = frame.groupby('Key', sort=True, observed=True, dropna=True).agg(
+        Bets=('Profit', 'size'),
+        Profit=('Profit', 'sum'),
+        Stake=('Stake', 'sum'),
+        Wins=('Wins', 'sum'),
+        Counted=('Counted', 'sum'),
+    ).rename_axis(dimension).reset_index()
+
+    grouped['ROI'] = np.divide(100 * grouped['Profit'], grouped['Stake'],
+                               out=np.full(len(grouped), np.nan), where=grouped['Stake'] > 0)
+    grouped['Win Rate'] = np.divide(100 * grouped['Wins'], grouped['Counted'],
+                                    out=np.full(len(grouped), np.nan), where=grouped['Counted'] > 0)
+    return grouped.drop(columns=['Wins', 'Counted'])
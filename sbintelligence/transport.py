@@ -0,0 +1,203 @@
+import io
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+
+
+logger = logging.getLogger('sbintelligence.transport')
+
+# Status HTTP que valem nova tentativa (limite de requisições e falhas temporárias do servidor)
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+# Resultado de uma busca (conteúdo e de onde ele veio)
+class FetchResult:
+    def __init__(self, content, status, attempts, stale=False, fetched_at=None):
+        self.content = content
+        self.status = status  # 200, 304 (não modificado) ou None (última cópia válida)
+        self.attempts = attempts
+        self.stale = stale
+        self.fetched_at = fetched_at
+
+    @property
+    def not_modified(self):
+        return self.status == 304
+
+
+# Última resposta válida de uma URL (validadores para a revalidação e conteúdo para o fallback)
+class _Copy:
+    def __init__(self, content, etag, last_modified, fetched_at):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+
+# Camada HTTP das buscas: conexões reaproveitadas, timeouts, novas tentativas com espera
+# aleatória crescente, respostas comprimidas, revalidação por ETag/Last-Modified e
+# fallback para a última cópia válida quando a planilha está fora do ar
+class SheetTransport:
+    def __init__(self, connect_timeout=3.05, read_timeout=20, retries=3, backoff=0.5,
+                 max_backoff=8, pool_size=10, max_bytes=64 * 1024 * 1024,
+                 session=None, sleep=time.sleep, clock=time.time, rng=None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = max(0, int(retries))
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_bytes = max_bytes
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._session = session or self._new_session(pool_size)
+        self._copies = OrderedDict()  # url -> _Copy (LRU limitado por max_bytes)
+        self._stale = {}  # aba (ou url) -> momento da última cópia válida servida no lugar da planilha
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.retried = 0
+        self.fallbacks = 0
+        self.bytes_received = 0
+
+    @staticmethod
+    def _new_session(pool_size):
+        # requests é importado ao criar o transporte (depois do primeiro desenho da página)
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # As novas tentativas são feitas aqui (com espera aleatória), não pelo urllib3
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Accept': 'text/csv, */*'})
+        return session
+
+    # Espera antes da tentativa seguinte: "full jitter" sobre o backoff exponencial
+    # (ou o Retry-After do servidor, limitado a max_backoff)
+    def _delay(self, attempt, response=None):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _get_copy(self, url):
+        with self._lock:
+            copy = self._copies.get(url)
+            if copy is not None:
+                self._copies.move_to_end(url)
+            return copy
+
+    def _store(self, url, copy):
+        with self._lock:
+            previous = self._copies.pop(url, None)
+            if previous is not None:
+                self._bytes -= len(previous.content)
+            if len(copy.content) > self.max_bytes:
+                return
+            self._copies[url] = copy
+            self._bytes += len(copy.content)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._copies.popitem(last=False)
+                self._bytes -= len(evicted.content)
+
+    def _request(self, url, copy):
+        headers = {}
+        if copy is not None:
+            if copy.etag:
+                headers['If-None-Match'] = copy.etag
+            if copy.last_modified:
+                headers['If-Modified-Since'] = copy.last_modified
+        with self._lock:
+            self.requests += 1
+        return self._session.get(url, headers=headers, timeout=self.timeout)
+
+    # Busca uma URL; respostas 304 reaproveitam a última cópia e qualquer falha (rede, 5xx após as
+    # novas tentativas ou 4xx) recorre a ela (stale=True) quando existir. `key` identifica a aba
+    # no aviso de cópia desatualizada (várias URLs da mesma aba, como as de sincronização incremental)
+    def fetch(self, url, key=None):
+        import requests
+
+        key = url if key is None else key
+        copy = self._get_copy(url)
+        error = None
+
+        for attempt in range(self.retries + 1):
+            response = None
+            try:
+                response = self._request(url, copy)
+                if response.status_code == 304 and copy is not None:
+                    with self._lock:
+                        self.not_modified += 1
+                        self._stale.pop(key, None)
+                    copy.fetched_at = self._clock()
+                    return FetchResult(copy.content, 304, attempt + 1, fetched_at=copy.fetched_at)
+                if response.status_code not in RETRY_STATUS:
+                    response.raise_for_status()
+                    content = response.content
+                    with self._lock:
+                        self.bytes_received += len(content)
+                        self._stale.pop(key, None)
+                    fetched_at = self._clock()
+                    self._store(url, _Copy(content, response.headers.get('ETag'),
+                                           response.headers.get('Last-Modified'), fetched_at))
+                    return FetchResult(content, response.status_code, attempt + 1, fetched_at=fetched_at)
+                error = requests.HTTPError(f'{response.status_code} {response.reason}', response=response)
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                error = e
+            except requests.RequestException as e:
+                # 4xx (aba inexistente, sem permissão) e demais falhas definitivas: nova tentativa não adianta
+                if copy is None:
+                    raise
+                error = e
+                break
+
+            if attempt < self.retries:
+                with self._lock:
+                    self.retried += 1
+                self._sleep(self._delay(attempt, response))
+
+        if copy is None:
+            raise error
+
+        logger.warning('Falha ao buscar %s (%s); usando a última cópia válida', url, error)
+        with self._lock:
+            self.fallbacks += 1
+            self._stale[key] = copy.fetched_at
+        return FetchResult(copy.content, None, attempt + 1, stale=True, fetched_at=copy.fetched_at)
+
+    # Conteúdo da URL como arquivo em memória (entrada do read_csv)
+    def open(self, url, key=None):
+        return io.BytesIO(self.fetch(url, key).content)
+
+    # Momento da última cópia válida que está sendo servida no lugar da planilha para uma aba
+    # (a `key` usada nas buscas, ou a URL) ou None
+    def stale_since(self, key):
+        with self._lock:
+            return self._stale.get(key)
+
+    def forget(self):
+        with self._lock:
+            self._copies.clear()
+            self._stale.clear()
+            self._bytes = 0
+
+    def close(self):
+        self._session.close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'not_modified': self.not_modified,
+                'retries': self.retried,
+                'fallbacks': self.fallbacks,
+                'bytes_received': self.bytes_received,
+                'stored_bytes': self._bytes,
+            }
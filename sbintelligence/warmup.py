@@ -0,0 +1,58 @@
+import importlib
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger('sbintelligence.warmup')
+
+# Módulos importados sob demanda pelo dashboard (gráficos, buscas HTTP)
+HEAVY_MODULES = ('plotly.graph_objects', 'plotly.express', 'requests')
+
+
+# Aquecimento do processo em segundo plano: importa os módulos pesados e executa as cargas
+# (ex.: buscar e converter a aba do mês padrão para o cache compartilhado), sem bloquear a página
+class Warmup:
+    def __init__(self, loaders=(), modules=HEAVY_MODULES):
+        self.loaders = list(loaders)  # lista de (nome, função sem argumentos)
+        self.modules = tuple(modules)
+        self.timings = {}  # etapa -> segundos
+        self.errors = {}  # etapa -> exceção
+        self._done = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        try:
+            for name in self.modules:
+                start = time.perf_counter()
+                try:
+                    importlib.import_module(name)
+                except ImportError as e:
+                    self.errors[f'import {name}'] = e
+                self.timings[f'import {name}'] = time.perf_counter() - start
+
+            # Falhas não interrompem as demais cargas; a página busca de novo quando precisar
+            for name, loader in self.loaders:
+                start = time.perf_counter()
+                try:
+                    loader()
+                except Exception as e:
+                    self.errors[name] = e
+                    logger.warning('Falha no aquecimento (%s): %s', name, e)
+                self.timings[name] = time.perf_counter() - start
+        finally:
+            self._done.set()
+            logger.info('Aquecimento concluído em %.0f ms', sum(self.timings.values()) * 1000)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='sbi-warmup', daemon=True)
+            self._thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    @property
+    def done(self):
+        return self._done.is_set()
@@ -0,0 +1,13 @@
+import os
+
+# Abas de exemplo no layout da planilha (valores "R$ 1,50", células vazias e valores inválidos)
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def fixture_path(name):
+    return os.path.join(FIXTURES, name)
+
+
+# A biblioteca não depende do Copy-on-Write global do dashboard: avisos de cópia viram erro
+def pytest_configure(config):
+    config.addinivalue_line('filterwarnings', 'error::pandas.errors.SettingWithCopyWarning')
@@ -0,0 +1,148 @@
+import threading
+import time
+
+import pytest
+
+from sbintelligence.cache import TTLCache
+
+
+# Relógio controlado pelo teste (segundos)
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set('a', 1)
+
+    clock.now = 9.9
+    assert cache.get('a') == 1
+    assert 'a' in cache
+
+    clock.now = 10.0
+    assert cache.get('a') is None
+    assert 'a' not in cache
+    assert len(cache) == 0
+
+
+def test_ttl_none_never_expires(clock):
+    cache = TTLCache(ttl=None, clock=clock)
+    cache.set('a', 1)
+    clock.now = 1e9
+    assert cache.get('a') == 1
+
+
+def test_age_follows_the_clock(clock):
+    cache = TTLCache(ttl=60, clock=clock)
+    assert cache.age('a') is None
+    cache.set('a', 1)
+    clock.now = 12.5
+    assert cache.age('a') == 12.5
+
+
+def test_hit_and_miss_counters(clock):
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.get('a')
+    cache.set('a', 1)
+    cache.get('a')
+    cache.get('a')
+    assert cache.get_or_load('a', lambda: 2) == 1
+    assert cache.get_or_load('b', lambda: 2) == 2
+
+    stats = cache.stats()
+    assert stats['hits'] == 3
+    assert stats['misses'] == 2
+    assert stats['entries'] == 2
+
+
+def test_lru_eviction_by_bytes(clock):
+    cache = TTLCache(ttl=None, max_bytes=3 * 1000, clock=clock)
+    for key in 'abc':
+        cache.set(key, b'x' * 900)
+    cache.get('a')  # "a" passa a ser a mais recente; "b" é a menos usada
+    cache.set('d', b'x' * 900)
+
+    assert 'b' not in cache
+    assert all(key in cache for key in 'acd')
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] <= cache.max_bytes
+
+
+def test_value_larger_than_limit_is_not_stored(clock):
+    cache = TTLCache(ttl=None, max_bytes=100, clock=clock)
+    cache.set('big', b'x' * 1000)
+    assert 'big' not in cache
+    assert cache.stats()['bytes'] == 0
+
+
+def test_replacing_a_key_updates_the_size(clock):
+    cache = TTLCache(ttl=None, clock=clock)
+    cache.set('a', b'x' * 1000)
+    cache.set('a', b'x' * 10)
+    assert cache.stats()['bytes'] < 1000
+    assert len(cache) == 1
+
+
+def test_invalidate_one_key_and_all(clock):
+    cache = TTLCache(ttl=None, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.invalidate('a')
+    assert 'a' not in cache and 'b' in cache
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.stats()['bytes'] == 0
+
+
+def test_failed_load_is_not_cached(clock):
+    cache = TTLCache(ttl=None, clock=clock)
+    assert cache.get_or_load('a', lambda: None) is None
+    assert cache.get_or_load('a', lambda: 1) == 1
+
+
+def test_expired_entry_is_reloaded(clock):
+    cache = TTLCache(ttl=10, clock=clock)
+    loads = []
+    loader = lambda: loads.append(1) or len(loads)  # noqa: E731
+    assert cache.get_or_load('a', loader) == 1
+    clock.now = 5
+    assert cache.get_or_load('a', loader) == 1
+    clock.now = 10
+    assert cache.get_or_load('a', loader) == 2
+
+
+def test_concurrent_get_or_load_runs_loader_once():
+    cache = TTLCache(ttl=None)
+    calls = []
+    start = threading.Barrier(8)
+
+    def loader():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)  # Mantém a carga em andamento enquanto as outras threads chegam
+        return 'tab'
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(cache.get_or_load('Feb2025', loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ['tab'] * 8
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hits'] == 7
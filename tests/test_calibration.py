@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence import calibration
+from sbintelligence.calibration import bootstrap_sums, calibration_table, calibration_values
+from sbintelligence.ingest import parse_ledger
+from sbintelligence.settlement import WIN_WEIGHTS, add_settlement
+from sbintelligence.synthetic import generate_ledger
+from sbintelligence.taxonomy import ODDS_BINS, ODDS_LABELS, dimension_values
+
+
+def bets(rows):
+    df = pd.DataFrame(rows, columns=['Odds', 'Results'])
+    df['Stake'] = 10.0
+    return add_settlement(df)
+
+
+# Ledger pequeno com as somas de cada faixa calculadas à mão
+HAND_LEDGER = [
+    (1.25, 'Green'), (1.25, 'Red'),
+    (2.0, 'Green/void'), (2.0, 'Red/void'), (2.0, 'Green'),
+    (10.0, 'Red'), (50.0, 'Green'),
+    # Fora da calibração: sem resultado válido, sem odds ou odds abaixo da primeira faixa
+    (2.0, 'Void'), (2.0, None), (np.nan, 'Green'), (0.5, 'Green'),
+]
+
+
+def test_bins_include_the_unbounded_upper_edge():
+    odds = [1.0, 1.49, 1.5, 2.0, 4.99, 5.0, 1000.0, 0.99, np.inf]
+    bucket, _, kept = calibration_values(bets([(value, 'Green') for value in odds]))
+    labels = [ODDS_LABELS[b] for b in bucket]
+    assert labels == ['< 1.50', '< 1.50', '1.50–1.74', '2.00–2.49', '3.00–4.99', '5.00+', '5.00+']
+    # Odds abaixo de 1 e infinitas ficam fora de qualquer faixa
+    assert list(kept) == odds[:7]
+    assert ODDS_BINS[-1] == np.inf
+
+
+def test_bins_match_the_odds_bucket_dimension():
+    df = add_settlement(parse_ledger(generate_ledger(2000, seed=8), year=2025))
+    # Apenas apostas com resultado válido entram na calibração
+    df = df[df['Results'].isin(WIN_WEIGHTS)]
+    bucket, _, _ = calibration_values(df)
+    counted = np.bincount(bucket, minlength=len(ODDS_LABELS))
+    expected = dimension_values(df, 'Odds bucket').value_counts().reindex(ODDS_LABELS)
+    assert list(counted) == list(expected)
+
+
+def test_hand_computed_expected_and_realized_win_rates():
+    table = calibration_table(bets(HAND_LEDGER), n_samples=200).set_index('Odds bucket')
+    assert list(table.index) == ['< 1.50', '2.00–2.49', '5.00+']
+
+    low = table.loc['< 1.50']
+    assert low['Bets'] == 2
+    assert low['Expected Wins'] == pytest.approx(2 / 1.25)
+    assert low['Implied %'] == pytest.approx(80)
+    assert low['Win Rate %'] == pytest.approx(50)
+    assert low['Edge (pp)'] == pytest.approx(-30)
+    assert low['Profit'] == pytest.approx(2.5 - 10)
+    assert low['ROI'] == pytest.approx(-37.5)
+
+    # Void conta como meia aposta: vitórias 0.5 + 1, apostas válidas 0.5 + 0.5 + 1
+    even = table.loc['2.00–2.49']
+    assert even['Bets'] == 3
+    assert even['Avg Odds'] == pytest.approx(2.0)
+    assert even['Wins'] == pytest.approx(1.5)
+    assert even['Expected Wins'] == pytest.approx(1.0)
+    assert even['Implied %'] == pytest.approx(50)
+    assert even['Win Rate %'] == pytest.approx(75)
+    assert even['Profit'] == pytest.approx(5 - 5 + 10)
+    assert even['ROI'] == pytest.approx(50)
+
+    long_shots = table.loc['5.00+']
+    assert long_shots['Avg Odds'] == pytest.approx(30)
+    assert long_shots['Expected Wins'] == pytest.approx(0.1 + 0.02)
+    assert long_shots['Implied %'] == pytest.approx(6)
+    assert long_shots['Win Rate %'] == pytest.approx(50)
+    assert long_shots['Profit'] == pytest.approx(-10 + 490)
+
+
+def test_empty_bins_are_dropped():
+    table = calibration_table(bets([(1.6, 'Green'), (1.7, 'Red')]), n_samples=50)
+    assert list(table['Odds bucket']) == ['1.50–1.74']
+    assert table['Bets'].tolist() == [2]
+
+
+def test_ledger_without_calibrated_bets():
+    table = calibration_table(bets([(2.0, 'Void'), (np.nan, 'Green')]), n_samples=50)
+    assert table.empty
+    assert 'Win Rate Low' in table.columns
+
+
+def test_intervals_contain_the_estimates():
+    df = add_settlement(parse_ledger(generate_ledger(3000, seed=9), year=2025))
+    table = calibration_table(df, n_samples=300)
+    assert (table['Win Rate Low'] <= table['Win Rate %']).all()
+    assert (table['Win Rate %'] <= table['Win Rate High']).all()
+    assert (table['Profit Low'] <= table['Profit High']).all()
+
+
+def test_unanimous_bin_has_a_degenerate_interval():
+    table = calibration_table(bets([(1.3, 'Green')] * 20), n_samples=100)
+    assert table.loc[0, ['Win Rate Low', 'Win Rate %', 'Win Rate High']].tolist() == [100, 100, 100]
+
+
+def test_bootstrap_sums_match_resampling_loop():
+    values = np.random.default_rng(3).normal(size=(40, 5))
+    sums = bootstrap_sums(values, n_samples=25, rng=np.random.default_rng(7))
+
+    picks = np.random.default_rng(7).integers(0, len(values), size=(25, len(values)))
+    expected = np.array([values[sample].sum(axis=0) for sample in picks])
+    np.testing.assert_allclose(sums, expected, rtol=1e-12)
+
+
+def test_large_bins_use_the_normal_limit(monkeypatch):
+    monkeypatch.setattr(calibration, 'BATCH_CELLS', 100)
+    values = np.random.default_rng(4).normal(1.0, 0.5, size=(200, 2))
+    sums = bootstrap_sums(values, n_samples=2000)
+    assert sums.shape == (2000, 2)
+    np.testing.assert_allclose(sums.mean(axis=0), values.sum(axis=0), rtol=0.02)
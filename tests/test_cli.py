@@ -0,0 +1,54 @@
+import json
+import shutil
+
+import pytest
+
+from sbintelligence.cli import main
+
+from conftest import fixture_path
+
+
+def run_report(tmp_path, paths):
+    output = tmp_path / 'report.json'
+    assert main([*map(str, paths), '--combined', '--output', str(output)]) == 0
+    with open(output, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def empty_csv(tmp_path):
+    # Aba nova da planilha: apenas o cabeçalho
+    with open(fixture_path('Feb2025.csv'), encoding='utf-8') as f:
+        header = f.readline()
+    path = tmp_path / 'Apr2025.csv'
+    path.write_text(header, encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('order', [(0, 1, 2), (1, 0, 2), (2, 1, 0), (1, 2, 0)])
+def test_combined_ignores_empty_ledger_in_any_order(tmp_path, empty_csv, order):
+    paths = [tmp_path / 'Mar2025.csv', empty_csv, tmp_path / 'Feb2025.csv']
+    for name in ('Mar2025.csv', 'Feb2025.csv'):
+        shutil.copy(fixture_path(name), tmp_path / name)
+    report = run_report(tmp_path, [paths[i] for i in order])
+
+    assert report['Apr2025']['kpis']['bets'] == 0
+    assert report['Apr2025']['daily'] is None
+
+    combined = report['ALL']
+    assert combined['kpis']['bets'] == report['Feb2025']['kpis']['bets'] + report['Mar2025']['kpis']['bets']
+    assert combined['kpis']['profit'] == pytest.approx(
+        report['Feb2025']['kpis']['profit'] + report['Mar2025']['kpis']['profit']
+    )
+    # Saldo acumulado de fevereiro para março
+    assert combined['daily'][0]['Day'] == '2025-02-01'
+    assert combined['daily'][0]['Balance'] == pytest.approx(report['Feb2025']['daily'][0]['Balance'])
+    assert combined['daily'][-1]['Day'] == '2025-03-31'
+    assert combined['daily'][-1]['Balance'] == pytest.approx(combined['kpis']['profit'])
+
+
+def test_only_empty_ledgers(tmp_path, empty_csv):
+    other = tmp_path / 'May2025.csv'
+    shutil.copy(empty_csv, other)
+    report = run_report(tmp_path, [empty_csv, other])
+    assert set(report) == {'Apr2025', 'May2025'}
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence.compact import compact_ledger
+from sbintelligence.cube import build_cube
+from sbintelligence.daily import daily_balance, graph_balance
+from sbintelligence.ledger import concat_tabs, day_slice, prepare_tab, sort_by_day
+from sbintelligence.metrics import kpis
+from sbintelligence.registry import tag_ledger
+from sbintelligence.settlement import market_breakdown
+from sbintelligence.synthetic import generate_ledger
+
+# Tolerância relativa entre as somas do cubo (por célula) e as do caminho por aposta
+TOLERANCE = 2e-12
+
+
+def tabs(rows, seed, months):
+    frames = []
+    for i, month in enumerate(months):
+        raw = generate_ledger(rows, seed=seed + i, year=2025, month=month).astype(str).replace('nan', np.nan)
+        frames.append(prepare_tab(raw, pd.Timestamp(2025, month, 1).strftime('%b%Y')))
+    return concat_tabs(frames)
+
+
+def canonical(df):
+    return sort_by_day(compact_ledger(df))
+
+
+LEDGERS = {
+    'single tab': lambda: canonical(tabs(1500, 0, [1])),
+    'several tabs': lambda: canonical(tabs(1000, 0, [1, 2, 3])),
+    'several ledgers': lambda: canonical(concat_tabs([
+        tag_ledger(tabs(1000, 0, [1, 2, 3]), 'A', ['A', 'B']),
+        tag_ledger(tabs(800, 10, [2, 3]), 'B', ['A', 'B']),
+    ])),
+}
+
+
+@pytest.fixture(scope='module', params=list(LEDGERS))
+def ledger(request):
+    return LEDGERS[request.param]()
+
+
+def random_slices(count, seed=1):
+    rng = np.random.default_rng(seed)
+    origin = pd.Timestamp('2024-12-25')
+    for _ in range(count):
+        first, last = sorted(rng.integers(0, 100, 2))
+        yield origin + pd.Timedelta(days=int(first)), origin + pd.Timedelta(days=int(last))
+
+
+def assert_close(actual, expected):
+    np.testing.assert_allclose(np.asarray(actual, dtype='float64'), np.asarray(expected, dtype='float64'),
+                               rtol=TOLERANCE, atol=1e-9)
+
+
+def test_kpis_match_row_path(ledger):
+    cube = build_cube(ledger)
+    for start, end in random_slices(30):
+        expected, actual = kpis(day_slice(ledger, start, end)), cube.slice(start, end).kpis()
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            if value is None or actual[key] is None:
+                assert actual[key] is value, key
+            else:
+                assert_close(actual[key], value)
+
+
+def test_market_breakdown_matches_row_path(ledger):
+    cube = build_cube(ledger)
+    for start, end in random_slices(30):
+        expected, actual = market_breakdown(day_slice(ledger, start, end)), cube.slice(start, end).market_breakdown()
+        assert list(actual['Market']) == list(expected['Market'])
+        for col in ('Profit', 'Stake', 'ROI'):
+            assert_close(actual[col], expected[col])
+
+
+def test_daily_matches_row_path(ledger):
+    cube = build_cube(ledger)
+    for start, end in random_slices(30):
+        part = day_slice(ledger, start, end)
+        actual = cube.slice(start, end).daily()
+        if not len(part):
+            assert actual.empty
+            continue
+        expected = daily_balance(graph_balance(part))
+        assert list(actual['Day']) == list(expected['Day'])
+        for col in ('Balance', 'Stake', 'Daily_Profit'):
+            assert_close(actual[col], expected[col])
+
+
+def test_full_ledger_without_slice(ledger):
+    cube = build_cube(ledger)
+    assert len(cube) <= len(ledger)
+    assert cube.kpis()['bets'] == len(ledger)
+    assert_close(cube.market_breakdown()['Profit'], market_breakdown(ledger)['Profit'])
+
+
+def test_by_ledger_matches_row_path():
+    ledger = LEDGERS['several ledgers']()
+    cube = build_cube(ledger)
+    for start, end in random_slices(10, seed=2):
+        part = day_slice(ledger, start, end)
+        views = cube.slice(start, end).by_ledger()
+        assert list(views) == [label for label in ('A', 'B') if (part['Ledger'] == label).any()]
+        for label, view in views.items():
+            rows = part[part['Ledger'] == label]
+            assert view.kpis()['bets'] == len(rows)
+            assert_close(view.kpis()['total_stakes'], kpis(rows)['total_stakes'])
+            assert_close(view.market_breakdown()['Profit'], market_breakdown(rows)['Profit'])
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence.daily import complete_days, daily_balance, graph_balance
+from sbintelligence.ingest import read_ledger_csv
+from sbintelligence.ledger import concat_tabs, day_slice, prepare_tab
+
+from conftest import fixture_path
+
+
+# Cálculo original do gráfico de saldo (lucro do dia via apply linha a linha e mês completo),
+# usado como referência
+def legacy_daily(df):
+    df_graph = df.dropna(subset=['Day', 'Balance']).copy()
+    df_last_balance = df_graph.groupby(df_graph['Day'].dt.date).agg({
+        'Balance': 'last',
+        'Stake': 'sum',
+    }).reset_index()
+    df_last_balance['Day'] = pd.to_datetime(df_last_balance['Day'])
+
+    df_last_balance['Daily_Profit'] = df_last_balance.apply(lambda row:
+        row['Balance'] - df_last_balance.loc[
+            df_last_balance.index < row.name, 'Balance'
+        ].iloc[-1] if row.name > 0 else row['Balance'],
+        axis=1
+    )
+
+    first_day = df_last_balance['Day'].min().replace(day=1)
+    last_day = df_last_balance['Day'].max().replace(day=28) + pd.DateOffset(days=4)
+    last_day = last_day - pd.DateOffset(days=last_day.day)
+    full_date_range = pd.date_range(start=first_day, end=last_day, freq='D')
+
+    df_complete = pd.DataFrame({'Day': full_date_range})
+    df_complete = df_complete.merge(df_last_balance, on='Day', how='left')
+    df_complete['Balance'] = df_complete['Balance'].ffill()
+    df_complete['Daily_Profit'] = df_complete['Daily_Profit'].fillna(0)
+    return df_complete
+
+
+def load_tab(name):
+    return prepare_tab(read_ledger_csv(fixture_path(f'{name}.csv')), name)
+
+
+def load_tabs(*names):
+    return concat_tabs([load_tab(name) for name in names])
+
+
+def current_daily(df):
+    return complete_days(daily_balance(graph_balance(df)))
+
+
+def assert_same_days(daily, legacy):
+    np.testing.assert_array_equal(daily['Day'].to_numpy(), legacy['Day'].to_numpy())
+    for col in ('Balance', 'Stake', 'Daily_Profit'):
+        np.testing.assert_allclose(daily[col].to_numpy(dtype='float64'),
+                                   legacy[col].to_numpy(dtype='float64'), err_msg=col)
+
+
+@pytest.mark.parametrize('name', ['Feb2025', 'Mar2025', 'Dec2024', 'Jan2025'])
+def test_single_tab_matches_legacy_apply(name):
+    df = load_tab(name)
+    assert_same_days(current_daily(df), legacy_daily(df))
+
+
+def test_single_tab_without_balance_delta_matches_legacy_apply():
+    df = load_tab('Feb2025').drop(columns=['Tab', 'Balance_Delta'])
+    assert_same_days(current_daily(df), legacy_daily(df))
+
+
+def test_daily_balance_skips_rows_without_day_or_balance():
+    daily = daily_balance(load_tab('Feb2025'))
+    # Sem data (linha 5), data inválida (31/02) e saldo vazio (linha 9) ficam fora
+    assert daily['Day'].dt.day.tolist() == [1, 2, 4, 5, 7, 28]
+    assert daily['Daily_Profit'].sum() == pytest.approx(daily['Balance'].iloc[-1])
+
+
+def test_slice_starting_mid_tab_uses_opening_balance():
+    df = load_tab('Feb2025')
+    sliced = day_slice(df, '2025-02-04', '2025-02-28')
+    daily = daily_balance(sliced)
+    full = daily_balance(df).set_index('Day')
+    np.testing.assert_allclose(daily['Daily_Profit'].to_numpy(),
+                               full.loc[daily['Day'], 'Daily_Profit'].to_numpy())
+
+
+# Várias abas: o código original não acumulava o saldo entre abas, então cada aba é comparada com
+# o cálculo original feito nela isoladamente; o saldo acumulado soma o fechamento das abas anteriores
+@pytest.mark.parametrize('names', [
+    ('Feb2025', 'Mar2025'),  # vários meses
+    ('Dec2024', 'Jan2025'),  # virada de ano
+    ('Dec2024', 'Jan2025', 'Feb2025', 'Mar2025'),
+])
+def test_multiple_tabs_match_legacy_apply_per_tab(names):
+    daily = current_daily(load_tabs(*names))
+
+    first_month = load_tab(names[0])['Day'].min().replace(day=1)
+    last_month = load_tab(names[-1])['Day'].max() + pd.offsets.MonthEnd(0)
+    assert daily['Day'].iloc[0] == first_month
+    assert daily['Day'].iloc[-1] == last_month
+    assert daily['Day'].diff().dropna().eq(pd.Timedelta(days=1)).all()
+
+    opening = 0.0
+    for name in names:
+        legacy = legacy_daily(load_tab(name))
+        tab_days = daily.set_index('Day').loc[legacy['Day']].reset_index()
+        np.testing.assert_allclose(tab_days['Daily_Profit'].to_numpy(), legacy['Daily_Profit'].to_numpy())
+        np.testing.assert_allclose(tab_days['Stake'].to_numpy(), legacy['Stake'].to_numpy())
+        # Antes da primeira aposta da aba o gráfico mantém o fechamento da aba anterior (sem saldo na primeira)
+        traded = legacy['Balance'].notna().to_numpy()
+        np.testing.assert_allclose(tab_days['Balance'].to_numpy()[~traded],
+                                   opening if name != names[0] else np.nan)
+        np.testing.assert_allclose(tab_days['Balance'].to_numpy()[traded],
+                                   legacy['Balance'].to_numpy()[traded] + opening)
+        opening += legacy['Balance'].iloc[-1]
+
+
+def test_multi_year_days_keep_their_year():
+    daily = daily_balance(graph_balance(load_tabs('Dec2024', 'Jan2025')))
+    assert daily['Day'].dt.year.tolist() == [2024, 2024, 2024, 2025, 2025, 2025]
+    # Dezembro fecha em 20; janeiro começa em -20 dentro da aba
+    assert daily['Balance'].tolist() == [10.0, 0.0, 20.0, 7.0, 30.0, 45.0]
+    assert daily['Daily_Profit'].tolist() == [10.0, -10.0, 20.0, -13.0, 23.0, 15.0]
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from sbintelligence.downsample import lttb
+
+
+SERIES = [0, 1, 5, 2, 3, 4, -6, 1, 2, 0]
+
+
+@pytest.mark.parametrize('n_out', [10, 11, 1000])
+def test_threshold_at_or_above_length_keeps_every_point(n_out):
+    assert lttb(range(10), SERIES, n_out).tolist() == list(range(10))
+
+
+@pytest.mark.parametrize('n_out', [0, 1, 2])
+def test_threshold_below_three_keeps_every_point(n_out):
+    assert lttb(range(10), SERIES, n_out).tolist() == list(range(10))
+
+
+def test_empty_series():
+    assert lttb([], [], 5).tolist() == []
+
+
+def test_known_series():
+    # Blocos [1, 5) e [5, 9): o pico (2, 5) forma o maior triângulo com (0, 0) e a média do bloco
+    # seguinte (6.5, 0.25); depois a queda (6, -6) com (2, 5) e o último ponto (9, 0)
+    assert lttb(range(10), SERIES, 4).tolist() == [0, 2, 6, 9]
+    assert lttb(range(10), SERIES, 5).tolist() == [0, 2, 5, 6, 9]
+
+
+@pytest.mark.parametrize('n, n_out', [(100, 3), (1000, 50), (5000, 2000), (7, 6)])
+def test_first_and_last_points_kept_in_order(n, n_out):
+    rng = np.random.default_rng(n)
+    x = np.cumsum(rng.uniform(0.5, 2, n))
+    y = np.cumsum(rng.normal(size=n))
+    keep = lttb(x, y, n_out)
+    assert len(keep) == n_out
+    assert keep[0] == 0 and keep[-1] == n - 1
+    assert (np.diff(keep) > 0).all()
+
+
+def test_isolated_extremes_survive():
+    y = np.zeros(1000)
+    y[333], y[777] = 50.0, -80.0
+    keep = lttb(np.arange(1000), y, 20)
+    assert 333 in keep and 777 in keep
@@ -0,0 +1,146 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence.ingest import (
+    NUMERIC_COLUMNS, load_ledger_csv, parse_day, parse_ledger, parse_numeric, read_ledger_csv,
+    resolve_csv_engine, year_from_tab,
+)
+
+from conftest import fixture_path
+
+
+ENGINES = ['c', pytest.param('pyarrow', marks=pytest.mark.skipif(
+    resolve_csv_engine('auto') != 'pyarrow', reason='pyarrow não instalado'))]
+
+
+# Conversão original do dashboard (valor a valor), usada como referência
+def convert_to_float(value):
+    if pd.isna(value):
+        return None
+    if isinstance(value, str):
+        value = value.replace('R$', '').replace(' ', '').replace(',', '.')
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Leitura original: colunas convertidas com apply e ano 2025 fixo nas datas "%d/%m"
+def legacy_load(source):
+    df = pd.read_csv(source)
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].apply(convert_to_float)
+    df['Day'] = pd.to_datetime(df['Day'], format='%d/%m', errors='coerce')
+    df['Day'] = df['Day'].apply(lambda x: x.replace(year=2025) if pd.notnull(x) else x)
+    return df.dropna(subset=['Day'])
+
+
+@pytest.mark.parametrize('values, expected', [
+    (['R$ 10', 'R$ 8,50', ' R$ 100 ', 'R$ -1,25'], [10.0, 8.5, 100.0, -1.25]),
+    (['1,85', '2,10', '1.95', '3'], [1.85, 2.10, 1.95, 3.0]),
+    (['', None, np.nan, 'abc', '1.234,56', 'R$'], [np.nan] * 6),
+])
+def test_parse_numeric_matches_convert_to_float(values, expected):
+    series = pd.Series(values, dtype=object)
+    parsed = parse_numeric(series)
+    legacy = series.apply(convert_to_float).astype('float64')
+
+    np.testing.assert_array_equal(parsed.to_numpy(), np.array(expected, dtype='float64'))
+    np.testing.assert_array_equal(parsed.to_numpy(), legacy.to_numpy())
+    assert parsed.index.equals(series.index)
+
+
+def test_parse_numeric_keeps_numeric_columns():
+    series = pd.Series([1, 2, 3], index=[5, 6, 7])
+    parsed = parse_numeric(series)
+    assert parsed.dtype == 'float64'
+    assert parsed.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_parse_numeric_repeated_values_keep_their_positions():
+    series = pd.Series(['R$ 10', None, 'R$ 20', 'R$ 10', 'x', 'R$ 20'])
+    np.testing.assert_array_equal(parse_numeric(series).to_numpy(), [10, np.nan, 20, 10, np.nan, 20])
+
+
+def test_parse_day_uses_the_year():
+    days = pd.Series(['01/02', '31/12', '', None, '31/02', 'x'], dtype=object)
+    parsed = parse_day(days, 2024)
+    assert parsed.iloc[0] == pd.Timestamp('2024-02-01')
+    assert parsed.iloc[1] == pd.Timestamp('2024-12-31')
+    assert parsed.iloc[2:].isna().all()
+
+
+def test_parse_day_leap_year():
+    # O ano fixo na conversão original (2025) não tem 29/02; com o ano da aba, 2024 tem
+    assert parse_day(pd.Series(['29/02']), 2024).iloc[0] == pd.Timestamp('2024-02-29')
+    assert parse_day(pd.Series(['29/02']), 2025).isna().all()
+
+
+@pytest.mark.parametrize('name, default, expected', [
+    ('Feb2025', None, 2025),
+    ('Dec 2024', None, 2024),
+    ('2024-2025', None, 2025),
+    ('May2025 (cópia)', None, 2025),
+    ('Tab12345', 2023, 2023),
+    ('Feb25', 2023, 2023),
+    ('', 2023, 2023),
+    (None, 2023, 2023),
+])
+def test_year_from_tab(name, default, expected):
+    assert year_from_tab(name, default=default) == expected
+
+
+def test_year_from_tab_defaults_to_current_year():
+    assert year_from_tab('Sheet1') == pd.Timestamp.now().year
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_read_ledger_csv_keeps_text_columns(engine):
+    raw = read_ledger_csv(fixture_path('Feb2025.csv'), engine=engine)
+    assert len(raw) == 12
+    for col in ('Day', 'Odds', 'Stake', 'Balance'):
+        assert raw[col].dtype == object
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_load_ledger_csv_matches_legacy_conversion(engine):
+    legacy = legacy_load(fixture_path('Feb2025.csv'))
+    df = load_ledger_csv(fixture_path('Feb2025.csv'), sheet_name='Feb2025', engine=engine)
+
+    # Linhas sem data ou com data inválida (31/02) são descartadas nas duas versões
+    assert df['ID'].tolist() == legacy['ID'].tolist() == [1, 2, 3, 4, 6, 7, 8, 9, 10, 12]
+    assert df['Day'].tolist() == legacy['Day'].tolist()
+    for col in NUMERIC_COLUMNS:
+        np.testing.assert_array_equal(df[col].to_numpy(dtype='float64'),
+                                      legacy[col].to_numpy(dtype='float64'), err_msg=col)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_engines_agree(engine):
+    expected = load_ledger_csv(fixture_path('Mar2025.csv'), sheet_name='Mar2025', engine='c')
+    df = load_ledger_csv(fixture_path('Mar2025.csv'), sheet_name='Mar2025', engine=engine)
+    pd.testing.assert_frame_equal(
+        df[['Day', *NUMERIC_COLUMNS, 'Results']].reset_index(drop=True),
+        expected[['Day', *NUMERIC_COLUMNS, 'Results']].reset_index(drop=True),
+    )
+
+
+def test_load_ledger_csv_takes_the_year_from_the_tab():
+    df = load_ledger_csv(fixture_path('Dec2024.csv'), sheet_name='Dec2024')
+    assert (df['Day'].dt.year == 2024).all()
+    assert df['Day'].max() == pd.Timestamp('2024-12-31')
+
+
+def test_parse_ledger_without_day_column():
+    df = parse_ledger(pd.DataFrame({'Odds': ['1,5', None]}), year=2025)
+    np.testing.assert_array_equal(df['Odds'].to_numpy(), [1.5, np.nan])
+
+
+def test_read_ledger_csv_from_buffer():
+    csv = b'Day,Odds,Stake,Balance,Results\n01/02,"1,85",R$ 10,"R$ 8,50",Green\n'
+    df = parse_ledger(read_ledger_csv(io.BytesIO(csv)), year=2025)
+    assert df[['Odds', 'Stake', 'Balance']].iloc[0].tolist() == [1.85, 10.0, 8.5]
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence.ingest import parse_ledger
+from sbintelligence.ledger import tag_tab
+from sbintelligence.live import RunningAggregates
+from sbintelligence.metrics import kpis
+from sbintelligence.settlement import add_settlement, market_breakdown
+from sbintelligence.synthetic import generate_ledger
+
+
+@pytest.fixture(scope='module')
+def ledger():
+    return tag_tab(add_settlement(parse_ledger(generate_ledger(3000, seed=7), year=2025)), 'Tab')
+
+
+def assert_same_aggregates(aggregates, df):
+    expected = kpis(df)
+    for key, value in aggregates.kpis().items():
+        assert value == pytest.approx(expected[key], rel=1e-9), key
+    pd.testing.assert_frame_equal(aggregates.market_breakdown(), market_breakdown(df), check_exact=False)
+
+
+@pytest.mark.parametrize('chunk_sizes', [[1] * 50, [7, 1, 300, 2], [1000, 1000, 1000]])
+def test_incremental_rows_match_full_recompute(ledger, chunk_sizes):
+    aggregates = RunningAggregates()
+    bounds = np.cumsum([0, *chunk_sizes])
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        aggregates.add(ledger.iloc[start:end])
+        assert_same_aggregates(aggregates, ledger.iloc[:end])
+
+    full = RunningAggregates.from_frame(ledger.iloc[:bounds[-1]])
+    assert aggregates.kpis() == pytest.approx(full.kpis())
+    assert aggregates.results == full.results
+
+
+def test_rest_of_ledger_in_one_step(ledger):
+    aggregates = RunningAggregates.from_frame(ledger.iloc[:10])
+    aggregates.add(ledger.iloc[10:])
+    assert_same_aggregates(aggregates, ledger)
+
+
+def test_copy_is_independent(ledger):
+    aggregates = RunningAggregates.from_frame(ledger.iloc[:100])
+    snapshot = aggregates.copy()
+    aggregates.add(ledger.iloc[100:200])
+    assert snapshot.bets == 100
+    assert_same_aggregates(snapshot, ledger.iloc[:100])
+
+
+def test_empty_and_missing_columns():
+    aggregates = RunningAggregates()
+    aggregates.add(None)
+    aggregates.add(pd.DataFrame())
+    assert aggregates.kpis() == {'bets': 0, 'profit': None, 'total_stakes': None, 'roi': None,
+                                 'win_rate': None, 'avg_odds': None}
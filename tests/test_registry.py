@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from sbintelligence.registry import LedgerSpec, gather_tabs, load_ledger_tabs
+
+
+SPECS = [
+    LedgerSpec('Main', 'https://docs.google.com/spreadsheets/d/MAIN/edit',
+               {'February/2025': 'Feb2025', 'March/2025': 'Mar2025', 'April/2025': 'Apr2025'}),
+    LedgerSpec('Tipster B', 'https://docs.google.com/spreadsheets/d/B/edit',
+               {'March/2025': 'Mar2025', 'April/2025': 'Apr2025'}),
+]
+JOBS = [(spec, name) for spec in SPECS for name in spec.sheet_mapping.values()]
+
+
+# Carga falsa: mede quantas abas são buscadas ao mesmo tempo
+class Loader:
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, spec, name):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if name == 'Apr2025' and spec.label == 'Tipster B':
+            raise ConnectionError('down')
+        if name == 'Feb2025':
+            return None
+        return pd.DataFrame({'Tab': [name]})
+
+
+@pytest.mark.parametrize('max_workers', [1, 2, 3])
+def test_fetches_are_bounded_by_max_workers(max_workers):
+    loader = Loader()
+    frames, errors = load_ledger_tabs(loader, JOBS, max_workers=max_workers)
+    assert loader.peak == max_workers
+    assert all(thread.startswith('sbi-ledgers') for thread in loader.threads)
+    assert sorted(frames) == [('Main', 'Apr2025'), ('Main', 'Mar2025'), ('Tipster B', 'Mar2025')]
+    assert isinstance(errors[('Tipster B', 'Apr2025')], ConnectionError)
+    assert isinstance(errors[('Main', 'Feb2025')], ValueError)
+
+
+def test_executor_is_shut_down_after_gather():
+    async def run():
+        frames, _ = await gather_tabs(Loader(delay=0), JOBS, max_workers=2)
+        # O executor padrão do loop continua disponível para outras tarefas
+        assert await asyncio.to_thread(lambda: threading.current_thread().name) != 'sbi-ledgers_0'
+        return frames
+
+    assert len(asyncio.run(run())) == 3
+    assert not any(thread.name.startswith('sbi-ledgers') for thread in threading.enumerate())
+
+
+def test_no_jobs():
+    assert load_ledger_tabs(Loader(), []) == ({}, {})
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence.ingest import parse_ledger
+from sbintelligence.risk import max_drawdown, risk_summary, rolling_returns, streaks
+from sbintelligence.settlement import add_settlement
+from sbintelligence.synthetic import generate_ledger
+
+
+def synthetic_ledger(rows, seed):
+    return add_settlement(parse_ledger(generate_ledger(rows, seed=seed), year=2025))
+
+
+def pnl_frame(pnl, stake=None):
+    df = pd.DataFrame({'PnL': np.asarray(pnl, dtype='float64')})
+    df['Stake'] = 10.0 if stake is None else stake
+    df['Day'] = pd.date_range('2025-01-01', periods=len(df), freq='D')
+    return df
+
+
+# Drawdown por laço simples (saldo, topo e recuperação aposta a aposta), usado como referência
+def naive_max_drawdown(pnl):
+    balance, peak, peak_at = 0.0, 0.0, 0
+    worst, worst_peak, worst_trough = 0.0, None, None
+    for i, value in enumerate(pnl, start=1):
+        balance += value
+        if balance >= peak:
+            peak, peak_at = balance, i
+        elif peak - balance > worst:
+            worst, worst_peak, worst_trough = peak - balance, peak_at, i
+
+    recovery, balance = None, 0.0
+    if worst_trough is not None:
+        target = sum(pnl[:worst_peak])
+        balance = sum(pnl[:worst_trough])
+        for i in range(worst_trough + 1, len(pnl) + 1):
+            balance += pnl[i - 1]
+            if balance >= target:
+                recovery = i
+                break
+    return worst, worst_peak, worst_trough, recovery
+
+
+# Sequências por laço simples (devoluções ignoradas), usado como referência
+def naive_streaks(pnl):
+    longest = {1: 0, -1: 0}
+    current, sign = 0, 0
+    for value in pnl:
+        if value == 0:
+            continue
+        step = 1 if value > 0 else -1
+        current = current + 1 if step == sign else 1
+        sign = step
+        longest[sign] = max(longest[sign], current)
+    return longest[1], longest[-1], current * sign
+
+
+def test_hand_computed_drawdown():
+    # Saldo: 0, 10, 4, 12, 5, 2, 13 -> topo 12 (aposta 3), fundo 2 (aposta 5), recuperado na aposta 6
+    result = max_drawdown(pnl_frame([10, -6, 8, -7, -3, 11]))
+    assert result['max_drawdown'] == pytest.approx(10)
+    assert (result['peak_bet'], result['trough_bet'], result['recovery_bet']) == (3, 5, 6)
+    assert result['duration_bets'] == 3
+    assert result['duration_days'] == 3
+    assert result['recovered']
+
+
+def test_unrecovered_drawdown_runs_to_the_end():
+    result = max_drawdown(pnl_frame([5, -2, -4, 1]))
+    assert result['max_drawdown'] == pytest.approx(6)
+    assert (result['peak_bet'], result['trough_bet'], result['recovery_bet']) == (1, 3, None)
+    assert result['duration_bets'] == 3
+    assert not result['recovered']
+
+
+def test_no_drawdown():
+    result = max_drawdown(pnl_frame([1, 2, 0, 3]))
+    assert result['max_drawdown'] == 0
+    assert result['peak_bet'] is None and result['recovered']
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2, 3])
+def test_seeded_drawdown_matches_loop(seed):
+    rng = np.random.default_rng(seed)
+    pnl = np.round(rng.normal(0, 10, 400), 2)
+    result = max_drawdown(pnl_frame(pnl))
+    worst, peak, trough, recovery = naive_max_drawdown(list(pnl))
+    assert result['max_drawdown'] == pytest.approx(worst)
+    assert (result['peak_bet'], result['trough_bet'], result['recovery_bet']) == (peak, trough, recovery)
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_seeded_streaks_match_loop(seed):
+    pnl = np.random.default_rng(seed).choice([-1.0, 0.0, 2.0], size=500, p=[0.45, 0.1, 0.45])
+    result = streaks(pnl)
+    assert (result['longest_win'], result['longest_loss'], result['current']) == naive_streaks(pnl)
+
+
+def test_streaks_without_settled_bets():
+    assert streaks([0, 0]) == {'longest_win': 0, 'longest_loss': 0, 'current': 0}
+
+
+def test_risk_summary_on_seeded_ledger():
+    df = synthetic_ledger(2000, seed=11)
+    summary = risk_summary(df)
+    pnl = df['PnL'].to_numpy()
+    stake = df['Stake'].to_numpy()
+    assert summary['max_drawdown'] == pytest.approx(naive_max_drawdown(list(pnl))[0])
+    assert summary['profit_factor'] == pytest.approx(pnl[pnl > 0].sum() / -pnl[pnl < 0].sum())
+    assert summary['yield'] == pytest.approx(np.mean(pnl[stake > 0] / stake[stake > 0]) * 100)
+
+
+def test_profit_factor_without_losses():
+    assert risk_summary(pnl_frame([1, 2]))['profit_factor'] is None
+
+
+@pytest.mark.parametrize('window', [1, 50, 250])
+def test_rolling_returns_match_window_loop(window):
+    df = synthetic_ledger(600, seed=5)
+    rolling = rolling_returns(df, window)
+    pnl, stake = df['PnL'].to_numpy(), df['Stake'].to_numpy()
+
+    assert rolling['ROI'].iloc[:window - 1].isna().all()
+    for end in range(window, len(df) + 1, 37):
+        chunk = slice(end - window, end)
+        assert rolling['ROI'].iloc[end - 1] == pytest.approx(100 * pnl[chunk].sum() / stake[chunk].sum())
+        assert rolling['Yield'].iloc[end - 1] == pytest.approx(100 * np.mean(pnl[chunk] / stake[chunk]))
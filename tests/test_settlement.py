@@ -0,0 +1,111 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence.ingest import load_ledger_csv, parse_ledger
+from sbintelligence.settlement import (
+    MARKETS, add_settlement, classify_markets, market_breakdown, market_codes, settle, win_weights,
+)
+from sbintelligence.synthetic import generate_ledger
+
+from conftest import fixture_path
+
+
+# Cálculo original do "Profit by Market" (iterrows por mercado), usado como referência
+def calculate_market_profit(df, market_type):
+    market_df = df[df['Market'].str.contains(market_type, case=False, na=False)]
+    market_profit = 0
+    for _, bet in market_df.iterrows():
+        if bet['Results'] == 'Green':
+            market_profit += bet['Stake'] * (bet['Odds'] - 1)
+        elif bet['Results'] == 'Green/void':
+            market_profit += bet['Stake'] * (bet['Odds'] - 1) * 0.5
+        elif bet['Results'] == 'Red':
+            market_profit -= bet['Stake']
+        elif bet['Results'] == 'Red/void':
+            market_profit -= bet['Stake'] * 0.5
+    return market_profit
+
+
+def synthetic_ledger(rows, seed):
+    return parse_ledger(generate_ledger(rows, seed=seed), year=2025)
+
+
+@pytest.mark.parametrize('result, expected', [
+    ('Green', 10 * 0.8),
+    ('Green/void', 10 * 0.8 * 0.5),
+    ('Red', -10),
+    ('Red/void', -5),
+    ('Void', 0.0),
+    (None, 0.0),
+    ('Pending', 0.0),
+])
+def test_settle_rules(result, expected):
+    df = pd.DataFrame({'Results': [result], 'Stake': [10.0], 'Odds': [1.8]})
+    assert settle(df).iloc[0] == pytest.approx(expected)
+
+
+def test_settle_without_required_columns_is_zero():
+    df = pd.DataFrame({'Results': ['Green', 'Red'], 'Stake': [10.0, 10.0]}, index=[3, 4])
+    pnl = settle(df)
+    assert pnl.tolist() == [0.0, 0.0]
+    assert pnl.index.tolist() == [3, 4]
+
+
+def test_settle_matches_the_sheet_profit_column():
+    df = load_ledger_csv(fixture_path('Mar2025.csv'), sheet_name='Mar2025')
+    profit = df['Profit'].str.replace('R$', '', regex=False).str.replace(',', '.').astype(float)
+    np.testing.assert_allclose(settle(df).to_numpy(), profit.to_numpy())
+
+
+def test_win_weights_count_void_as_half_bet():
+    wins, valid = win_weights(pd.Series(['Green', 'Green/void', 'Red', 'Red/void', 'Void', None]))
+    assert wins.tolist() == [1.0, 0.5, 0.0, 0.0, 0.0, 0.0]
+    assert valid.tolist() == [1.0, 0.5, 1.0, 0.5, 0.0, 0.0]
+
+
+def test_first_matching_market_wins():
+    markets = pd.Series(['1X2 Home', 'AH Over 2.5', 'Over/Under 2.5', 'under 3.5', 'BTTS', None])
+    assert market_codes(markets).tolist() == [0, 1, 2, 2, -1, -1]
+    assert classify_markets(markets).tolist() == ['1X2', 'AH', 'Under', 'Under', None, None]
+    # A ordem dos mercados define a prioridade
+    assert market_codes(markets, markets=('Over', 'AH')).tolist() == [-1, 0, 0, -1, -1, -1]
+
+
+def test_market_breakdown_counts_each_bet_once():
+    df = pd.DataFrame({
+        'Market': ['AH Over 2.5', 'Over 2.5', 'BTTS'],
+        'Results': ['Green', 'Red', 'Green'],
+        'Stake': [10.0, 10.0, 10.0],
+        'Odds': [2.0, 2.0, 2.0],
+    })
+    breakdown = market_breakdown(df).set_index('Market')
+    assert breakdown.loc['AH', 'Profit'] == 10.0
+    assert breakdown.loc['Over', 'Profit'] == -10.0
+    assert breakdown.loc['Under', 'Stake'] == 0.0
+    assert np.isnan(breakdown.loc['Under', 'ROI'])
+    assert breakdown.loc['AH', 'ROI'] == 100.0
+    assert breakdown['Stake'].sum() == 20.0  # BTTS fica fora dos mercados
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_market_breakdown_matches_iterrows_loop(seed):
+    df = add_settlement(synthetic_ledger(3000, seed))
+    breakdown = market_breakdown(df).set_index('Market')
+    for market in MARKETS:
+        assert breakdown.loc[market, 'Profit'] == pytest.approx(calculate_market_profit(df, market))
+
+
+def test_vectorized_breakdown_is_faster_than_iterrows():
+    df = synthetic_ledger(5000, 0)
+    start = time.perf_counter()
+    for market in MARKETS:
+        calculate_market_profit(df, market)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    market_breakdown(df)
+    vectorized = time.perf_counter() - start
+    assert vectorized * 10 < legacy
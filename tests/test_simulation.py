@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from sbintelligence import simulation
+from sbintelligence.ingest import parse_ledger
+from sbintelligence.settlement import add_settlement
+from sbintelligence.simulation import bet_distribution, monte_carlo, process_pool
+from sbintelligence.synthetic import generate_ledger
+
+
+@pytest.fixture(scope='module')
+def distribution():
+    return bet_distribution(add_settlement(parse_ledger(generate_ledger(500, seed=3), year=2025)))
+
+
+# Bootstrap por laço simples (caminho a caminho, aposta a aposta) com os mesmos sorteios dos lotes
+def naive_bootstrap(distribution, n_paths, n_bets, bankroll, seed, batch_paths):
+    finals, ruined, turnover = [], [], 0.0
+    sizes = [min(batch_paths, n_paths - start) for start in range(0, n_paths, batch_paths)]
+    for batch_seed, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes):
+        picks = np.random.default_rng(batch_seed).integers(0, len(distribution['PnL']), size=(size, n_bets))
+        for path in picks:
+            balance, lowest = 0.0, np.inf
+            for pick in path:
+                balance += distribution['PnL'][pick]
+                turnover += distribution['Stake'][pick]
+                lowest = min(lowest, balance)
+            finals.append(balance)
+            ruined.append(lowest <= -bankroll)
+    finals = np.array(finals)
+    return {
+        'ruin_probability': np.mean(ruined) * 100,
+        'profit_probability': np.mean(finals > 0) * 100,
+        'expected_profit': finals.mean(),
+        'expected_roi': finals.sum() / turnover * 100,
+    }
+
+
+@pytest.mark.parametrize('batch_cells', [simulation.BATCH_CELLS, 7_000])
+def test_bootstrap_matches_naive_loop(distribution, monkeypatch, batch_cells):
+    monkeypatch.setattr(simulation, 'BATCH_CELLS', batch_cells)
+    n_paths, n_bets, bankroll = 300, 120, 200.0
+    result = monte_carlo(distribution, n_paths=n_paths, n_bets=n_bets, bankroll=bankroll, seed=42)
+    expected = naive_bootstrap(distribution, n_paths, n_bets, bankroll, 42, max(1, batch_cells // n_bets))
+    for key, value in expected.items():
+        assert result[key] == pytest.approx(value, rel=1e-9), key
+
+
+def test_bands_are_ordered_and_seeded(distribution):
+    first = monte_carlo(distribution, n_paths=500, n_bets=200, seed=1)
+    second = monte_carlo(distribution, n_paths=500, n_bets=200, seed=1)
+    bands = first['bands']
+    assert bands['Bet'].iloc[0] == 1 and bands['Bet'].iloc[-1] == 200
+    assert (np.diff(bands[['P5', 'P25', 'P50', 'P75', 'P95']].to_numpy(), axis=1) >= 0).all()
+    assert first['bands'].equals(second['bands'])
+    assert first['ruin_probability'] is None
+
+
+def test_parametric_requires_odds(distribution):
+    partial = dict(distribution, Odds=np.where(np.arange(len(distribution['Odds'])) == 0, np.nan,
+                                               distribution['Odds']))
+    with pytest.raises(ValueError):
+        monte_carlo(partial, n_paths=10, n_bets=10, method='Parametric')
+
+
+def test_empty_distribution():
+    empty = {col: np.array([]) for col in ('PnL', 'Odds', 'Stake')}
+    assert monte_carlo(empty) is None
+
+
+@pytest.mark.parametrize('method', ['Bootstrap', 'Parametric'])
+def test_process_pool_matches_in_process(distribution, monkeypatch, method):
+    # Lotes pequenos para que a simulação seja de fato distribuída entre os processos
+    monkeypatch.setattr(simulation, 'BATCH_CELLS', 20_000)
+    kwargs = dict(n_paths=1_000, n_bets=100, bankroll=300.0, method=method, seed=9)
+    local = monte_carlo(distribution, **kwargs)
+
+    executor = process_pool(2)
+    try:
+        pooled = monte_carlo(distribution, executor=executor, **kwargs)
+    finally:
+        executor.shutdown()
+
+    assert pooled['bands'].equals(local['bands'])
+    for key in ('ruin_probability', 'profit_probability', 'expected_profit', 'expected_roi'):
+        assert pooled[key] == local[key], key
+
+
+def test_single_worker_runs_in_process():
+    assert process_pool(None) is None
+    assert process_pool(1) is None
+
+
+def test_broken_pool_falls_back_to_in_process(distribution, monkeypatch):
+    monkeypatch.setattr(simulation, 'BATCH_CELLS', 20_000)
+
+    class BrokenPool:
+        def map(self, fn, iterable):
+            raise simulation.BrokenProcessPool('pool morto')
+
+    kwargs = dict(n_paths=500, n_bets=100, seed=4)
+    assert monte_carlo(distribution, executor=BrokenPool(), **kwargs)['bands'].equals(
+        monte_carlo(distribution, **kwargs)['bands'])
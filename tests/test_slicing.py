@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence.details import PAGE_SIZES, filter_details, format_details, page_count, paginate
+from sbintelligence.ingest import parse_ledger, read_ledger_csv
+from sbintelligence.ledger import day_slice, prepare_tab, sort_by_day
+from sbintelligence.synthetic import generate_ledger
+
+from conftest import fixture_path
+
+
+@pytest.fixture(scope='module')
+def ledger():
+    # Ledger ordenado pelo dia, com apostas sem data no fim (como o ledger canônico do dashboard)
+    df = parse_ledger(generate_ledger(2000, seed=4, months=3), year=2025)
+    undated = df.iloc[:3].assign(Day=pd.NaT)
+    return sort_by_day(pd.concat([df, undated], ignore_index=True))
+
+
+# Recorte de referência por máscara booleana (fim inclusivo, dias inteiros)
+def mask_slice(df, start=None, end=None):
+    mask = df['Day'].notna()
+    if start is not None:
+        mask &= df['Day'] >= pd.Timestamp(start).normalize()
+    if end is not None:
+        mask &= df['Day'] < pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+    return df[mask]
+
+
+def test_sorted_ledger_keeps_undated_rows_last(ledger):
+    assert ledger['Day'].iloc[-3:].isna().all()
+    assert ledger['Day'].iloc[:-3].is_monotonic_increasing
+
+
+def test_day_slice_matches_boolean_mask_on_boundaries(ledger):
+    days = ledger['Day'].dropna()
+    first, last = days.min(), days.max()
+    bounds = [
+        (None, None),
+        (first, last),
+        (first, None),
+        (None, last),
+        (first - pd.Timedelta(days=30), last + pd.Timedelta(days=30)),  # Além dos extremos
+        (last + pd.Timedelta(days=1), None),  # Depois da última aposta: vazio
+        (None, first - pd.Timedelta(days=1)),  # Antes da primeira aposta: vazio
+        (last, first),  # Início depois do fim: vazio
+        (days.iloc[500] + pd.Timedelta(hours=15), days.iloc[900] + pd.Timedelta(hours=1)),  # Horários no dia
+        (days.iloc[500], days.iloc[500]),  # Um único dia
+    ]
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        a, b = sorted(rng.choice(days.to_numpy(), 2))
+        bounds.append((pd.Timestamp(a), pd.Timestamp(b)))
+
+    for start, end in bounds:
+        pd.testing.assert_frame_equal(day_slice(ledger, start, end), mask_slice(ledger, start, end))
+
+
+def test_day_slice_without_bounds_drops_only_undated_rows(ledger):
+    assert len(day_slice(ledger)) == len(ledger) - 3
+
+
+def test_day_slice_of_everything_returns_same_frame():
+    df = prepare_tab(read_ledger_csv(fixture_path('Mar2025.csv')), 'Mar2025')
+    assert day_slice(df, '2025-03-01', '2025-03-31') is df
+    assert day_slice(df.iloc[:0]).empty
+
+
+def test_day_slice_empty_result(ledger):
+    empty = day_slice(ledger, '2030-01-01', '2030-01-31')
+    assert empty.empty
+    assert list(empty.columns) == list(ledger.columns)
+
+
+@pytest.mark.parametrize('n_rows, page_size, pages', [
+    (0, 25, 1), (1, 25, 1), (25, 25, 1), (26, 25, 2), (250, 100, 3),
+])
+def test_page_count(n_rows, page_size, pages):
+    assert page_count(n_rows, page_size) == pages
+
+
+def test_paginate_bounds():
+    table = pd.DataFrame({'ID': range(1, 61)})
+    assert paginate(table, 1, 25)['ID'].tolist() == list(range(1, 26))
+    assert paginate(table, 3, 25)['ID'].tolist() == list(range(51, 61))  # Última página parcial
+    assert paginate(table, 0, 25)['ID'].tolist() == list(range(1, 26))  # Abaixo do intervalo
+    assert paginate(table, 99, 25)['ID'].tolist() == list(range(51, 61))  # Acima do intervalo
+    assert paginate(table.iloc[:0], 2, 25).empty
+
+
+@pytest.mark.parametrize('page_size', PAGE_SIZES)
+def test_pages_cover_table_once(ledger, page_size):
+    table = filter_details(format_details(ledger), results=['Green', 'Red'])
+    pages = [paginate(table, page, page_size) for page in range(1, page_count(len(table), page_size) + 1)]
+    assert all(len(page) <= page_size for page in pages)
+    pd.testing.assert_frame_equal(pd.concat(pages), table)
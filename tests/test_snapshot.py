@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+import pyarrow as pa  # noqa: E402
+import pyarrow.feather as feather  # noqa: E402
+
+from sbintelligence.snapshot import SnapshotStore, is_closed_month, month_close  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path))
+
+
+@pytest.fixture
+def ledger():
+    return pd.DataFrame({
+        'Day': pd.to_datetime(['2025-02-01', '2025-02-03']),
+        'Market': pd.Categorical(['AH -0.5', 'Over 2.5']),
+        'Stake': pd.Series([10.0, 20.0], dtype='float32'),
+    })
+
+
+def test_round_trip_keeps_data_and_fetched_at(store, ledger):
+    fetched_at = datetime(2025, 3, 1, 8, 30, 15)
+    store.save('sheet', 'Feb2025', ledger, fetched_at=fetched_at)
+    df, loaded_at = store.load('sheet', 'Feb2025')
+    pd.testing.assert_frame_equal(df, ledger)
+    assert loaded_at == fetched_at
+
+
+def test_missing_snapshot(store):
+    assert store.load('sheet', 'Feb2025') is None
+
+
+def test_schema_version_mismatch_is_ignored(store, ledger):
+    path = store.save('sheet', 'Feb2025', ledger)
+    table = feather.read_table(path)
+    metadata = dict(table.schema.metadata)
+    metadata[b'sbi.schema_version'] = b'0'
+    feather.write_feather(table.replace_schema_metadata(metadata), path)
+    assert store.load('sheet', 'Feb2025') is None
+
+
+def test_unreadable_snapshot_is_ignored(store, ledger):
+    path = store.save('sheet', 'Feb2025', ledger)
+    with open(path, 'wb') as f:
+        f.write(b'not arrow')
+    assert store.load('sheet', 'Feb2025') is None
+
+
+def test_table_without_metadata_is_ignored(store, ledger):
+    path = store.path('sheet', 'Feb2025')
+    store.save('sheet', 'Feb2025', ledger)
+    feather.write_feather(pa.Table.from_pandas(ledger, preserve_index=False).replace_schema_metadata({}), path)
+    assert store.load('sheet', 'Feb2025') is None
+
+
+@pytest.mark.parametrize('fetched_at, accepted', [
+    (datetime(2025, 2, 28, 23, 59), False),  # Antes do fim do mês: pode estar incompleto
+    (datetime(2025, 3, 1, 0, 0), True),
+    (datetime(2025, 4, 10), True),
+])
+def test_fetched_after_closed_month(store, ledger, fetched_at, accepted):
+    store.save('sheet', 'Feb2025', ledger, fetched_at=fetched_at)
+    snapshot = store.load('sheet', 'Feb2025', fetched_after=month_close(datetime(2025, 2, 1)))
+    assert (snapshot is not None) == accepted
+
+
+def test_month_close_and_closed_month():
+    assert month_close(datetime(2025, 2, 14, 10)) == pd.Timestamp('2025-03-01')
+    assert month_close(datetime(2024, 12, 1)) == pd.Timestamp('2025-01-01')
+    assert is_closed_month(datetime(2025, 2, 1), now=datetime(2025, 3, 1))
+    assert not is_closed_month(datetime(2025, 2, 1), now=datetime(2025, 2, 28, 23, 59))
+
+
+def test_delete_and_clear(store, ledger):
+    store.save('sheet', 'Feb2025', ledger)
+    store.save('sheet', 'Mar2025', ledger)
+    store.save('other', 'Feb2025', ledger)
+    store.delete('sheet', 'Feb2025')
+    store.delete('sheet', 'Feb2025')  # Sem snapshot: nada a fazer
+    assert store.load('sheet', 'Feb2025') is None
+    assert store.load('sheet', 'Mar2025') is not None
+    store.clear()
+    assert store.load('sheet', 'Mar2025') is None and store.load('other', 'Feb2025') is None
+
+
+def test_tab_names_are_sanitized(store, ledger):
+    path = store.save('sheet', 'Feb/2025 ../x', ledger)
+    assert path.startswith(store.root)
+    assert store.load('sheet', 'Feb/2025 ../x') is not None
+
+
+def test_fetched_tab_is_saved_with_the_current_time(store, ledger):
+    before = datetime.now()
+    assert store.save_fetched('sheet', 'Feb2025', ledger) is not None
+    df, fetched_at = store.load('sheet', 'Feb2025')
+    pd.testing.assert_frame_equal(df, ledger)
+    assert fetched_at >= before
+
+
+def test_stale_copy_does_not_pin_a_closed_month(store, ledger):
+    # Snapshot feito durante o mês; depois do fechamento a planilha falha e a cópia antiga é servida
+    store.save('sheet', 'Feb2025', ledger, fetched_at=datetime(2025, 2, 20))
+    stale = ledger.assign(Stake=ledger['Stake'] * 2)
+    assert store.save_fetched('sheet', 'Feb2025', stale, stale_since=datetime(2025, 2, 20).timestamp()) is None
+
+    df, fetched_at = store.load('sheet', 'Feb2025')
+    pd.testing.assert_frame_equal(df, ledger)
+    assert fetched_at == datetime(2025, 2, 20)
+    # O mês continua sem snapshot válido: a próxima carga volta a buscar a planilha
+    assert store.load('sheet', 'Feb2025', fetched_after=month_close(datetime(2025, 2, 1))) is None
+
+
+def test_save_failure_is_ignored(tmp_path, ledger):
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    assert SnapshotStore(str(blocker)).save_fetched('sheet', 'Feb2025', ledger) is None
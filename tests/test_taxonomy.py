@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sbintelligence import taxonomy
+from sbintelligence.compact import compact_ledger
+from sbintelligence.ingest import parse_ledger
+from sbintelligence.ledger import day_slice, sort_by_day, stamp_version
+from sbintelligence.settlement import add_settlement
+from sbintelligence.synthetic import generate_ledger
+from sbintelligence.taxonomy import (
+    ODDS_LABELS, dimension_values, grouped_breakdown, market_taxonomy, parse_market,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_parse_cache():
+    taxonomy._parsed.clear()
+    yield
+    taxonomy._parsed.clear()
+
+
+@pytest.fixture
+def ledger():
+    df = add_settlement(parse_ledger(generate_ledger(2000, seed=4), year=2025))
+    return stamp_version(sort_by_day(compact_ledger(df)), 'Tab')
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+
+    def counting_parse(text, markets):
+        calls.append(text)
+        return parse_market(text, markets)
+
+    monkeypatch.setattr(taxonomy, 'parse_market', counting_parse)
+    return calls
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('AH -0.5', ('AH', -0.5, 'Favourite', None)),
+    ('AH +1', ('AH', 1.0, 'Underdog', None)),
+    ('Over 2,5 Corners', ('Over', 2.5, 'Over', 'Corners')),
+    ('1X2 Home', ('1X2', None, 'Home', None)),
+    ('BTTS Yes', ('BTTS', None, 'Yes', None)),
+    ('', ('Other', None, None, None)),
+])
+def test_parse_market(text, expected):
+    assert parse_market(text) == expected
+
+
+def test_markets_are_parsed_once_per_ledger_version(ledger, parse_calls):
+    distinct = ledger['Market'].nunique()
+    first = market_taxonomy(ledger['Market'], version='v1')
+    assert len(parse_calls) == distinct
+
+    # Outros recortes da mesma versão não analisam os textos de novo
+    start = ledger['Day'].iloc[len(ledger) // 2]
+    part = ledger[ledger['Day'] >= start]
+    sliced = market_taxonomy(part['Market'], version='v1')
+    assert len(parse_calls) == distinct
+    pd.testing.assert_frame_equal(sliced.astype(object), first.loc[part.index].astype(object))
+
+    market_taxonomy(ledger['Market'], version='v2')
+    assert len(parse_calls) == 2 * distinct
+
+
+def test_unversioned_markets_are_not_cached(ledger, parse_calls):
+    market_taxonomy(ledger['Market'])
+    market_taxonomy(ledger['Market'])
+    assert len(parse_calls) == 2 * ledger['Market'].nunique()
+
+
+def test_slices_keep_the_ledger_version(ledger, parse_calls):
+    first_day, last_day = ledger['Day'].min(), ledger['Day'].max()
+    middle = first_day + (last_day - first_day) / 2
+    for start, end in ((first_day, middle), (middle, last_day)):
+        dimension_values(day_slice(ledger, start, end), 'Market family')
+    assert len(parse_calls) == ledger['Market'].nunique()
+
+
+def test_cached_versions_are_bounded(ledger, monkeypatch):
+    monkeypatch.setattr(taxonomy, 'PARSED_VERSIONS', 2)
+    for version in ('a', 'b', 'c'):
+        market_taxonomy(ledger['Market'], version=version)
+    assert [key[0] for key in taxonomy._parsed][-2:] == ['b', 'c']
+    assert len(taxonomy._parsed) == 2
+
+
+def test_market_family_includes_families_outside_markets(ledger):
+    families = set(dimension_values(ledger, 'Market family').dropna())
+    assert {'AH', 'Over', 'Under', '1X2'} <= families
+    grouped = grouped_breakdown(ledger, 'Market family')
+    assert grouped['Bets'].sum() == len(ledger)
+    assert grouped['Profit'].sum() == pytest.approx(ledger['PnL'].sum())
+
+
+def test_odds_bucket_keeps_category_order():
+    df = pd.DataFrame({'Odds': [1.2, 7.5, 2.0, np.nan], 'Stake': 10.0, 'PnL': [1.0, -10.0, 10.0, 0.0],
+                       'Results': ['Green', 'Red', 'Green', None]})
+    grouped = grouped_breakdown(df, 'Odds bucket')
+    assert list(grouped['Odds bucket']) == ['< 1.50', '2.00–2.49', '5.00+']
+    assert list(dimension_values(df, 'Odds bucket').cat.categories) == ODDS_LABELS
@@ -0,0 +1,124 @@
+import pytest
+
+requests = pytest.importorskip('requests')
+
+from sbintelligence.transport import SheetTransport  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.reason = 'reason'
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} {self.reason}', response=self)
+
+
+# Sessão falsa: cada URL responde a próxima resposta (ou exceção) da sua fila
+class FakeSession:
+    def __init__(self):
+        self.queues = {}
+        self.calls = []
+
+    def reply(self, url, *responses):
+        self.queues.setdefault(url, []).extend(responses)
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, dict(headers or {})))
+        response = self.queues[url].pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def close(self):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def transport(session, clock):
+    return SheetTransport(retries=2, session=session, sleep=lambda seconds: None, clock=clock)
+
+
+def test_fetch_stores_copy_and_revalidates(transport, session, clock):
+    session.reply('a', FakeResponse(200, b'v1', {'ETag': '"1"'}), FakeResponse(304))
+    assert transport.fetch('a').content == b'v1'
+    clock.now += 10
+    result = transport.fetch('a')
+    assert result.not_modified and result.content == b'v1' and not result.stale
+    assert session.calls[-1][1]['If-None-Match'] == '"1"'
+
+
+@pytest.mark.parametrize('failure', [
+    FakeResponse(404),
+    FakeResponse(403),
+    FakeResponse(503),
+    requests.ConnectionError('down'),
+])
+def test_any_failure_falls_back_to_last_copy(transport, session, clock, failure):
+    session.reply('a', FakeResponse(200, b'v1'), *[failure] * 3)
+    transport.fetch('a')
+    fetched_at = clock.now
+    clock.now += 60
+
+    result = transport.fetch('a', key='tab')
+    assert result.stale and result.content == b'v1'
+    assert transport.stale_since('tab') == fetched_at
+    assert transport.stats()['fallbacks'] == 1
+
+
+def test_client_error_is_not_retried(transport, session):
+    session.reply('a', FakeResponse(200, b'v1'), FakeResponse(404))
+    transport.fetch('a')
+    transport.fetch('a')
+    assert len(session.calls) == 2
+    assert transport.stats()['retries'] == 0
+
+
+def test_failure_without_copy_raises(transport, session):
+    session.reply('a', FakeResponse(404))
+    with pytest.raises(requests.HTTPError):
+        transport.fetch('a')
+
+    session.reply('b', *[FakeResponse(503)] * 3)
+    with pytest.raises(requests.HTTPError):
+        transport.fetch('b')
+    assert len(session.calls) == 4  # 1 (404) + 3 tentativas (503)
+
+
+def test_staleness_is_tracked_per_tab_across_urls(transport, session, clock):
+    # Duas URLs da mesma aba (carga completa e busca incremental)
+    session.reply('full', FakeResponse(200, b'v1'), requests.Timeout('slow'), requests.Timeout('slow'),
+                  requests.Timeout('slow'))
+    session.reply('offset', FakeResponse(200, b'v2'))
+    transport.fetch('full', key='tab')
+    fetched_at = clock.now
+    clock.now += 30
+
+    transport.fetch('full', key='tab')
+    assert transport.stale_since('tab') == fetched_at
+    assert transport.stale_since('full') is None
+
+    # Qualquer busca bem-sucedida da aba encerra o aviso
+    transport.fetch('offset', key='tab')
+    assert transport.stale_since('tab') is None